@@ -0,0 +1,111 @@
+# This file is part of URC Assessment Method.
+#
+# URC Assessment Method is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# URC Assessment Method is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with URC Assessment Method. If not, see
+# <https://www.gnu.org/licenses/>.
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import reduce
+import pytest
+
+from urclib.fuzzylogic.fuzzylogic import *
+
+
+def _impl(clip, minval=0., maxval=10., name='high'):
+    # clip lists are modified by FuzzyImplication, so each implication gets its own.
+    return FuzzyImplication(minval, maxval, [LinearCurve(name)], [clip])
+
+
+def _pairwise(impls):
+    return reduce(FuzzyImplication.combine, impls)
+
+
+def _assert_same(lhs, rhs):
+    assert lhs._minVal == rhs._minVal
+    assert lhs._maxVal == rhs._maxVal
+    assert lhs._hasNDClip == rhs._hasNDClip
+    assert lhs._curves == rhs._curves
+    assert lhs._yClips == rhs._yClips
+    if not lhs._hasNDClip:
+        for x in (0., 2.5, 5., 7.5, 10.):
+            assert lhs(x) == rhs(x)
+
+
+@pytest.fixture
+def logic_set():
+    fls = FuzzyLogicSet()
+    inp = FuzzyInput('a', 0, 10)
+    inp.add_curve(LinearCurve('high'))
+    inp.add_curve(TriangleCurve('mid'))
+    res = FuzzyResult('r', 0, 1)
+    res.add_curve(LinearCurve('high'))
+    res.add_curve(TriangleCurve('mid'))
+    fls.inputs = [inp]
+    fls.result = res
+    fls.import_rules(['IF a IS high THEN r IS high',
+                      'IF a IS mid THEN r IS mid',
+                      'IF a IS NOT mid THEN r IS high'])
+    return fls
+
+
+class TestCombineMany(object):
+
+    def test_empty(self):
+        with pytest.raises(FuzzyError):
+            FuzzyImplication.combine_many([])
+
+    def test_single(self):
+        impl = _impl(0.5)
+        assert FuzzyImplication.combine_many([impl]) is impl
+
+    def test_matches_pairwise(self):
+        impls = [_impl(0.25), _impl(0.5, name='mid'), _impl(0.75)]
+        _assert_same(FuzzyImplication.combine_many(impls), _pairwise(impls))
+
+    def test_range_mismatch(self):
+        with pytest.raises(FuzzyError):
+            FuzzyImplication.combine_many([_impl(0.5), _impl(0.5, maxval=5.)])
+
+    @pytest.mark.parametrize('ndmask', [(True, False, False),
+                                        (False, True, False),
+                                        (False, False, True),
+                                        (True, False, True),
+                                        (True, True, False)])
+    def test_nd_clip_matches_pairwise(self, ndmask):
+        impls = [_impl(NoDataSentinel(False) if nd else 0.25 * (i + 1)) for i, nd in enumerate(ndmask)]
+        _assert_same(FuzzyImplication.combine_many(impls), _pairwise(impls))
+
+    def test_all_nd_forwards_last(self):
+        impls = [_impl(NoDataSentinel(False)), _impl(NoDataSentinel(True))]
+        combined = FuzzyImplication.combine_many(impls)
+        assert combined is impls[-1]
+        assert combined is _pairwise(impls)
+
+    def test_nd_substitution_is_not_clipped(self):
+        impls = [_impl(NoDataSentinel(False, 0.4)), _impl(0.8)]
+        combined = FuzzyImplication.combine_many(impls)
+        assert not combined._hasNDClip
+        _assert_same(combined, _pairwise(impls))
+
+
+class TestEvaluateRules(object):
+
+    @pytest.mark.parametrize('executor_type', [ThreadPoolExecutor, ProcessPoolExecutor])
+    def test_executor_matches_sequential(self, logic_set, executor_type):
+        expected = logic_set.evaluate_rules({'a': 3.})
+        with executor_type(max_workers=2) as executor:
+            result = logic_set.evaluate_rules({'a': 3.}, executor)
+
+        assert result._yClips == expected._yClips
+        assert result.centroid() == pytest.approx(expected.centroid())
+
+    def test_no_rules(self):
+        with pytest.raises(FuzzyError):
+            FuzzyLogicSet().evaluate_rules({})
@@ -0,0 +1,257 @@
+# This file is part of URC Assessment Method.
+#
+# URC Assessment Method is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# URC Assessment Method is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with URC Assessment Method. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+
+pytest.importorskip('OpenGL')
+pytest.importorskip('glm')
+
+from urclib.ui_qt.visualizer import geometryglscene
+from urclib.ui_qt.visualizer._support import LayerRecord, PointLayerRecord, PolyLayerRecord
+from urclib.ui_qt.visualizer.geometryglscene import GeometryGLScene
+
+
+@pytest.fixture
+def scene():
+    scene = GeometryGLScene()
+    for i in range(1, 6):
+        scene._registerLayer(LayerRecord(i))
+    return scene
+
+
+def _stackIds(scene):
+    return [rec.id for rec in scene._drawStack]
+
+
+def _assertPositionsCurrent(scene):
+    for i, rec in enumerate(scene._drawStack):
+        assert scene._drawStackIndex(rec) == i
+
+
+class _FakeSync(object):
+    """Stands in for the sync object entry points, tracking which fences are live."""
+
+    def __init__(self):
+        self.nextFence = 1
+        self.live = set()
+        self.waits = []
+        self.status = geometryglscene.GL_ALREADY_SIGNALED
+
+    def glFenceSync(self, condition, flags):
+        fence = self.nextFence
+        self.nextFence += 1
+        self.live.add(fence)
+        return fence
+
+    def glDeleteSync(self, fence):
+        assert fence in self.live, 'fence {} deleted twice'.format(fence)
+        self.live.remove(fence)
+
+    def glClientWaitSync(self, fence, flags, timeout):
+        assert fence in self.live
+        self.waits.append((fence, timeout))
+        return self.status
+
+
+@pytest.fixture
+def gl_sync(monkeypatch):
+    fake = _FakeSync()
+    for name in ('glFenceSync', 'glDeleteSync', 'glClientWaitSync'):
+        monkeypatch.setattr(geometryglscene, name, getattr(fake, name))
+    return fake
+
+
+class TestFrameFence(object):
+
+    def test_no_frame_painted(self, scene, gl_sync):
+        assert scene.waitFrame()
+        assert gl_sync.waits == []
+
+    def test_fence_replaced_each_frame(self, scene, gl_sync):
+        scene._fenceFrame()
+        first = scene._lastFence
+        scene._fenceFrame()
+
+        assert scene._lastFence != first
+        assert gl_sync.live == {scene._lastFence}
+
+    def test_wait_on_latest_frame(self, scene, gl_sync):
+        scene._fenceFrame()
+        scene._fenceFrame()
+
+        assert scene.waitFrame(timeout=5e6)
+        assert gl_sync.waits == [(scene._lastFence, 5000000)]
+
+    @pytest.mark.parametrize('status, expected', [('GL_CONDITION_SATISFIED', True),
+                                                  ('GL_TIMEOUT_EXPIRED', False),
+                                                  ('GL_WAIT_FAILED', False)])
+    def test_wait_result(self, scene, gl_sync, status, expected):
+        scene._fenceFrame()
+        gl_sync.status = getattr(geometryglscene, status)
+
+        assert scene.waitFrame() is expected
+
+
+def _refPointDrawSizes(rec, vals):
+    # mirrors the point size computed by the refPoint vertex shader.
+    vals = np.asarray(vals, dtype=np.float64)
+    if rec.clampColorToRange:
+        vals = (vals - rec.lowVal) / (rec.highVal - rec.lowVal)
+    return rec.scaleMinSize + (rec.scaleMaxSize - rec.scaleMinSize) * vals
+
+
+class TestRefPointPickSizes(object):
+
+    @pytest.mark.parametrize('clamp', [False, True])
+    @pytest.mark.parametrize('valRange', [(0., 1.), (-4., 12.), (100., 350.)])
+    def test_pick_matches_draw(self, clamp, valRange):
+        rec = PointLayerRecord(1, count=5, value_gradient=None, scale_by_value=True, scale_min_size=2.,
+                               scale_max_size=9., clamp_colors=clamp, value_filter_range=valRange)
+        vals = np.linspace(valRange[0] - 1., valRange[1] + 1., 7)
+        scale, offset = GeometryGLScene._refPointSizeXform(rec)
+
+        np.testing.assert_allclose(vals * scale + offset, _refPointDrawSizes(rec, vals))
+
+
+class TestDrawDispatch(object):
+
+    def test_reference_resolves_to_source_type(self, scene):
+        src = PolyLayerRecord(GeometryGLScene.getNextId(), polygroups=[[(0, 4)]], exts=[0., 1., 0., 1.])
+        scene._registerLayer(src)
+        ref = scene._layers[scene.AddReferenceLayer(src.id)]
+
+        assert scene._resolveDrawRecord(src) == scene._drawPolyLayer
+        assert scene._resolveDrawRecord(ref) == scene._drawPolyLayer
+
+    def test_undrawable_type(self, scene):
+        assert scene._resolveDrawRecord(LayerRecord(99)) is None
+        scene._rebuildDrawOrder()
+        assert [fn for _, fn in scene._drawOrder] == [None] * 5
+
+
+class TestCulling(object):
+
+    def test_unknown_extents_are_drawn(self):
+        assert GeometryGLScene._extsInView(None, (0., 1., 0., 1.))
+
+    @pytest.mark.parametrize('exts, expected', [([0.2, 0.4, 0.2, 0.4], True),
+                                                ([-1., 0.1, 0.5, 2.], True),
+                                                ([1.5, 2., 0., 1.], False),
+                                                ([0., 1., -3., -2.], False)])
+    def test_overlap(self, exts, expected):
+        assert GeometryGLScene._extsInView(exts, (0., 1., 0., 1.)) is expected
+
+    def test_reference_follows_moved_source(self, scene):
+        src = PolyLayerRecord(GeometryGLScene.getNextId(), polygroups=[[(0, 4)]], exts=[0., 1., 0., 1.])
+        scene._registerLayer(src)
+        ref = scene._layers[scene.AddReferenceLayer(src.id)]
+        assert GeometryGLScene._extsInView(ref.exts, (-.5, 1.5, -.5, 1.5))
+
+        # moving the source geometry replaces its extents, as UpdateLayerVertices() and ReprojectLayer() do.
+        src.exts = [10., 11., 10., 11.]
+
+        assert ref.exts == src.exts
+        assert GeometryGLScene._extsInView(ref.exts, (9.5, 11.5, 9.5, 11.5))
+        assert not GeometryGLScene._extsInView(ref.exts, (-.5, 1.5, -.5, 1.5))
+
+
+class TestUpdateLayerVertices(object):
+
+    @pytest.mark.parametrize('volatile', [False, True])
+    def test_host_copy_only_for_volatile(self, scene, monkeypatch, volatile):
+        monkeypatch.setattr(scene, '_bufferSubData', lambda buff, offset, data: None)
+        rec = PointLayerRecord(GeometryGLScene.getNextId(), count=2, exts=[0., 1., 0., 1.], volatile=volatile)
+        scene._registerLayer(rec)
+        scene.UpdateLayerVertices(rec.id, [[4., 5.], [6., 8.]])
+
+        assert rec.exts == [4., 6., 5., 8.]
+        if volatile:
+            np.testing.assert_array_equal(rec.cpuVerts, [[4., 5.], [6., 8.]])
+        else:
+            assert rec.cpuVerts is None
+
+
+class TestRecordIdColors(object):
+
+    @pytest.mark.parametrize('recId', [0, 7, 0x1234, 0xFFFF])
+    def test_matches_scalar(self, scene, recId):
+        count = 300
+        colors = GeometryGLScene._getRecordIdColors(recId, count)
+
+        assert colors.shape == (count, 4)
+        assert colors.dtype == np.float32
+        expected = np.array([tuple(scene._getRecordIdColor(recId, i)) for i in range(count)], dtype=np.float32)
+        np.testing.assert_array_equal(colors, expected)
+
+    def test_empty(self):
+        assert GeometryGLScene._getRecordIdColors(3, 0).shape == (0, 4)
+
+
+class TestDrawStackPositions(object):
+
+    def test_index_matches_stack(self, scene):
+        _assertPositionsCurrent(scene)
+        assert scene.getDrawStackPosition(4) == 3
+
+    def test_missing_record(self, scene):
+        with pytest.raises(ValueError):
+            scene._drawStackIndex(LayerRecord(99))
+
+    def test_register_after_lookup(self, scene):
+        scene._drawStackIndex(scene._drawStack[0])
+        scene._registerLayer(LayerRecord(6))
+
+        assert scene.getDrawStackPosition(6) == 5
+        _assertPositionsCurrent(scene)
+
+    def test_swap_keeps_table_current(self, scene):
+        scene._drawStackIndex(scene._drawStack[0])
+        scene._swapDrawStack(1, 2)
+
+        assert _stackIds(scene) == [1, 3, 2, 4, 5]
+        _assertPositionsCurrent(scene)
+        assert scene._drawOrder is None
+
+    def test_move_up_and_down(self, scene):
+        scene.moveUpStack(3)
+        scene.moveDownStack(1)
+
+        assert _stackIds(scene) == [3, 1, 2, 4, 5]
+        _assertPositionsCurrent(scene)
+
+    def test_move_past_ends_is_noop(self, scene):
+        scene.moveUpStack(1)
+        scene.moveDownStack(5)
+
+        assert _stackIds(scene) == [1, 2, 3, 4, 5]
+        _assertPositionsCurrent(scene)
+
+    def test_move_to_ends(self, scene):
+        scene.moveTopStack(4)
+        assert _stackIds(scene) == [4, 1, 2, 3, 5]
+        _assertPositionsCurrent(scene)
+
+        scene.moveBottomStack(1)
+        assert _stackIds(scene) == [4, 2, 3, 5, 1]
+        _assertPositionsCurrent(scene)
+
+        scene.moveUpStack(1)
+        assert _stackIds(scene) == [4, 2, 3, 1, 5]
+        _assertPositionsCurrent(scene)
+
+    def test_set_position(self, scene):
+        scene.setDrawStackPosition(1, 3)
+
+        assert _stackIds(scene) == [2, 3, 1, 4, 5]
+        _assertPositionsCurrent(scene)
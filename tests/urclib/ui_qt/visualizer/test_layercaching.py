@@ -0,0 +1,234 @@
+# This file is part of URC Assessment Method.
+#
+# URC Assessment Method is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# URC Assessment Method is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with URC Assessment Method. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+
+pytest.importorskip('OpenGL')
+glm = pytest.importorskip('glm')
+
+from urclib.ui_qt.visualizer._support import *
+from urclib.ui_qt.visualizer.geometryglscene import GeometryGLScene
+from urclib.ui_qt.visualizer.LayerCaching import *
+
+
+class _CacheScene(object):
+    """Stands in for GeometryGLScene where the layer caches call into it, keeping vertex and pixel data on the host."""
+
+    TEXHEAD_DT = GeometryGLScene.TEXHEAD_DT
+
+    def __init__(self, layers=()):
+        self._initialized = False
+        self._layers = {rec.id: rec for rec in layers}
+        self._nextId = 1000
+        # (record, payload) pairs, in the order the caches loaded them.
+        self.loaded = []
+
+    @property
+    def layerCount(self):
+        return len(self._layers)
+
+    def layerIter(self):
+        return iter(self._layers.values())
+
+    def getNextId(self):
+        self._nextId += 1
+        return self._nextId
+
+    def GetLayer(self, id):
+        return self._layers[id]
+
+    def dumpVertsToStream(self, rec, strm):
+        strm.write(np.asarray(rec.cpuVerts, dtype=np.float32).tobytes())
+
+    def dumpTexToStream(self, rec, strm):
+        pixels = np.asarray(rec.pixels, dtype=np.float32)
+        height, width, channels = pixels.shape
+        strm.write(np.array([(width, height, channels, pixels.size)], dtype=self.TEXHEAD_DT).tobytes())
+        strm.write(pixels.tobytes())
+
+    def loadTexFromStream(self, strm, skip=False):
+        return GeometryGLScene.loadTexFromStream(self, strm, skip)
+
+    def _register(self, rec, payload):
+        self._layers[rec.id] = rec
+        self.loaded.append((rec, payload))
+
+    def _loadPolyLayer(self, rec, ext, verts):
+        self._register(rec, verts)
+
+    def _loadPointLayer(self, rec, ext, verts, attribVals=None):
+        self._register(rec, verts)
+
+    def _loadLineLayer(self, rec, ext, verts, refVals=None):
+        self._register(rec, verts)
+
+    def _loadRasterLayer(self, pxlData, channels, rec, internal=None, gradObj=None):
+        self._register(rec, np.array(pxlData))
+
+
+def _verts(count, seed):
+    return np.arange(count * 2, dtype=np.float32).reshape(count, 2) + seed
+
+
+def _polyLayer(id):
+    rec = PolyLayerRecord(id, polygroups=[[(0, 4)], [(4, 3), (7, 5)]])
+    rec.count = len(rec.groups)
+    rec.exts = [0., 10., 0., 10.]
+    rec.geomColors = [glm.vec4(1., 0., 0., 1.), glm.vec4(0., 1., 0., 1.)]
+    rec.cpuVerts = _verts(rec.vertCount, id)
+    return rec
+
+
+def _pointLayer(id):
+    rec = PointLayerRecord(id, count=6, indexed_colors=[IndexedColor(glm.vec4(0., 0., 1., 1.), [0, 2]),
+                                                        IndexedColor(glm.vec4(1., 1., 0., 1.), [1, 3, 5])],
+                           indexed_glyphs=[IndexedGlyph('s', [0, 1]), IndexedGlyph('x', [4])],
+                           indexed_scales=[IndexedScale(3., [2, 3, 5])])
+    rec.exts = [-1., 1., -1., 1.]
+    rec.cpuVerts = _verts(rec.vertCount, id)
+    return rec
+
+
+def _lineLayer(id):
+    rec = LineLayerRecord(id, linegroups=[(0, 3), (3, 2), (5, 4)])
+    rec.count = len(rec.groups)
+    rec.exts = [0., 5., 0., 5.]
+    rec.geomColors = [glm.vec4(.5, .5, .5, 1.)]
+    rec.cpuVerts = _verts(rec.vertCount, id)
+    return rec
+
+
+def _rasterLayer(id):
+    rec = RasterLayerRecord(id)
+    rec.exts = [0., 1., 0., 1.]
+    rec.pixels = np.random.default_rng(id).random((3, 5, 4), dtype=np.float32)
+    return rec
+
+
+@pytest.fixture
+def cached_layers(tmp_path):
+    layers = [_polyLayer(1), _pointLayer(2), _lineLayer(3), _rasterLayer(4),
+              _pointLayer(5), _rasterLayer(6), _lineLayer(7), _polyLayer(8)]
+    path = str(tmp_path / 'layers.cache')
+    LayerStackCache(_CacheScene(layers)).saveLayersToFile(path)
+    return path, {rec.id: rec for rec in layers}
+
+
+def _groupList(groups):
+    # polygon groups are lists of (start, count) rings; line groups are single (start, count) records.
+    return [[tuple(r) for r in g] if isinstance(g, list) else tuple(g) for g in groups]
+
+
+def _expectedPayload(rec):
+    return rec.pixels if isinstance(rec, RasterLayerRecord) else rec.cpuVerts
+
+
+class TestSkipRoundTrip(object):
+
+    def test_read_all(self, cached_layers):
+        path, written = cached_layers
+        scene = _CacheScene()
+        LayerStackCache(scene).openLayersFromFile(path)
+
+        assert len(scene.loaded) == len(written)
+        for (rec, payload), src in zip(scene.loaded, written.values()):
+            assert type(rec) is type(src)
+            np.testing.assert_array_equal(payload.reshape(_expectedPayload(src).shape), _expectedPayload(src))
+
+    @pytest.mark.parametrize('keep', [(2,), (4,), (5, 8), (1, 3, 6), (7,), (8,)])
+    def test_skipped_layers_leave_later_ones_intact(self, cached_layers, keep):
+        path, written = cached_layers
+        scene = _CacheScene()
+        cache = LayerStackCache(scene)
+        cache.openLayersFromFile(path, filter=keep)
+
+        assert len(scene.loaded) == len(keep)
+        for (rec, payload), oldId in zip(scene.loaded, keep):
+            src = written[oldId]
+            assert cache.idForKey(oldId) == rec.id
+            assert type(rec) is type(src)
+            assert rec.exts == pytest.approx(src.exts)
+            np.testing.assert_array_equal(payload.reshape(_expectedPayload(src).shape), _expectedPayload(src))
+            if isinstance(src, PointLayerRecord):
+                assert [g.inds for g in rec.indexedGlyphs] == [g.inds for g in src.indexedGlyphs]
+                assert [s.scale for s in rec.indexedScales] == [s.scale for s in src.indexedScales]
+            if isinstance(src, (PolyLayerRecord, LineLayerRecord)):
+                assert _groupList(rec.groups) == _groupList(src.groups)
+
+
+class TestEntrySkips(object):
+
+    @pytest.fixture(autouse=True)
+    def _stream_path(self, tmp_path):
+        # the caches read through np.fromfile(), which needs a real file rather than an in-memory stream.
+        self.path = str(tmp_path / 'entries.cache')
+
+    def _roundTrip(self, entries, keep):
+        with open(self.path, 'wb') as strm:
+            for cache in entries:
+                cache.writeToStream(strm)
+        read = []
+        with open(self.path, 'rb') as strm:
+            for i, cache in enumerate(entries):
+                reader = type(cache)()
+                if i in keep:
+                    reader.readFromStream(strm)
+                    read.append(reader.obj)
+                else:
+                    reader.skipInStream(strm)
+            assert strm.read() == b''
+        return read
+
+    def test_gradient(self):
+        grads = []
+        for n in (2, 3, 5):
+            grad = GradientRecord()
+            for i in range(n):
+                grad[i / (n - 1)] = glm.vec4(i / n, 0., 1., 1.)
+            grads.append(grad)
+        read = self._roundTrip([GradientCache(g) for g in grads], keep={2})
+        assert list(read[0]) == list(grads[2])
+
+    def test_string_entries(self):
+        entries = [StringEntry('first', (0., 0., 0.)), StringEntry('a longer second entry', (1., 2., 0.)),
+                   StringEntry('third', (3., 4., 0.), h_justify='right', v_justify='top')]
+        read = self._roundTrip([StringEntryCache(e) for e in entries], keep={2})
+        assert read[0].txt == 'third'
+        assert read[0].anchor == pytest.approx((3., 4., 0.))
+        assert (read[0].h_justify, read[0].v_justify) == ('right', 'top')
+
+    def test_indexed(self):
+        entries = [IndexedScaleCache(IndexedScale(2., [])), IndexedScaleCache(IndexedScale(4., [1, 2, 3])),
+                   IndexedScaleCache(IndexedScale(5., [7]))]
+        read = self._roundTrip(entries, keep={2})
+        assert read[0].scale == 5.
+        assert read[0].inds == [7]
+
+    def test_texture(self):
+        scene = _CacheScene()
+        textures = [np.full((2, 3, 1), 1., np.float32), np.full((4, 4, 4), 2., np.float32),
+                    np.full((1, 2, 3), 3., np.float32)]
+        with open(self.path, 'wb') as strm:
+            for tex in textures:
+                rec = RasterLayerRecord(0)
+                rec.pixels = tex
+                scene.dumpTexToStream(rec, strm)
+
+        with open(self.path, 'rb') as strm:
+            assert scene.loadTexFromStream(strm, skip=True) == (None, None)
+            assert scene.loadTexFromStream(strm, skip=True) == (None, None)
+            channels, pixels = scene.loadTexFromStream(strm)
+            assert channels == 3
+            np.testing.assert_array_equal(pixels, textures[2])
+            assert strm.read() == b''
@@ -0,0 +1,301 @@
+# This file is part of URC Assessment Method.
+#
+# URC Assessment Method is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# URC Assessment Method is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with URC Assessment Method. If not, see
+# <https://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+
+pytest.importorskip('OpenGL')
+pytest.importorskip('glm')
+
+from urclib.ui_qt.visualizer import _support
+from urclib.ui_qt.visualizer._support import BufferPool, LayerRecord, LineLayerRecord, PolyLayerRecord, ReferenceRecord
+
+
+class _FakeBuffers(object):
+    """Records buffer object calls made by BufferPool, in place of a live OpenGL context."""
+
+    def __init__(self):
+        self.nextId = 1
+        self.live = set()
+        self.deleted = []
+        # (target, data) pairs passed to glBufferData, in call order.
+        self.uploads = []
+
+    def glGenBuffers(self, n):
+        buff = self.nextId
+        self.nextId += 1
+        self.live.add(buff)
+        return buff
+
+    def glDeleteBuffers(self, n, buffs):
+        for b in buffs:
+            assert b in self.live, 'buffer {} deleted twice'.format(b)
+            self.live.remove(b)
+            self.deleted.append(b)
+
+    def glBufferData(self, target, size, data, usage):
+        self.uploads.append((target, None if data is None else np.array(data)))
+
+
+@pytest.fixture
+def gl_buffers(monkeypatch):
+    fake = _FakeBuffers()
+    monkeypatch.setattr(_support, 'glGenBuffers', fake.glGenBuffers)
+    monkeypatch.setattr(_support, 'glDeleteBuffers', fake.glDeleteBuffers)
+    monkeypatch.setattr(_support, 'glDeleteVertexArrays', lambda n, vaos: None)
+    monkeypatch.setattr(_support, 'glBindBuffer', lambda target, buff: None)
+    monkeypatch.setattr(_support, 'glBufferData', fake.glBufferData)
+    return fake
+
+
+class TestBufferPool(object):
+
+    def test_suballocate_aligns_and_shares_block(self, gl_buffers):
+        pool = BufferPool(0, blockSize=1024)
+        buffA, offA, sizeA = pool.suballocate(10)
+        buffB, offB, sizeB = pool.suballocate(20)
+
+        assert sizeA == 16 and sizeB == 32
+        assert buffA == buffB
+        assert offA == 0 and offB == 16
+        assert len(gl_buffers.live) == 1
+
+    def test_oversized_request_gets_own_block(self, gl_buffers):
+        pool = BufferPool(0, blockSize=256)
+        small = pool.suballocate(16)
+        large = pool.suballocate(1000)
+
+        assert small[0] != large[0]
+        assert large[2] == 1008
+
+    def test_release_merges_neighbours(self, gl_buffers):
+        pool = BufferPool(0, blockSize=256)
+        ranges = [pool.suballocate(64) for _ in range(4)]
+
+        # release out of order, leaving the last range in use; the freed ranges should merge into one.
+        pool.release(*ranges[1])
+        pool.release(*ranges[0])
+        pool.release(*ranges[2])
+
+        buff = ranges[0][0]
+        assert pool._free == [(192, buff, 0)]
+
+        # the merged range satisfies a request that no single freed range could.
+        assert pool.suballocate(192) == (buff, 0, 192)
+        assert len(gl_buffers.live) == 1
+
+    def test_churn_does_not_grow_pool(self, gl_buffers):
+        pool = BufferPool(0, blockSize=1024)
+        keep = pool.suballocate(16)
+        for size in (48, 96, 160, 32, 240, 64) * 10:
+            parts = [pool.suballocate(size) for _ in range(3)]
+            for p in (parts[1], parts[0], parts[2]):
+                pool.release(*p)
+
+        assert len(gl_buffers.live) == 1
+        assert pool._free == [(1024 - keep[2], keep[0], keep[2])]
+
+    def test_empty_block_becomes_spare_and_is_reused(self, gl_buffers):
+        pool = BufferPool(0, blockSize=256)
+        first = pool.suballocate(64)
+        pool.release(*first)
+
+        assert pool._free == []
+        assert pool._spares == [(256, first[0])]
+
+        second = pool.suballocate(64)
+        assert second[0] == first[0]
+        assert gl_buffers.deleted == []
+
+    def test_spares_are_capped(self, gl_buffers):
+        pool = BufferPool(0, blockSize=256, maxSpares=1)
+        a = pool.suballocate(256)
+        b = pool.suballocate(256)
+        pool.release(*a)
+        pool.release(*b)
+
+        assert len(pool._spares) == 1
+        assert len(gl_buffers.deleted) == 1
+
+    def test_clear_deletes_all_blocks(self, gl_buffers):
+        pool = BufferPool(0, blockSize=256)
+        pool.suballocate(64)
+        pool.release(*pool.suballocate(512))
+        pool.clear()
+
+        assert gl_buffers.live == set()
+        assert pool._free == [] and pool._spares == []
+
+
+class TestLayerRecordClearBuffers(object):
+
+    def test_repeated_clear_leaves_shared_block(self, gl_buffers):
+        pool = BufferPool(0, blockSize=256)
+        recA = LayerRecord(1, vao=10)
+        recB = LayerRecord(2, vao=11)
+        for rec in (recA, recB):
+            rec.buff, rec.buffOffset, rec.buffSize = pool.suballocate(64)
+            rec.buffPool = pool
+
+        recA.ClearBuffers()
+        recA.ClearBuffers()
+
+        assert (recA.buff, recA.vao, recA.buffOffset, recA.buffSize) == (0, 0, 0, 0)
+        assert recA.buffPool is None
+        assert recB.buff in gl_buffers.live
+        assert pool._used[recB.buff] == recB.buffSize
+
+
+class TestStoreVertexStreams(object):
+
+    @pytest.fixture(autouse=True)
+    def _vertex_attribs(self, gl_buffers, monkeypatch):
+        monkeypatch.setattr(_support, 'glEnableVertexAttribArray', lambda index: None)
+        monkeypatch.setattr(_support, 'glVertexAttribPointer', lambda *args: None)
+        monkeypatch.setattr(_support, 'glBufferSubData', lambda target, offset, size, data: None)
+
+    @pytest.mark.parametrize('volatile', [False, True])
+    def test_host_copy_only_for_volatile(self, volatile):
+        rec = LayerRecord(1, count=3, volatile=volatile)
+        verts = np.arange(6, dtype=np.float32)
+        rec.storeVertexStreams(BufferPool(0, blockSize=256), verts)
+
+        assert (rec.cpuVerts is verts) == volatile
+        assert (rec.cpuVerts is None) != volatile
+
+
+def _polyRecord():
+    # three polygons: one ring, two rings, three rings.
+    rec = PolyLayerRecord(1, polygroups=[[(0, 5)], [(5, 6), (11, 4)], [(15, 7), (22, 5), (27, 4)]])
+    rec.buildRingTables()
+    return rec
+
+
+def _uploadedCmds(fake):
+    target, cmds = fake.uploads[-1]
+    assert target == _support.GL_DRAW_INDIRECT_BUFFER
+    return cmds.view(_support.INDIRECT_DT)
+
+
+class TestPolyRingTables(object):
+
+    def test_flat_tables(self):
+        rec = _polyRecord()
+
+        assert rec._polyOffsets.tolist() == [0, 1, 3, 6]
+        assert rec._firsts.tolist() == [0, 5, 11, 15, 22, 27]
+        assert rec._counts.tolist() == [5, 6, 4, 7, 5, 4]
+        assert rec._fanCounts.tolist() == [3, 4, 2, 5, 3, 2]
+
+    def test_per_polygon_views(self):
+        rec = _polyRecord()
+
+        assert [r.tolist() for r in rec.ringFirsts] == [[0], [5, 11], [15, 22, 27]]
+        assert [r.tolist() for r in rec.ringCounts] == [[5], [6, 4], [7, 5, 4]]
+        assert [r.tolist() for r in rec.fanCounts] == [[3], [4, 2], [5, 3, 2]]
+        # the views share memory with the flat tables rather than copying them.
+        assert all(np.shares_memory(v, rec._firsts) for v in rec.ringFirsts)
+
+    def test_rebuild_discards_selection_snapshot(self, gl_buffers):
+        rec = _polyRecord()
+        rec.updateSelectedIndirect(np.array([1, 0, 0], dtype=np.uint8))
+        rec.buildRingTables()
+
+        buff, count, snapshot = rec.selBuffers[rec.id]
+        assert snapshot is None
+        assert rec.updateSelectedIndirect(np.array([1, 0, 0], dtype=np.uint8)) == (buff, count)
+        assert len(gl_buffers.uploads) == 2
+
+
+class TestUpdateSelectedIndirect(object):
+
+    def test_poly_commands_cover_selected_rings(self, gl_buffers):
+        rec = _polyRecord()
+        buff, count = rec.updateSelectedIndirect(np.array([0, 1, 1], dtype=np.uint8))
+
+        assert buff in gl_buffers.live
+        assert count == 5
+        cmds = _uploadedCmds(gl_buffers)
+        assert cmds['first'].tolist() == [5, 11, 15, 22, 27]
+        assert cmds['count'].tolist() == [6, 4, 7, 5, 4]
+        assert cmds['instanceCount'].tolist() == [1] * 5
+        assert cmds['baseInstance'].tolist() == [0] * 5
+
+    def test_line_commands_cover_selected_groups(self, gl_buffers):
+        rec = LineLayerRecord(1, linegroups=[(0, 3), (3, 2), (5, 4), (9, 6)])
+        rec.buildGroupTables()
+        buff, count = rec.updateSelectedIndirect(np.array([1, 0, 0, 1], dtype=np.uint8))
+
+        assert count == 2
+        cmds = _uploadedCmds(gl_buffers)
+        assert cmds['first'].tolist() == [0, 9]
+        assert cmds['count'].tolist() == [3, 6]
+        assert cmds['instanceCount'].tolist() == [1, 1]
+
+    def test_unchanged_selection_skips_upload(self, gl_buffers):
+        rec = _polyRecord()
+        sel = np.array([1, 0, 1], dtype=np.uint8)
+        first = rec.updateSelectedIndirect(sel)
+        # a distinct array with equal contents is still a match.
+        second = rec.updateSelectedIndirect(sel.copy())
+
+        assert first == second
+        assert len(gl_buffers.uploads) == 1
+
+    def test_changed_selection_reuses_buffer(self, gl_buffers):
+        rec = _polyRecord()
+        sel = np.array([1, 0, 0], dtype=np.uint8)
+        buff, _ = rec.updateSelectedIndirect(sel)
+        # modifying the caller's array in place must not alias the snapshot.
+        sel[2] = 1
+        buff2, count = rec.updateSelectedIndirect(sel)
+
+        assert buff2 == buff
+        assert count == 4
+        assert len(gl_buffers.uploads) == 2
+        assert _uploadedCmds(gl_buffers)['first'].tolist() == [0, 15, 22, 27]
+
+    def test_empty_selection(self, gl_buffers):
+        rec = _polyRecord()
+        rec.updateSelectedIndirect(np.array([0, 1, 0], dtype=np.uint8))
+        _, count = rec.updateSelectedIndirect(np.zeros(3, dtype=np.uint8))
+
+        assert count == 0
+        assert len(gl_buffers.uploads) == 1
+
+    def test_references_keep_their_own_buffers(self, gl_buffers):
+        rec = _polyRecord()
+        ref = ReferenceRecord(2, rec)
+        srcSel = np.array([1, 0, 0], dtype=np.uint8)
+        refSel = np.array([0, 0, 1], dtype=np.uint8)
+
+        # draw both layers over several frames, as paintGL does.
+        for _ in range(3):
+            srcBuff, srcCount = rec.updateSelectedIndirect(srcSel, rec.id)
+            refBuff, refCount = ref.updateSelectedIndirect(refSel, ref.id)
+
+        assert len(gl_buffers.uploads) == 2
+        assert srcBuff != refBuff
+        assert (srcCount, refCount) == (1, 3)
+        assert set(rec.selBuffers) == {rec.id, ref.id}
+
+    def test_clear_releases_all_buffers(self, gl_buffers):
+        rec = LineLayerRecord(1, linegroups=[(0, 3), (3, 2)])
+        rec.buildGroupTables()
+        rec.updateSelectedIndirect(np.array([1, 0], dtype=np.uint8), 1)
+        rec.updateSelectedIndirect(np.array([0, 1], dtype=np.uint8), 2)
+        rec.updateSelectedIndirect(np.array([0, 0], dtype=np.uint8), 3)
+        rec.ClearBuffers()
+
+        assert rec.selBuffers == {}
+        assert gl_buffers.live == set()
@@ -0,0 +1,82 @@
+# This file is part of URC Assessment Method.
+#
+# URC Assessment Method is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# URC Assessment Method is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with URC Assessment Method. If not, see
+# <https://www.gnu.org/licenses/>.
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('OpenGL')
+pytest.importorskip('glm')
+
+from urclib.ui_qt.visualizer import textrenderer
+from urclib.ui_qt.visualizer._support import TextLayerRecord
+from urclib.ui_qt.visualizer.textrenderer import AtlasEntry, StringEntry, TxtRenderer
+
+# bytes uploaded per glyph quad: 6 vertices of 11 floats.
+_QUAD_BYTES = 6 * 11 * 4
+
+
+def _glyph(width):
+    return SimpleNamespace(advance=SimpleNamespace(x=(width + 1) << 6, y=0),
+                           bitmap=SimpleNamespace(width=width, rows=8), bitmap_left=0, bitmap_top=8)
+
+
+@pytest.fixture
+def renderer():
+    # skip the freetype setup in __init__; loadStrings() only needs the atlas and face metrics.
+    rndr = TxtRenderer.__new__(TxtRenderer)
+    rndr._face = SimpleNamespace(size=SimpleNamespace(height=10 << 6))
+    rndr._atlas = {chr(127): AtlasEntry(_glyph(4), 0), ' ': AtlasEntry(_glyph(0), 4)}
+    return rndr
+
+
+@pytest.fixture
+def gl_uploads(monkeypatch):
+    uploads = []
+    monkeypatch.setattr(textrenderer, 'glBindVertexArray', lambda vao: None)
+    monkeypatch.setattr(textrenderer, 'glBindBuffer', lambda target, buff: None)
+    monkeypatch.setattr(textrenderer, 'glBufferData',
+                        lambda target, size, data, usage: uploads.append(('alloc', size)))
+    monkeypatch.setattr(textrenderer, 'glBufferSubData',
+                        lambda target, offset, size, data: uploads.append(('update', size)))
+
+    def noQuery(*args):
+        raise AssertionError('buffer size queried from GL')
+    monkeypatch.setattr(textrenderer, 'glGetBufferParameteriv', noQuery)
+    return uploads
+
+
+class TestLoadStrings(object):
+
+    def test_reload_reuses_capacity(self, renderer, gl_uploads):
+        count, capacity = renderer.loadStrings(1, 2, [StringEntry('abcd')])
+        assert (count, capacity) == (24, 4 * _QUAD_BYTES)
+
+        # spaces have no area, so only two quads are uploaded.
+        count, capacity = renderer.loadStrings(1, 2, [StringEntry('a  b')], capacity=capacity)
+        assert (count, capacity) == (12, 4 * _QUAD_BYTES)
+
+        count, capacity = renderer.loadStrings(1, 2, [StringEntry('abcde')], capacity=capacity)
+        assert (count, capacity) == (30, 5 * _QUAD_BYTES)
+
+        assert gl_uploads == [('alloc', 4 * _QUAD_BYTES), ('update', 2 * _QUAD_BYTES), ('alloc', 5 * _QUAD_BYTES)]
+
+    def test_record_tracks_capacity(self, renderer, gl_uploads):
+        rec = TextLayerRecord(1, vao=1, buff=2, txtRenderer=renderer)
+        rec.AddString('abc', (0., 0.))
+        rec.loadStrings()
+        rec.loadStrings()
+
+        assert rec.vertCount == 18
+        assert rec.buffSize == 3 * _QUAD_BYTES
+        assert gl_uploads == [('alloc', 3 * _QUAD_BYTES), ('update', 3 * _QUAD_BYTES)]
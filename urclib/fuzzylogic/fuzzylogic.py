@@ -23,6 +23,7 @@ Attributes:
 """
 
 from __future__ import absolute_import, division, print_function, unicode_literals
+from functools import partial
 from .fuzzycurves import *
 
 noDataValue = -99999.
@@ -216,7 +217,7 @@ class FuzzyRule(object):
         # self: For referencing associated inputs and results.
         # invals: For the values to apply to each input.
         # FuzzyRule: For static methods used as operators.
-        envdict = dict(_result=self.result, _inputs=self._inputs, inVals=invals,
+        envdict = dict(_result=self.result, _inputs=self._inputs, invals=invals,
                        **{v.__name__: v for v in dict(**FuzzyRule.unary_op_map(),
                                                       **FuzzyRule.binary_op_map(),
                                                       **FuzzyRule.fn_map()).values()},)
@@ -999,7 +1000,58 @@ class FuzzyImplication(object):
             return lhs
 
         # find segments that intersect and return
-        return FuzzyImplication(lhs._minVal, lhs._maxVal, lhs._curves+rhs._curves, lhs._yClips+rhs._yClips)
+        lcount = len(lhs._curves)
+        count = lcount + len(rhs._curves)
+        curves = [None] * count
+        curves[:lcount] = lhs._curves
+        curves[lcount:] = rhs._curves
+        yclips = [None] * count
+        yclips[:lcount] = lhs._yClips
+        yclips[lcount:] = rhs._yClips
+        return FuzzyImplication(lhs._minVal, lhs._maxVal, curves, yclips)
+
+    @staticmethod
+    def combine_many(impls):
+        """Combine a sequence of implications in a single pass.
+
+        This produces the same result as folding the implications together with `combine()`, but only builds a
+        single FuzzyImplication rather than one for each intermediate pairing.
+
+        Args:
+            impls (list): The FuzzyImplications to combine, in order.
+
+        Returns:
+            FuzzyImplication: The combination of all entries in impls.
+
+        Raises:
+            FuzzyError: If impls is empty, or the minimum and maximum values do not match between the
+              FuzzyImplications.
+        """
+        if len(impls) == 0:
+            raise FuzzyError('At least one Implication is required for combining')
+
+        first = impls[0]
+        for impl in impls:
+            if impl._minVal != first._minVal or impl._maxVal != first._maxVal:
+                raise FuzzyError('Range of values must be the same when combining Implications')
+
+        # implications with a no data ceiling are ignored; if all have one, the last is forwarded on.
+        valid = [impl for impl in impls if not impl._hasNDClip]
+        if len(valid) == 0:
+            return impls[-1]
+        if len(valid) == 1:
+            return valid[0]
+
+        count = sum(len(impl._curves) for impl in valid)
+        curves = [None] * count
+        yclips = [None] * count
+        start = 0
+        for impl in valid:
+            end = start + len(impl._curves)
+            curves[start:end] = impl._curves
+            yclips[start:end] = impl._yClips
+            start = end
+        return FuzzyImplication(first._minVal, first._maxVal, curves, yclips)
 
     @property
     def minval(self):
@@ -1401,6 +1453,19 @@ class FuzzyResult(FuzzyInput):
 #######################################################################
 
 
+def _evaluate_rule(dictvals, rule):
+    """Evaluate a single rule; defined at module level so that it can be dispatched to a process pool.
+
+    Args:
+        dictvals (dict): The input values to pass to `FuzzyRule.evaluate_rule()`.
+        rule (FuzzyRule): The rule to evaluate.
+
+    Returns:
+        FuzzyImplication: The implication produced by the rule.
+    """
+    return rule.evaluate_rule(dictvals)
+
+
 class FuzzyLogicSet(object):
     """Contains all relevant parts for constructing and evaluating Fuzzy Logic.
 
@@ -1506,13 +1571,17 @@ class FuzzyLogicSet(object):
             rule.add_input(i)
         rule.result = self.result
 
-    def evaluate_rules(self, dictvals):
+    def evaluate_rules(self, dictvals, executor=None):
         """Use supplied values to produce a consolidated decision space.
 
         Args:
             dictvals (dict): A dictionary containing key-value pairs for each input.
                 There should be one key matching each input, paired with an associated
                 value.
+            executor (concurrent.futures.Executor,optional): If provided, rules are evaluated concurrently using
+                the executor's `map()` method; otherwise rules are evaluated sequentially. Rules are compiled to
+                Python expressions and hold the GIL while evaluating, so a `ProcessPoolExecutor` is needed for any
+                speedup; the rules and dictvals are pickled to each worker.
 
         Returns:
             FuzzyImplication: Implication containing the complete decision space.
@@ -1524,18 +1593,18 @@ class FuzzyLogicSet(object):
         if len(self._rules) == 0:
             raise FuzzyError("No rules to evaluate.")
 
-        # evaluate rules individually.
-        impls = []
+        # bind inputs before evaluating; rules are independent of each other afterwards.
         for r in self._rules:
             self.prepare_rule(r)
-            impls.append(r.evaluate_rule(dictvals))
 
-        # combine implications.
-        tot = impls[0]
-        for i in range(1, len(impls)):
-            tot += impls[i]
+        # evaluate rules individually.
+        if executor is not None:
+            impls = list(executor.map(partial(_evaluate_rule, dictvals), self._rules))
+        else:
+            impls = [r.evaluate_rule(dictvals) for r in self._rules]
 
-        return tot
+        # combine implications.
+        return FuzzyImplication.combine_many(impls)
 
     @property
     def rules(self):
@@ -90,7 +90,7 @@ class GradientCache(VizCache):
 
     def skipInStream(self,strm):
         count = np.fromfile(strm,np.uint32,1)[0]
-        strm.seek(np.float32.itemsize*count*5,1)
+        strm.seek(np.dtype(np.float32).itemsize*int(count)*5,1)
 
 
     def writeToStream(self, strm):
@@ -155,9 +155,9 @@ class IndexedCache(VizCache,metaclass=ABCMeta):
 
     def skipInStream(self,strm):
         count = np.fromfile(strm, '<u4', 1)[0]
-        if count>0:
-            dt = np.dtype(f'{self._typeCode()}, <{count}u4')
-            strm.seek(dt.itemsize,1)
+        # the value is written even when there are no indices.
+        dt = np.dtype(f'{self._typeCode()}, <{count}u4')
+        strm.seek(dt.itemsize,1)
 
 class IndexedColorCache(IndexedCache):
 
@@ -257,7 +257,7 @@ class StringEntryCache(VizCache):
     def skipInStream(self,strm):
         strm.seek(StringEntryCache.SE_T.itemsize,1)
         strlen = np.fromfile(strm,C_DT,1)[0]
-        strm.seek(C_DT.itemsize*strlen)
+        strm.seek(C_DT.itemsize*int(strlen),1)
 
     def writeToStream(self,strm):
         rec=self._obj
@@ -547,10 +547,10 @@ class PointLayerCache(LayerCache):
     def skipInStream(self,strm):
         super().skipInStream(strm)
         strm.seek(PointLayerCache.PTATTR_DT.itemsize,1)
-        skipper = IndexedGlyphCache()
-        skipper.skipInStream(strm)
-        skipper = IndexedScaleCache()
-        skipper.skipInStream(strm)
+        for skipper in (IndexedGlyphCache(), IndexedScaleCache()):
+            indCount = np.fromfile(strm, C_DT, 1)[0]
+            for _ in range(indCount):
+                skipper.skipInStream(strm)
         strm.seek(PT_DT.itemsize*self._obj['count'],1)
 
     def writeToStream(self,strm):
@@ -590,11 +590,12 @@ class LineLayerCache(LayerCache):
 
     def skipInStream(self, strm):
         super().skipInStream(strm)
+        strm.seek(LineLayerCache.LINE_DT.itemsize,1)
         vertCount = 0
         grpCount, = np.fromfile(strm, C_DT, 1)
         for _ in range(grpCount):
-            _, count = np.fromfile(strm, GROUP_DT)
-            vertCount += count
+            _, count = np.fromfile(strm, GROUP_DT, 1)[0]
+            vertCount += int(count)
 
         # read count and populate stream
         strm.seek(PT_DT.itemsize * vertCount, 1)
@@ -747,8 +748,8 @@ class TextLayerCache(LayerCache):
     def skipInStream(self, strm):
         super().skipInStream(strm)
         strm.seek(TextLayerCache.TL_DT.itemsize,1)
-        fontNameLen=int(np.fromFile(strm,C_DT,1)[0])
-        strm.seek(fontNameLen,1)
+        fontNameLen=int(np.fromfile(strm,C_DT,1)[0])
+        strm.seek(C_DT.itemsize*fontNameLen,1)
         hasOLColor=bool(np.fromfile(strm,C_DT,1)[0])
         if hasOLColor:
             strm.seek(V4_DT.itemsize,1)
@@ -867,6 +868,7 @@ class LayerStackCache(object):
                     lyr.srcRecord = src
                     lyr.vao = src.vao
                     lyr.buff = src.buff
+                    lyr.buffOffset = src.buffOffset
                     lyr.count = src.count
                     lyr.exts = src.exts
                 # add other mappings here...
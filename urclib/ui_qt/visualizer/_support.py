@@ -15,6 +15,7 @@
 
 """
 import sys
+from bisect import bisect_left, insort
 from enum import IntEnum
 
 import glm
@@ -170,13 +171,15 @@ class GradientRecord(object):
 
         return GradientRecord._lerp(lower[1],upper[1],rel_wt)
 
-    def colorStrip(self,count,flatten=False):
+    def colorStrip(self,count,flatten=False,out=None):
         """Builds a regular color strip based on weighted values
 
         Args:
             count (int): The number samples to take between 0 and 1.
             flatten (bool): If true, strings the individual channel values together
               in a fashion suitable for direct rendering. Defaults to false.
+            out (numpy.ndarray,optional): Contiguous float32 array of `count*4` values to write the strip into, in
+              place of a newly allocated array.
         Returns:
             list: If `flatten` is `False`; list of `SimpleColor` objects representing regular sampling
             numpy.array: If `flatten` is `True`; individual channel values for each color.
@@ -188,7 +191,7 @@ class GradientRecord(object):
         itr = iter(self)
         lower = None
         upper = next(itr)
-        outlist = np.empty([count*4],dtype=np.float32)
+        outlist = np.empty([count*4],dtype=np.float32) if out is None else out.reshape([count*4])
         i=0
         while counter <= 1.:
 
@@ -210,7 +213,6 @@ class GradientRecord(object):
             counter+=interval
             i+=4
 
-        outlist = np.array(outlist,np.float32)
         if not flatten:
             outlist=outlist.reshape([outlist.shape[0]//4,4])
         return outlist
@@ -355,9 +357,9 @@ class IndexedColor(object):
             list: colors associated with indexes.
         """
         expColors = np.full([recCount, 4], d_color,dtype=np.float32)
+        # one scatter per color group rather than one store per index.
         for ci in indexes:
-            for i in ci.inds:
-                expColors[i] = ci.color
+            expColors[np.asarray(ci.inds, dtype=np.intp)] = ci.color
         return expColors
 
 
@@ -399,8 +401,7 @@ class IndexedGlyph(object):
 
         expGlyphs = np.full([recCount], ord(d_glyph) if isinstance(d_glyph,str) else d_glyph, dtype=np.uint32)
         for ci in indexes:
-            for i in ci.inds:
-                expGlyphs[i] = ci.glyphVal
+            expGlyphs[np.asarray(ci.inds, dtype=np.intp)] = ci.glyphVal
         return expGlyphs
 
     def __init__(self,glyph,inds):
@@ -452,8 +453,7 @@ class IndexedScale(object):
 
         expScales = np.full([recCount], d_scale, dtype=np.float32)
         for ci in indexes:
-            for i in ci.inds:
-                expScales[i] = ci.scale
+            expScales[np.asarray(ci.inds, dtype=np.intp)] = ci.scale
         return expScales
 
     def __init__(self, scale, inds):
@@ -468,13 +468,206 @@ class IndexedScale(object):
 # </editor-fold>
 
 
+# <editor-fold desc="Buffer management">
+class BufferPool(object):
+    """Suballocator handing out byte ranges of a few large array buffers, rather than one buffer object per layer.
+
+    Ranges are carved out of fixed-size blocks; a request larger than a block receives a block of its own. Free ranges
+    are kept sorted by size, so the smallest range that fits a request is found with a binary search, and are merged
+    with their free neighbours on release so that the block does not fragment over time. A block with no
+    ranges in use is kept as a spare for the next block request, so that clearing and reloading layers does not
+    delete and recreate buffer objects; spares beyond `maxSpares` are deleted.
+
+    Attributes:
+        usage (int): The OpenGL usage hint applied to each block.
+        blockSize (int): The size, in bytes, of each shared block.
+        maxSpares (int): The maximum number of empty blocks retained for reuse.
+
+    Args:
+        usage (int): The OpenGL usage hint to apply to each block; typically GL_STATIC_DRAW or GL_DYNAMIC_DRAW.
+        blockSize (int,optional): The size, in bytes, of each shared block.
+        maxSpares (int,optional): The maximum number of empty blocks retained for reuse.
+    """
+
+    ALIGNMENT = 16
+
+    def __init__(self, usage, blockSize=1 << 22, maxSpares=4):
+        self.usage = usage
+        self.blockSize = blockSize
+        self.maxSpares = maxSpares
+        # (size, buff, offset) entries, sorted for best-fit lookup.
+        self._free = []
+        # (buff, offset) -> size and (buff, end) -> offset for each free range, for finding neighbours to merge.
+        self._freeStarts = {}
+        self._freeEnds = {}
+        # buff -> bytes currently handed out from that block.
+        self._used = {}
+        # buff -> capacity, for every block in use.
+        self._capacity = {}
+        # (capacity, buff) entries for empty blocks, sorted for best-fit lookup.
+        self._spares = []
+
+    def suballocate(self, nbytes):
+        """Reserve a range of at least `nbytes` bytes.
+
+        Args:
+            nbytes (int): The number of bytes required.
+
+        Returns:
+            tuple:
+              0. int: The array buffer containing the range.
+              1. int: The byte offset of the range within the buffer.
+              2. int: The size of the range, in bytes; pass back to `release()`.
+        """
+
+        size = -(-max(nbytes, 1) // BufferPool.ALIGNMENT) * BufferPool.ALIGNMENT
+        i = bisect_left(self._free, (size, 0, 0))
+        if i == len(self._free):
+            self._newBlock(max(size, self.blockSize))
+            i = bisect_left(self._free, (size, 0, 0))
+
+        fSize, buff, offset = self._free[i]
+        self._removeFree(fSize, buff, offset)
+        if fSize > size:
+            self._addFree(fSize - size, buff, offset + size)
+        self._used[buff] += size
+        return buff, offset, size
+
+    def release(self, buff, offset, size):
+        """Return a range acquired from `suballocate()` to the pool.
+
+        Args:
+            buff (int): The array buffer containing the range.
+            offset (int): The byte offset of the range.
+            size (int): The size of the range, as returned by `suballocate()`.
+        """
+
+        self._used[buff] -= size
+        if self._used[buff] == 0:
+            del self._used[buff]
+            for f in [f for f in self._free if f[1] == buff]:
+                self._removeFree(*f)
+            insort(self._spares, (self._capacity.pop(buff), buff))
+            if len(self._spares) > self.maxSpares:
+                # drop the largest spare; smaller blocks are the likelier fit for the next request.
+                _, extra = self._spares.pop()
+                glDeleteBuffers(1, [extra])
+        else:
+            # merge with the free ranges immediately before and after, if any.
+            prevOffset = self._freeEnds.get((buff, offset))
+            if prevOffset is not None:
+                prevSize = offset - prevOffset
+                self._removeFree(prevSize, buff, prevOffset)
+                offset = prevOffset
+                size += prevSize
+            nextSize = self._freeStarts.get((buff, offset + size))
+            if nextSize is not None:
+                self._removeFree(nextSize, buff, offset + size)
+                size += nextSize
+            self._addFree(size, buff, offset)
+
+    def clear(self):
+        """Delete every block owned by the pool, including spares."""
+
+        blocks = list(self._used.keys()) + [b for _, b in self._spares]
+        if bool(glDeleteBuffers) and len(blocks) > 0:
+            glDeleteBuffers(len(blocks), blocks)
+        self._used.clear()
+        self._capacity.clear()
+        self._free.clear()
+        self._freeStarts.clear()
+        self._freeEnds.clear()
+        self._spares.clear()
+
+    def _newBlock(self, capacity):
+        i = bisect_left(self._spares, (capacity, 0))
+        if i < len(self._spares):
+            # a spare's storage already has this pool's usage hint, so it can be handed out as is.
+            capacity, buff = self._spares.pop(i)
+        else:
+            buff = int(glGenBuffers(1))
+            glBindBuffer(GL_ARRAY_BUFFER, buff)
+            glBufferData(GL_ARRAY_BUFFER, capacity, None, self.usage)
+        self._used[buff] = 0
+        self._capacity[buff] = capacity
+        self._addFree(capacity, buff, 0)
+
+    def _addFree(self, size, buff, offset):
+        insort(self._free, (size, buff, offset))
+        self._freeStarts[(buff, offset)] = size
+        self._freeEnds[(buff, offset + size)] = offset
+
+    def _removeFree(self, size, buff, offset):
+        del self._free[bisect_left(self._free, (size, buff, offset))]
+        del self._freeStarts[(buff, offset)]
+        del self._freeEnds[(buff, offset + size)]
+
+# </editor-fold>
+
+
 # <editor-fold desc="Layer Classes">
+
+# Layout of a single DrawArraysIndirectCommand, as consumed by glMultiDrawArraysIndirect.
+INDIRECT_DT = np.dtype([('count', np.uint32), ('instanceCount', np.uint32), ('first', np.uint32),
+                        ('baseInstance', np.uint32)])
+
+
+def _uploadSelIndirect(selBuffers, recId, selectedRecs, firsts, counts):
+    """Write one indirect draw command per selected vertex range into the selection buffer kept for a record.
+
+    Args:
+        selBuffers (dict): The selection buffers of the record owning the geometry, keyed by drawing record id.
+        recId (int): Id of the record the commands are drawn for.
+        selectedRecs (numpy.ndarray): The selection the commands were built from; kept to detect later changes.
+        firsts (numpy.ndarray): Starting vertex of each selected range.
+        counts (numpy.ndarray): Vertex count of each selected range.
+
+    Returns:
+        tuple: The indirect buffer and the number of draw commands it holds, respectively.
+    """
+
+    buff = selBuffers[recId][0] if recId in selBuffers else 0
+    cmds = np.empty(len(firsts), dtype=INDIRECT_DT)
+    if len(cmds) > 0:
+        cmds['count'] = counts
+        cmds['first'] = firsts
+        cmds['instanceCount'] = 1
+        cmds['baseInstance'] = 0
+
+        if buff == 0:
+            buff = glGenBuffers(1)
+        glBindBuffer(GL_DRAW_INDIRECT_BUFFER, buff)
+        glBufferData(GL_DRAW_INDIRECT_BUFFER, cmds.nbytes, cmds, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_DRAW_INDIRECT_BUFFER, 0)
+
+    selBuffers[recId] = (buff, len(cmds), selectedRecs.copy())
+    return buff, len(cmds)
+
+
+def _staleSelIndirect(selBuffers):
+    """Force every selection buffer in `selBuffers` to be rebuilt on its next update, keeping the buffers."""
+
+    for recId, (buff, count, _) in selBuffers.items():
+        selBuffers[recId] = (buff, count, None)
+
+
+def _deleteSelIndirect(selBuffers):
+    """Release the buffers in `selBuffers` and empty it."""
+
+    buffs = [buff for buff, _, _ in selBuffers.values() if buff != 0]
+    if bool(glDeleteBuffers) and len(buffs) > 0:
+        glDeleteBuffers(len(buffs), buffs)
+    selBuffers.clear()
+
 class LayerRecord(object):
     """ Record of draw data for a given "ogr_layer" of data.
 
     Attributes:
           vao (int): Vertex array object provided by the OpenGL API.
           buff (int): Array buffer provided by the OpenGL API.
+          buffOffset (int): Byte offset of the layer's vertex data within `buff`, which may be shared with other layers.
+          buffSize (int): Number of bytes reserved for the layer within `buff`.
+          buffPool (BufferPool or None): The pool `buff` was suballocated from; `None` if the layer owns `buff`.
           draw (bool): If `True`, draw items defined in this ogr_layer.
           count (int): The number of features in the layer record.
           exts (list): The exents of the layer's coverage.
@@ -483,6 +676,11 @@ class LayerRecord(object):
             individual colors for each bit of geometry.
           selectedGeom (set): Indices of geometry marked as _selected_.
           volatile (bool): Whether or not the geometry is expected to change.
+          extraOffset (int): Byte offset of the per-vertex attribute stream from `buffOffset`; `0` if the layer has no
+            attribute stream. Positions are always stored first, so each stream can be updated independently.
+          cpuVerts (numpy.ndarray or None): Host-side copy of the vertex positions last written to `buff`, so they can
+            be read without a GPU readback. Only kept for volatile layers, whose vertices are expected to be read back
+            and rewritten; `None` otherwise, or if not yet loaded.
 
     Args:
         id (int): The id to assign the layer.
@@ -496,6 +694,9 @@ class LayerRecord(object):
 
         self.vao = vao
         self.buff = buff
+        self.buffOffset = 0
+        self.buffSize = 0
+        self.buffPool = None
         self.draw = True
         self.count = count
         self.exts = exts
@@ -509,6 +710,8 @@ class LayerRecord(object):
         self.geomColors = []
         self.selectedRecs = np.full([self.count], 0, dtype=np.uint32)
         self.volatile=volatile
+        self.extraOffset = 0
+        self.cpuVerts = None
 
     def value_eq(self,other):
         """Compare another Layer Record to see if they are equivalentg.
@@ -543,8 +746,16 @@ class LayerRecord(object):
         """ Delete associated OpenGL VAO and FBO.
         """
         if bool(glDeleteBuffers) and any([self.buff,self.vao]):
-            glDeleteBuffers(1, [self.buff])
+            self.cpuVerts = None
+            if self.buffPool is not None:
+                self.buffPool.release(self.buff, self.buffOffset, self.buffSize)
+                self.buffPool = None
+            else:
+                glDeleteBuffers(1, [self.buff])
             glDeleteVertexArrays(1, [self.vao])
+            # forget the handles, so that a repeated clear cannot release or delete a block shared with other layers.
+            self.buff = self.vao = 0
+            self.buffOffset = self.buffSize = 0
 
     def selectRecs(self,active):
         """ Mark specific records as 'selected'.
@@ -581,7 +792,6 @@ class LayerRecord(object):
               1. object: Default implementation returns `extra`, but subclass implementations may return a replacement
                          value.
         """
-        self.buff = glGenBuffers(1)
         return verts,extra
 
     def loadGLBuffer(self,verts,drawMode,scene,extra=None):
@@ -596,7 +806,36 @@ class LayerRecord(object):
             extra (object,optional): Any additional data needed. Argument reserved for subclass implementations.
         """
 
-        glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, drawMode)
+        self.storeVertexStreams(scene.vertexBufferPool(drawMode), verts)
+
+    def storeVertexStreams(self, pool, verts, extra=None, extraComps=1):
+        """Write vertex positions, and optionally a per-vertex float stream, into a range suballocated from `pool`.
+
+        Positions are bound to attribute 0 and `extra` to attribute 1 of the currently bound VAO.
+
+        Args:
+            pool (BufferPool): The pool to reserve storage from.
+            verts (numpy.ndarray): Vertex positions, as consecutive pairs of floats.
+            extra (numpy.ndarray,optional): Per-vertex attribute values, stored directly after the positions.
+            extraComps (int,optional): The number of float components per vertex in `extra`.
+        """
+
+        nbytes = verts.nbytes + (extra.nbytes if extra is not None else 0)
+        self.buff, self.buffOffset, self.buffSize = pool.suballocate(nbytes)
+        self.buffPool = pool
+        # other layers would hold a second copy of their geometry for their whole life; they read back on demand.
+        self.cpuVerts = verts if self.volatile else None
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.buff)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, ctypes.c_void_p(self.buffOffset))
+        glBufferSubData(GL_ARRAY_BUFFER, self.buffOffset, verts.nbytes, verts)
+        if extra is not None:
+            extraStart = self.buffOffset + verts.nbytes
+            glEnableVertexAttribArray(1)
+            glVertexAttribPointer(1, extraComps, GL_FLOAT, GL_FALSE, 0, ctypes.c_void_p(extraStart))
+            glBufferSubData(GL_ARRAY_BUFFER, extraStart, extra.nbytes, extra)
+            self.extraOffset = verts.nbytes
 
     @property
     def vertCount(self):
@@ -614,11 +853,18 @@ class PolyLayerRecord(LayerRecord):
            coloring.
         refVao (int): Pointer to reference VAO.
         refBuff (int): Pointer to reference FBO.
+        refQuadKey (tuple or None): The layer and reference extents the quad in `refBuff` was built from.
         drawGrid (bool): Show/hide polygon outlines.
         fillGrid (bool): If `True` fill polygons.
         useFillAttrVals (bool): Fill with values intead of colors (DEPRECATED).
         gridColor (glm.vec4): Color to use to draw grid.
         attrVals (list): The values to associate with records.
+        ringFirsts (list): Per-polygon numpy.int32 views of ring start offsets, for use with `glMultiDrawArrays`.
+        ringCounts (list): Per-polygon numpy.int32 views of ring vertex counts, including adjacency vertices.
+        fanCounts (list): Per-polygon numpy.int32 views of ring vertex counts, excluding adjacency vertices.
+        selBuffers (dict): Indirect draw buffers holding one draw command per ring of each selected polygon, as
+            (buffer, command count, selection) tuples keyed by the id of the record being drawn; this record and any
+            ReferenceRecords of it each get their own entry, since each has its own selection.
 
     Args:
         id (int): The id to assign the layer.
@@ -635,6 +881,7 @@ class PolyLayerRecord(LayerRecord):
         self.customGradTexes = [0,0]
         self.refVao = 0
         self.refBuff = 0
+        self.refQuadKey = None
         self.drawGrid = True
         self.fillGrid = kwargs.get('fill_grid',True)
         self.useFillAttrVals = False # DEPRECATED
@@ -644,6 +891,15 @@ class PolyLayerRecord(LayerRecord):
         self.attrVals = None
         self.fillMode = POLY_FILL.SOLID
         self.needsAdjacency = not hasAdjacency
+        self.ringFirsts = []
+        self.ringCounts = []
+        self.fanCounts = []
+        # flat ring tables backing the per-polygon views above; rings of polygon i are [_polyOffsets[i],_polyOffsets[i+1])
+        self._firsts = np.empty(0, dtype=np.int32)
+        self._counts = np.empty(0, dtype=np.int32)
+        self._fanCounts = np.empty(0, dtype=np.int32)
+        self._polyOffsets = np.zeros(1, dtype=np.int32)
+        self.selBuffers = {}
 
         if 'single_color' in kwargs:
             self.setSingleColor(kwargs['single_color'])
@@ -677,11 +933,10 @@ class PolyLayerRecord(LayerRecord):
             glDeleteBuffers(1,[self.refBuff])
             texes = [self.refTex]+self.customGradTexes
             glDeleteTextures(2,texes)
+        _deleteSelIndirect(self.selBuffers)
 
     def prepareForGLLoad(self,verts,ext,extra=None):
-        
-        self.buff = glGenBuffers(1)
-        
+
         if not self.needsAdjacency:
             return verts,extra
        
@@ -713,20 +968,67 @@ class PolyLayerRecord(LayerRecord):
 
     def loadGLBuffer(self, verts, drawMode,scene, extra=None):
         if extra is None:
-            glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, drawMode)
+            self.storeVertexStreams(scene.vertexBufferPool(drawMode), verts)
         else:
 
             try:
-                glEnableVertexAttribArray(1)
-                # https://stackoverflow.com/questions/11132716/how-to-specify-buffer-offset-with-pyopengl
-                glVertexAttribPointer(1, 2, GL_FLOAT, GL_FALSE, 0, ctypes.c_void_p(verts.nbytes))
-                # allocate the space, then copy data, one array at a time
-                glBufferData(GL_ARRAY_BUFFER, verts.nbytes + extra.nbytes, None, drawMode)
-                glBufferSubData(GL_ARRAY_BUFFER, 0, verts.nbytes, verts)
-                glBufferSubData(GL_ARRAY_BUFFER, verts.nbytes, extra.nbytes, extra)
+                # texture coordinates follow the positions in the same range.
+                self.storeVertexStreams(scene.vertexBufferPool(drawMode), verts, extra, 2)
             except OSError:
                 print("Memory corruption with Visualizer. Please try restarting Program", file=sys.stderr)
                 raise
+        self.buildRingTables()
+
+    def buildRingTables(self):
+        """Build the per-polygon ring offset and count arrays consumed by `glMultiDrawArrays`.
+
+        Must be called after any adjacency vertices have been added to `groups`.
+        """
+
+        polyCount = len(self.groups)
+        self._polyOffsets = np.zeros(polyCount + 1, dtype=np.int32)
+        np.cumsum([len(poly) for poly in self.groups], out=self._polyOffsets[1:])
+
+        rings = np.array([ring for poly in self.groups for ring in poly], dtype=np.int32).reshape(-1, 2)
+        self._firsts = np.ascontiguousarray(rings[:, 0])
+        self._counts = np.ascontiguousarray(rings[:, 1])
+        # stencil fans skip the trailing adjacency vertices
+        self._fanCounts = self._counts - 2
+
+        # per-polygon views into the flat tables, so drawing never has to slice.
+        offs = self._polyOffsets
+        self.ringFirsts = [self._firsts[offs[i]:offs[i + 1]] for i in range(polyCount)]
+        self.ringCounts = [self._counts[offs[i]:offs[i + 1]] for i in range(polyCount)]
+        self.fanCounts = [self._fanCounts[offs[i]:offs[i + 1]] for i in range(polyCount)]
+        # force indirect selection commands to be rebuilt against the new tables.
+        _staleSelIndirect(self.selBuffers)
+
+    def updateSelectedIndirect(self, selectedRecs=None, recId=None):
+        """Rewrite the indirect draw buffer for selected polygon rings, if the selection has changed.
+
+        The buffer is left untouched while the selection matches the selection it was last built from, so
+        repeated frames with an unchanged selection incur no uploads.
+
+        Args:
+            selectedRecs (numpy.ndarray,optional): The selection flags to build from; defaults to `selectedRecs`.
+              Reference records sharing this record's geometry pass their own selection here.
+            recId (int,optional): Id of the record being drawn, which selects the buffer to use; defaults to `id`.
+
+        Returns:
+            tuple: The indirect buffer and the number of draw commands it holds, respectively.
+        """
+
+        if selectedRecs is None:
+            selectedRecs = self.selectedRecs
+        if recId is None:
+            recId = self.id
+        entry = self.selBuffers.get(recId)
+        if entry is not None and entry[2] is not None and np.array_equal(entry[2], selectedRecs):
+            return entry[:2]
+
+        # expand the per-polygon selection to a per-ring mask over the flat tables.
+        ringSel = np.repeat(selectedRecs == 1, np.diff(self._polyOffsets))
+        return _uploadSelIndirect(self.selBuffers, recId, selectedRecs, self._firsts[ringSel], self._counts[ringSel])
 
     @property
     def vertCount(self):
@@ -762,6 +1064,10 @@ class PointLayerRecord(LayerRecord):
     Attributes:
         ptSelBuff (int): Array buffer for selected points provided by
             the OpenGL API.
+        pickBuffers (dict): Per-point identifier color buffers used during
+            picking, as (buffer, count) pairs keyed by the id of the record
+            being picked; this record and any ReferenceRecords of it each get
+            their own entry, generated on first pick.
         count (int): Total number of points in this ogr_layer.
 
     Args:
@@ -776,6 +1082,7 @@ class PointLayerRecord(LayerRecord):
         super().__init__(id,vao, buff,count, **kwargs)
         self.ptSelBuff = 0
         self.auxColorBuff =0
+        self.pickBuffers = {}
         self._ptSize = kwargs.get('size',2.)
         self.colorMode=POINT_FILL.SINGLE
 
@@ -848,20 +1155,23 @@ class PointLayerRecord(LayerRecord):
 
             glDeleteBuffers(2, [self.ptSelBuff, self.auxColorBuff])
             glDeleteTextures(1,[self.gradTexId])
+        if bool(glDeleteBuffers) and len(self.pickBuffers) > 0:
+            glDeleteBuffers(len(self.pickBuffers), [b for b, _ in self.pickBuffers.values()])
+            self.pickBuffers.clear()
 
         super().ClearBuffers()
 
     def prepareForGLLoad(self, verts, ext, extra=None):
         """For initializing the vertices and any other info for OpenGL loading"""
 
-        self.buff, self.ptSelBuff = glGenBuffers(2)
+        self.ptSelBuff = glGenBuffers(1)
         if self.colorMode in [POINT_FILL.INDEX, POINT_FILL.VAL_REF]:
             self.auxColorBuff = glGenBuffers(1)
         # default is passthru
         return verts,extra
     
     def loadGLBuffer(self,verts,drawMode,scene,extra=None):
-        glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, drawMode)
+        self.storeVertexStreams(scene.vertexBufferPool(drawMode), verts)
 
         sBuff = extra if extra is not None else np.zeros(len(verts.ravel()) // 2, dtype=np.uint32)
         glBindBuffer(GL_ARRAY_BUFFER, self.ptSelBuff)
@@ -942,6 +1252,14 @@ class LineLayerRecord(LayerRecord):
     """Record representing line geometry to be drawn.
 
     Attributes:
+        groupFirsts (numpy.ndarray or None): Starting vertex of each linestring in `groups`, for multi-draw calls.
+        groupCounts (numpy.ndarray or None): Vertex count of each linestring in `groups`, for multi-draw calls.
+        pickBuffers (dict): Buffers used during picking, as (color buffer, indirect buffer, count) tuples keyed by the
+            id of the record being picked; this record and any ReferenceRecords of it each get their own entry. The
+            color buffer holds per-linestring identifier colors, and the indirect buffer one single-instance command
+            per linestring.
+        selBuffers (dict): Indirect draw buffers holding one draw command per selected linestring, as (buffer,
+            command count, selection) tuples keyed by the id of the record being drawn, as with `pickBuffers`.
 
     Args:
         id (int): The id to assign the layer.
@@ -983,6 +1301,10 @@ class LineLayerRecord(LayerRecord):
         self.attrVals = None
         self.lowVal = 0.
         self.highVal = 1.
+        self.groupFirsts = None
+        self.groupCounts = None
+        self.pickBuffers = {}
+        self.selBuffers = {}
 
     def value_eq(self,other):
         return all((super().value_eq(other),
@@ -1010,9 +1332,12 @@ class LineLayerRecord(LayerRecord):
             glDeleteBuffers(1,[self.refBuff])
             texes = [self.gradTexId]
             glDeleteTextures(1,texes)
+        if bool(glDeleteBuffers) and len(self.pickBuffers) > 0:
+            glDeleteBuffers(2 * len(self.pickBuffers), [b for c, i, _ in self.pickBuffers.values() for b in (c, i)])
+            self.pickBuffers.clear()
+        _deleteSelIndirect(self.selBuffers)
 
     def prepareForGLLoad(self,verts,ext,extra=None):
-        self.buff = glGenBuffers(1)
         if extra is not None:
             self.refBuff = glGenBuffers(1)
 
@@ -1085,16 +1410,47 @@ class LineLayerRecord(LayerRecord):
         return newVerts,newExtra
 
     def loadGLBuffer(self,verts,drawMode,scene,extra=None):
-        glBindBuffer(GL_ARRAY_BUFFER,self.buff)
-        if extra is None:
-            glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, drawMode)
-        else:
-            glEnableVertexAttribArray(1)
-            glVertexAttribPointer(1,1,GL_FLOAT,GL_FALSE,0,ctypes.c_void_p(verts.nbytes))
-            glBufferData(GL_ARRAY_BUFFER, verts.nbytes+extra.nbytes, None, drawMode)
-            glBufferSubData(GL_ARRAY_BUFFER,0,verts.nbytes,verts)
-            glBufferSubData(GL_ARRAY_BUFFER,verts.nbytes,extra.nbytes,extra)
+        self.storeVertexStreams(scene.vertexBufferPool(drawMode), verts, extra, 1)
+        self.buildGroupTables()
+
+    def buildGroupTables(self):
+        """Build the linestring offset and count arrays consumed by `glMultiDrawArrays`.
+
+        Must be called after any adjacency vertices have been added to `groups`.
+        """
+
+        groups = np.array([tuple(g) for g in self.groups], dtype=np.int32).reshape(-1, 2)
+        self.groupFirsts = np.ascontiguousarray(groups[:, 0])
+        self.groupCounts = np.ascontiguousarray(groups[:, 1])
+        # any selection commands refer to the old tables.
+        _staleSelIndirect(self.selBuffers)
 
+    def updateSelectedIndirect(self, selectedRecs=None, recId=None):
+        """Rewrite the indirect draw buffer for selected linestrings, if the selection has changed.
+
+        The buffer is left untouched while the selection matches the selection it was last built from, so
+        repeated frames with an unchanged selection incur no uploads.
+
+        Args:
+            selectedRecs (numpy.ndarray,optional): The selection flags to build from; defaults to `selectedRecs`.
+              Reference records sharing this record's geometry pass their own selection here.
+            recId (int,optional): Id of the record being drawn, which selects the buffer to use; defaults to `id`.
+
+        Returns:
+            tuple: The indirect buffer and the number of draw commands it holds, respectively.
+        """
+
+        if selectedRecs is None:
+            selectedRecs = self.selectedRecs
+        if recId is None:
+            recId = self.id
+        entry = self.selBuffers.get(recId)
+        if entry is not None and entry[2] is not None and np.array_equal(entry[2], selectedRecs):
+            return entry[:2]
+
+        selMask = selectedRecs != 0
+        return _uploadSelIndirect(self.selBuffers, recId, selectedRecs, self.groupFirsts[selMask],
+                                  self.groupCounts[selMask])
 
     @property
     def vertCount(self):
@@ -1133,19 +1489,19 @@ class RasterLayerRecord(LayerRecord):
             glDeleteTextures(1,[self.texId])
 
     def prepareForGLLoad(self,verts,ext,extra=None):
-        self.buff = glGenBuffers(1)
         self.texId = glGenTextures(1)
         
         return self._extToVerts(ext),extra
 
     def loadGLBuffer(self,verts,drawMode,scene,extra=None):
-        glEnableVertexAttribArray(1)
-        glVertexAttribPointer(1, 2, GL_FLOAT, GL_FALSE, 0, ctypes.c_void_p(verts.nbytes))
-        # allocate the space, then copy data, one array at a time
-        glBufferData(GL_ARRAY_BUFFER, verts.nbytes + extra.nbytes, None, drawMode)
-        glBufferSubData(GL_ARRAY_BUFFER, 0, verts.nbytes, verts)
-        glBufferSubData(GL_ARRAY_BUFFER, verts.nbytes, extra.nbytes, extra)
-        
+        # raster quads are drawn through the scene's shared raster vertex array, which binds `buff` at `buffOffset`
+        # per draw; only the positions need storing.
+        pool = scene.vertexBufferPool(drawMode)
+        self.buff, self.buffOffset, self.buffSize = pool.suballocate(verts.nbytes)
+        self.buffPool = pool
+        glBindBuffer(GL_ARRAY_BUFFER, self.buff)
+        glBufferSubData(GL_ARRAY_BUFFER, self.buffOffset, verts.nbytes, verts)
+
     def _extToVerts(self,ext):
         self.count = 4
         left, right, bottom, top = ext
@@ -1182,7 +1538,6 @@ class RasterIndexLayerRecord(RasterLayerRecord):
             glDeleteTextures(1,[self.gradTexId])
 
     def prepareForGLLoad(self, verts, ext, extra=None):
-        self.buff = glGenBuffers(1)
         self.texId, self.gradTexId = glGenTextures(2)
 
         return self._extToVerts(ext),extra
@@ -1220,6 +1575,8 @@ class ReferenceRecord(LayerRecord):
         # remove any parent attributes that should be passthrough
         delattr(self,'vao')
         delattr(self,'buff')
+        delattr(self,'buffOffset')
+        delattr(self,'cpuVerts')
         delattr(self,'draw')
         delattr(self,'count')
         delattr(self,'exts')
@@ -1240,8 +1597,9 @@ class ReferenceRecord(LayerRecord):
         self._pureAlias = pureAlias
 
     def __getattr__(self, item):
-        # cache fields here, as long as they are not in exclude tuple
-        excludes=('groups',)#'exts')
+        # cache fields here, as long as they are not in exclude tuple; extents are replaced whenever the source's
+        #  geometry moves, so they are always read through.
+        excludes=('groups','cpuVerts','exts')
         attr= getattr(self.srcRecord,item)
         if not self._pureAlias and item not in excludes:
             setattr(self,item,attr)
@@ -1358,7 +1716,9 @@ class TextLayerRecord(LayerRecord):
 
     def loadStrings(self):
         """Load strings into VAO and VBO associated with the record."""
-        self._vCount = self.txtRenderer.loadStrings(self.vao,self.buff,self._strEntries,self.scale_x,self.scale_y)
+        # buffSize tracks the storage allocated to buff, so reloads can overwrite it in place.
+        self._vCount, self.buffSize = self.txtRenderer.loadStrings(self.vao, self.buff, self._strEntries, self.scale_x,
+                                                                   self.scale_y, self.buffSize)
 
     @property
     def vertCount(self):
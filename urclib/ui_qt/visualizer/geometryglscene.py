@@ -26,6 +26,19 @@ from .shaders import *
 POLY_GRAD_IND = IntEnum('POLY_GRAD_IND', 'VAL REF', start=0)
 DEFAULT_FONT = os.path.join(os.path.dirname(__file__),'Vera.ttf')
 DEFAULT_CHAR_POINT_SIZE = 8
+# draw buffer list for the offscreen framebuffer; built once rather than on every resize.
+_DRAW_BUFFERS_COLOR0 = np.array([GL_COLOR_ATTACHMENT0], dtype=np.uint32)
+# immutable texture storage requires a sized internal format; these match what drivers typically choose for the
+# unsized formats when passed to glTexImage*.
+_SIZED_TEX_FORMATS = {GL_RED: GL_R8,
+                      GL_RG: GL_RG8,
+                      GL_RGB: GL_RGB8,
+                      GL_BGR: GL_RGB8,
+                      GL_RGBA: GL_RGBA8,
+                      GL_BGRA: GL_RGBA8,
+                      }
+# scales an 8-bit channel value into the [0,1] color range.
+_INV255 = 1. / 255.
 
 # def dummyFn(*args): pass
 # noinspection PyMissingOrEmptyDocstring
@@ -96,6 +109,28 @@ class GeometryGLScene(object):
         fillWithGradient (bool,optional): If `True`, fill with contents of reference gradient values, if present.
     """
 
+    # Names of the draw methods for each record type; names rather than functions so subclass overrides are honored.
+    _DRAW_DISPATCH = {PolyLayerRecord: '_drawPolyLayer',
+                      PointLayerRecord: '_drawPointLayer',
+                      LineLayerRecord: '_drawLineLayer',
+                      RasterLayerRecord: '_drawRaster',
+                      RasterIndexLayerRecord: '_drawRaster',
+                      TextLayerRecord: '_drawTextLayer',
+                      }
+
+    # upload tag used for the identity matrix; never collides with _mvpGen, which only counts up from 0.
+    _IDENT_GEN = -1
+
+    # padding, in pixels, applied to the viewport when culling layers, to allow for features that are sized in pixels
+    # (points, thick lines) extending past their layer's extents.
+    _CULL_MARGIN_PX = 64
+
+    # number of rubberband vertex sets cycled through in the persistently mapped buffer; see _stageRubberBand().
+    _RB_SLOTS = 3
+
+    # most contiguous index runs _uploadIndexColorGroup() will upload separately before repacking the whole buffer.
+    _MAX_COLOR_RUNS = 64
+
     @staticmethod
     def getNextId():
         """Unique Id generator. Default implementation starts at 0 and increments by one on each call.
@@ -119,6 +154,11 @@ class GeometryGLScene(object):
         self.widget = widget
         self.refreshkey = refreshkey
         self.extentkey = getextKey
+        # nesting depth of batchRefresh() blocks, and whether a refresh was deferred by one or by grabContext().
+        self._refreshSuspended = 0
+        self._refreshPending = False
+        # nesting depth of grabContext() blocks; only the outermost one acquires and releases the host context.
+        self._ctxDepth = 0
 
         # user setable formatting options
         self.beginContextKey = kwargs.get('beginContextKey', '')
@@ -132,6 +172,9 @@ class GeometryGLScene(object):
         self._fillColor = kwargs.get('defaultPolygonColor', glm.vec4(0.8, 0.8, 0.8, 1))
         self._selectLineColor1 = kwargs.get('selectLineColor1', glm.vec4(1., 1.0, 0., 1.0))
         self._selectLineColor2 = kwargs.get('selectLineColor2', glm.vec4(0., .0, 0., 1.0))
+        # pointers into the selection line colors, for uniform uploads; see _selectLineColorsChanged().
+        self._selLinePtr1 = None
+        self._selLinePtr2 = None
         self._selectPolyColor1 = kwargs.get('selectPolyColor1', glm.vec4(1., 1.0, 0., 0.25))
         self._selectPolyColor2 = kwargs.get('selectPolyColor2', glm.vec4(0., .0, 0., 0.25))
         self._rbColor1 = kwargs.get('rubberbandColor1',glm.vec4(0.,0.,0.,1.))
@@ -151,8 +194,19 @@ class GeometryGLScene(object):
         if 'selectPolySingleColor' in kwargs:
             self._selectPolyColor1 = kwargs['selectPolySingleColor']
             self._selectPolyColor2 = kwargs['selectPolySingleColor']
+        self._sceneColorsChanged()
+        self._selectLineColorsChanged()
 
         self._initialized = False
+        # whether direct state access (GL 4.5+) entry points are available; determined in initializeGL().
+        self._hasDSA = False
+        # whether immutable texture storage (GL 4.2+) is available; determined in initializeGL().
+        self._hasTexStorage = False
+        # mirrors of frequently changed GL state, so that redundant calls can be skipped while drawing layers; see
+        # _resyncGLState().
+        self._blendEnabled = False
+        self._boundVao = None
+        self._activeTexUnit = None
         self._widthDominant = False
         self._aspectRatio = 1
         self._offs_ratio = 0
@@ -161,6 +215,13 @@ class GeometryGLScene(object):
         self._frameBuff = 0
         self._fbTex = 0
         self._fbRbo = 0
+        # allocated size of the framebuffer attachments, which may exceed the viewport; see _regenFramebuffer().
+        self._fbCapacity = (0, 0)
+        # framebuffer provided by the host for display; queried in resizeGL() rather than on every paint.
+        self._defaultFBO = 0
+        # sync object marking the end of the most recently submitted frame; see waitFrame().
+        self._lastFence = None
+        self._eLeft = self._eRight = self._eBottom = self._eTop = None
         self.SetExtents(-1, 1, -1, 1)
         self._identMat = glm.mat4(1.)
         self._viewMat = glm.mat4(1.)
@@ -168,24 +229,84 @@ class GeometryGLScene(object):
         self._zoomMat = glm.mat4(1.)
         self._mvpMat = glm.mat4(1.)
         self._txtTransMat = glm.mat4(1.)
+        # cached pointers for uniform uploads; refreshed whenever the matrices are replaced.
+        self._mvpPtr = glm.value_ptr(self._mvpMat)
+        self._identPtr = glm.value_ptr(self._identMat)
+        # incremented whenever _mvpMat changes, so programs already holding the current matrix can skip uploads.
+        self._mvpGen = 0
         self.rb_p2 = None
         self.rb_p1 = None
         self._zoomLevel=0
-        self._mvpInvMat = glm.inverse(self._mvpMat)
+        # inverse of _mvpMat, built on demand; see _inverseMVP().
+        self._mvpInvMat = None
+        # numpy copies of _mvpMat and its inverse for the batched point conversions, built on demand.
+        self._mvpArr = None
+        self._mvpInvArr = None
+        # product of the zoom and projection matrices, which change far less often than the view; see _updateMVP().
+        self._zoomOrthoMat = None
 
         self._drawStack = []
+        # cached (record, draw function) pairs, in paint order; rebuilt whenever _drawStack changes.
+        self._drawOrder = None
+        # layer id to index within _drawStack; see _drawStackIndex().
+        self._drawStackPos = None
+        # keyed by id rather than indexed: ids come from the class-wide getNextId(), so any one scene holds a sparse
+        # subset of them, and ids are never reused, so a stale id raises KeyError instead of reaching another layer.
         self._layers = {}
+        # identifier colors per layer id, reused across picks; see _recordIdColors().
+        self._idColorCache = {}
         self._pointLayerIds = set()
         self._polyLayerIds = set()
         self._lineLayerIds = set()
         self._rasterLayerIds = set()
+        # union of the four sets above, kept alongside them.
+        self._allLayerIds = set()
+        # exact record type -> id set; see _typeSetForRec().
+        self._typeSetMap = {PolyLayerRecord: self._polyLayerIds,
+                            PointLayerRecord: self._pointLayerIds,
+                            LineLayerRecord: self._lineLayerIds,
+                            RasterLayerRecord: self._rasterLayerIds,
+                            RasterIndexLayerRecord: self._rasterLayerIds,
+                            }
         self._weakRefIds = set()
 
         self._gFillVao = 0
         self._gFillBuff = 0
+        # vertex array shared by every raster quad, and the texture coordinates it sources; see _drawRaster().
+        self._rasterVao = 0
+        self._rasterTexBuff = 0
+        # staging buffer for 2D texture uploads; see _stagePixels().
+        self._unpackBuff = 0
+        # pack buffer that dumpTexToStream() reads textures back through, and its allocated size in bytes.
+        self._texDumpPbo = 0
+        self._texDumpPboSize = 0
+        # shared array buffers that layer vertex data is suballocated from, keyed by usage; see vertexBufferPool().
+        self._vertPools = {}
 
         self._rbVao = 0
         self._rbBuff = 0
+        # uniform buffer holding the scene-wide colors; see _uploadSceneColors().
+        self._colorsUbo = 0
+        # uniform buffer holding the MVP matrix and viewport resolution; see _uploadSceneView().
+        self._viewUbo = 0
+        self._viewBlock = np.zeros(20, dtype=np.float32)
+        self._viewResolution = (1., 1.)
+        self._sceneViewDirty = True
+        # reusable targets for small state queries, so that they don't need to be allocated on each call.
+        self._scratchI32 = np.empty(4, np.int32)
+        # (texMode, internal, width, height, channels) each texture's storage was last defined with; see _LoadTexture().
+        self._texDims = {}
+        # numpy view of the persistently mapped rubberband vertices, one row per slot, if supported.
+        self._rbMapped = None
+        # rubberband vertices waiting to be copied into a slot, the slot drawn most recently, and a fence per slot
+        # marking the last draw that read it.
+        self._rbPending = None
+        self._rbSlot = 0
+        self._rbFences = [None] * GeometryGLScene._RB_SLOTS
+        # rubberband corner vertices, rewritten in place by updateRubberBand().
+        self._rbVerts = np.zeros(8, dtype=np.float32)
+        # gradient colors staged for upload by SetGradientTexture().
+        self._gradStrip = np.empty(64 * 4, dtype=np.float32)
 
         # self._atlasVao = 0
         self._stringBuff = 0
@@ -209,6 +330,10 @@ class GeometryGLScene(object):
 
         """
 
+        # DSA is only core in 4.5; the shaders themselves only require 4.3, so fall back when it's missing.
+        self._hasDSA = bool(glNamedBufferSubData) and bool(glNamedBufferStorage)
+        self._hasTexStorage = bool(glTexStorage1D) and bool(glTexStorage2D)
+
         # for shader functions that use pds set to finest
         glHint(GL_FRAGMENT_SHADER_DERIVATIVE_HINT,GL_NICEST)
         # Set the clear color to white.
@@ -224,27 +349,86 @@ class GeometryGLScene(object):
 
         # load default shader and shader mappings
         self._progMgr = ShaderProgMgr()
+        # the reference fills are specialized on whether a custom gradient is applied, rather than branching on it.
+        for progName in ('refColorTex', 'refColorVal'):
+            for useGrad in (0, 1):
+                self._progMgr.loadVariant(progName, f'{progName}_cg{useGrad}', {'CUSTOM_GRADIENT': useGrad})
+        # line picking sources identifier colors from a per-instance attribute instead of uniforms.
+        self._progMgr.loadVariant('thickline', 'thickline_pick', {'PICK_COLORS': 1})
 
         # build fill geometry to use for poly rendering
         self._gFillVao, self._rbVao=glGenVertexArrays(2)
         self._gFillBuff, self._rbBuff = glGenBuffers(2)
         fillVerts = np.array([-1., 1., -1., -1., 1., 1., 1., -1.], dtype=np.float32)
-        self._LoadGLBuffer(fillVerts, None, LayerRecord(-1, self._gFillVao, self._gFillBuff, 4))
+        glBindVertexArray(self._gFillVao)
+        glBindBuffer(GL_ARRAY_BUFFER, self._gFillBuff)
+        glBufferData(GL_ARRAY_BUFFER, fillVerts.nbytes, fillVerts, GL_STATIC_DRAW)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, None)
+
+        # every raster is drawn as a quad with the same layout and texture coordinates, so one vertex array serves
+        # them all; only the position buffer binding changes between rasters.
+        self._rasterVao = glGenVertexArrays(1)
+        self._rasterTexBuff = glGenBuffers(1)
+        texCoords = np.array([0., 0.,
+                              0., 1.,
+                              1., 1.,
+                              1., 0., ], dtype=np.float32)
+        glBindVertexArray(self._rasterVao)
+        glBindBuffer(GL_ARRAY_BUFFER, self._rasterTexBuff)
+        glBufferData(GL_ARRAY_BUFFER, texCoords.nbytes, texCoords, GL_STATIC_DRAW)
+        glVertexAttribFormat(0, 2, GL_FLOAT, GL_FALSE, 0)
+        glVertexAttribBinding(0, 0)
+        glEnableVertexAttribArray(0)
+        glVertexAttribFormat(1, 2, GL_FLOAT, GL_FALSE, 0)
+        glVertexAttribBinding(1, 1)
+        glEnableVertexAttribArray(1)
+        glBindVertexBuffer(1, self._rasterTexBuff, 0, 2 * np.dtype(np.float32).itemsize)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
         # initialize rubberband data
         glBindVertexArray(self._rbVao)
         glBindBuffer(GL_ARRAY_BUFFER, self._rbBuff)
         glEnableVertexAttribArray(0)
         glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, None)
-        glBufferData(GL_ARRAY_BUFFER, 32, None, GL_DYNAMIC_DRAW)
+        if bool(glBufferStorage):
+            # keep the buffer mapped for its lifetime; rubberband updates then become plain writes into mapped memory.
+            # Writes go to the slot after the one last drawn, so they never touch vertices the GPU may still be reading.
+            mapFlags = GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT
+            rbBytes = 32 * GeometryGLScene._RB_SLOTS
+            glBufferStorage(GL_ARRAY_BUFFER, rbBytes, None, mapFlags)
+            ptr = glMapBufferRange(GL_ARRAY_BUFFER, 0, rbBytes, mapFlags)
+            self._rbMapped = np.ctypeslib.as_array((ctypes.c_float * (8 * GeometryGLScene._RB_SLOTS)).from_address(ptr))
+            self._rbMapped = self._rbMapped.reshape([GeometryGLScene._RB_SLOTS, 8])
+            self._rbSlot = 0
+        else:
+            glBufferData(GL_ARRAY_BUFFER, 32, None, GL_DYNAMIC_DRAW)
         glBindVertexArray(0)
 
+        # scene-wide colors are shared by several programs through a single uniform buffer.
+        self._colorsUbo = glGenBuffers(1)
+        glBindBuffer(GL_UNIFORM_BUFFER, self._colorsUbo)
+        glBufferData(GL_UNIFORM_BUFFER, 5 * 16, None, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_UNIFORM_BUFFER, 0)
+        glBindBufferBase(GL_UNIFORM_BUFFER, SCENE_COLORS_BINDING, self._colorsUbo)
+        self._sceneColorsDirty = True
+
+        # likewise for the view matrix and resolution, which would otherwise be loaded into each program separately.
+        self._viewUbo = glGenBuffers(1)
+        glBindBuffer(GL_UNIFORM_BUFFER, self._viewUbo)
+        glBufferData(GL_UNIFORM_BUFFER, self._viewBlock.nbytes, None, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_UNIFORM_BUFFER, 0)
+        glBindBufferBase(GL_UNIFORM_BUFFER, SCENE_VIEW_BINDING, self._viewUbo)
+        self._sceneViewDirty = True
+
         # grab any desired default values from any desired program
         # tmp = np.zeros([1], dtype=np.float32)
         # self._progMgr.useProgram('thickline')
         # glGetUniformfv(self._progMgr.shaderProgram, self._progMgr['width'], tmp)
         # self._selLineWidth = tmp[0]
 
+        self._defaultFBO = int(glGetIntegerv(GL_FRAMEBUFFER_BINDING))
+
         # Set initialized here so caches will be applied
         self._initialized = True
 
@@ -272,7 +456,7 @@ class GeometryGLScene(object):
         with self.grabContext():
             # sampler indices shouldn't change, so just set them here
             self._progMgr.useProgram('text')
-            glUniform1i(self._progMgr['textAtlas'], 3)
+            self._progMgr.setUniform1i('textAtlas', 3)
             self._progMgr.useProgram()
 
             self._updateMVP()
@@ -289,23 +473,84 @@ class GeometryGLScene(object):
             getattr(self.widget, self.endContextKey)()
 
     def _doRefresh(self):
-        """Call the widget's refresh function."""
+        """Call the widget's refresh function, or defer the call if inside a `batchRefresh()` or `grabContext()`
+        block."""
+        if self._refreshSuspended > 0 or self._ctxDepth > 0:
+            self._refreshPending = True
+            return
         getattr(self.widget, self.refreshkey, dummyFn)()
 
+    def _flushDeferredRefresh(self):
+        """Issue a refresh deferred by `_doRefresh()`, once no enclosing block is left to defer it further."""
+        if self._refreshPending and self._refreshSuspended == 0 and self._ctxDepth == 0:
+            self._refreshPending = False
+            self._doRefresh()
+
+    def flushRefresh(self):
+        """Issue any deferred refresh immediately, even from within a `batchRefresh()` or `grabContext()` block.
+
+        Intended for callers that need the widget to reflect changes made so far in the block.
+        """
+        if self._refreshPending:
+            self._refreshPending = False
+            getattr(self.widget, self.refreshkey, dummyFn)()
+
+    @contextmanager
+    def batchRefresh(self):
+        """Context for combining several scene changes into a single widget refresh.
+
+        Refreshes requested within the block are deferred, and issued once when the outermost block exits.
+
+        Yields:
+            None
+        """
+
+        self._refreshSuspended += 1
+        try:
+            yield
+        finally:
+            self._refreshSuspended -= 1
+            self._flushDeferredRefresh()
+
     @contextmanager
     def grabContext(self):
         """Method used as context for easily grabbing and releasing the host system's draw context.
 
+        Blocks may be nested; inner blocks reuse the context acquired by the outermost one rather than making it
+        current again.
+
         Yields:
             None
         """
 
-        self._beginContext()
+        if self._ctxDepth == 0:
+            self._beginContext()
+            if self._initialized:
+                # the host may have used the context since it was last ours.
+                self._progMgr.invalidateBinding()
+        self._ctxDepth += 1
         try:
             # return nothing; context is host-code specific
             yield
         finally:
-            self._endContext()
+            self._ctxDepth -= 1
+            if self._ctxDepth == 0:
+                self._endContext()
+                self._flushDeferredRefresh()
+
+    @contextmanager
+    def batch(self):
+        """Context for a run of scene edits, such as several `updateIndexColor()` calls in a row.
+
+        The host context is acquired once for the whole block, and any refreshes requested within it are combined
+        into one; see `grabContext()` and `batchRefresh()`.
+
+        Yields:
+            None
+        """
+
+        with self.grabContext(), self.batchRefresh():
+            yield
 
     def GetGLExtents(self):
         """Get the extents of the OpenGL canvas.
@@ -319,8 +564,14 @@ class GeometryGLScene(object):
 
     # <editor-fold desc="Draw Functions">
     @staticmethod
-    def _drawThickLineGL(start, count):
-        glDrawArrays(GL_LINE_STRIP_ADJACENCY, start,count)
+    def _multiDrawThickLinesGL(firsts, counts):
+        glMultiDrawArrays(GL_LINE_STRIP_ADJACENCY, firsts, counts, len(counts))
+
+    @staticmethod
+    def _drawIndirectLinesGL(indirectBuff, cmdCount):
+        glBindBuffer(GL_DRAW_INDIRECT_BUFFER, indirectBuff)
+        glMultiDrawArraysIndirect(GL_LINE_STRIP_ADJACENCY, ctypes.c_void_p(0), cmdCount, 0)
+        glBindBuffer(GL_DRAW_INDIRECT_BUFFER, 0)
 
     def paintGL(self):
         """Method responsible for applying draw instructions to the OpenGL state machine."""
@@ -329,80 +580,63 @@ class GeometryGLScene(object):
 
             # set the viewport here to ensure that the values are maintained.
             glViewport(*self._dims)
+            self._resyncGLState()
+
+            if self._sceneColorsDirty:
+                self._uploadSceneColors()
+            if self._sceneViewDirty:
+                self._uploadSceneView()
 
             if self._fullRefresh:
-                existBuffer = np.empty([1], np.int32)
-                glGetIntegerv(GL_FRAMEBUFFER_BINDING, existBuffer)
                 glBindFramebuffer(GL_FRAMEBUFFER, self._frameBuff)
 
-
-                # cache directly referenced shader programs
-                simpleProg = self._progMgr.progLookup('simple')
-                refColorTexProg = self._progMgr.progLookup('refColorTex')
+                if self._drawOrder is None:
+                    self._rebuildDrawOrder()
 
                 # clear the color, depth, and stencil buffers.
                 glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT | GL_STENCIL_BUFFER_BIT)
                 glViewport(*self._dims)
-                # populate programs with matrix
-                for progName in ('thickline','refline'):
-                    self._progMgr.useProgram(progName)
-                    glUniformMatrix4fv(self._progMgr['mvpMat'], 1, GL_FALSE, glm.value_ptr(self._mvpMat))
                 # # load and assign base shader program.
                 # if self._gradientGrid and not self.refTex:
                 #     self._gradientGrid = False
                 #     # fall back to solid fill
                 #     self._fillGrid = True
 
-                # load and assign base shader program.
-                self._progMgr.useProgramDirectly(refColorTexProg)
-                glUniformMatrix4fv(self._progMgr['mvpMat'], 1, GL_FALSE, glm.value_ptr(self._mvpMat))
-                self._progMgr.useProgramDirectly(simpleProg)
-                glUniformMatrix4fv(self._progMgr['mvpMat'], 1, GL_FALSE, glm.value_ptr(self._mvpMat))
-
-                self._progMgr.useProgram()
-                lastProg = self._progMgr.shaderProgram
+                view = self._cullExtents()
 
-                for rec in reversed(self._drawStack):
+                # Each draw function activates the programs it needs, so no program is bound ahead of time here.
+                for rec, drawFn in self._drawOrder:
 
-                    theType = type(rec)
-                    if theType == ReferenceRecord:
-                        theType = type(rec.srcRecord)
-                    self._UpdateSelections(rec.id)
-                    if theType == PolyLayerRecord:
-                        baseProg = simpleProg if rec.fillMode != POLY_FILL.TEX_REF else refColorTexProg
-                        if baseProg != lastProg:
-                            self._progMgr.useProgramDirectly(baseProg)
-                            lastProg = baseProg
-                        self._drawPolyLayer(rec)
-                    elif theType == PointLayerRecord:
-                        self._drawPointLayer(rec)
-                    elif theType == LineLayerRecord:
-                        self._drawLineLayer(rec)
-                    elif theType in (RasterLayerRecord,RasterIndexLayerRecord):
-                        self._drawRaster(rec)
-                    elif theType == TextLayerRecord:
-                        self._drawTextLayer(rec)
+                    if drawFn is not None and GeometryGLScene._extsInView(rec.exts, view):
+                        drawFn(rec)
 
                     if rec.labelLayer >= 0:
                         self._drawTextLayer(self._layers[rec.labelLayer])
 
-                glBindFramebuffer(GL_FRAMEBUFFER, existBuffer[0])
+                # the draw functions leave blending as they needed it, so that it is only toggled between layers
+                # that differ; restore the default here.
+                self._setBlend(False)
+                glBindFramebuffer(GL_FRAMEBUFFER, self._defaultFBO)
 
                 # draw Axes if available
                 # self._drawAxes()
                 self._fullRefresh = False
 
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT | GL_STENCIL_BUFFER_BIT)
-            glBindVertexArray(self._gFillVao)
+            self._bindVao(self._gFillVao)
             self._progMgr.useProgram('fbBlit')
-            glActiveTexture(GL_TEXTURE0)
+            self._setActiveTexture(GL_TEXTURE0)
             glBindTexture(GL_TEXTURE_2D, self._fbTex)
             glDrawArrays(GL_TRIANGLE_STRIP, 0, 4)
 
             if self.drawRubberBand and self.rb_p1 is not None and self.rb_p2 is not None:
                 self._progMgr.useProgram('rubberBand')
-                glBindVertexArray(self._rbVao)
-                glDrawArrays(GL_LINE_LOOP, 0, 4)
+                self._bindVao(self._rbVao)
+                glDrawArrays(GL_LINE_LOOP, self._stageRubberBand(), 4)
+                if self._rbMapped is not None:
+                    if self._rbFences[self._rbSlot] is not None:
+                        glDeleteSync(self._rbFences[self._rbSlot])
+                    self._rbFences[self._rbSlot] = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
 
             # Clear active shader program.
             self._progMgr.useProgram()
@@ -412,162 +646,384 @@ class GeometryGLScene(object):
             if err != 0:
                 raise GaiaGLException(format(err))
 
-            glFinish()
+            # Rather than stalling until the GPU drains, mark the end of the frame; hosts that need the finished
+            # frame (for instance, when capturing the display) can block on it with waitFrame().
+            self._fenceFrame()
 
-    def _drawPolyLayer(self, rec, pickMode=False):
+    def _stageRubberBand(self):
+        """Copy any pending rubberband vertices into the next slot of the mapped ring, waiting only if the GPU has
+        yet to finish the draw that last read that slot.
+
+        Returns:
+            int: The index of the first rubberband vertex to draw.
+        """
+
+        if self._rbMapped is None:
+            # updateRubberBand() writes straight to the start of the unmapped buffer.
+            return 0
+        if self._rbPending is not None:
+            slot = (self._rbSlot + 1) % GeometryGLScene._RB_SLOTS
+            fence = self._rbFences[slot]
+            if fence is not None:
+                glClientWaitSync(fence, GL_SYNC_FLUSH_COMMANDS_BIT, 1000000000)
+                glDeleteSync(fence)
+                self._rbFences[slot] = None
+            self._rbMapped[slot] = self._rbPending
+            self._rbSlot = slot
+            self._rbPending = None
+        return self._rbSlot * 4
+
+    def _releaseRubberBandFences(self):
+        """Delete any outstanding rubberband slot fences."""
+
+        for i, fence in enumerate(self._rbFences):
+            if fence is not None:
+                glDeleteSync(fence)
+                self._rbFences[i] = None
+
+    def _fenceFrame(self):
+        """Replace the end-of-frame fence with one following the commands submitted so far."""
+
+        if self._lastFence is not None:
+            glDeleteSync(self._lastFence)
+        self._lastFence = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+
+    def waitFrame(self, timeout=1000000000):
+        """Block until the commands of the most recently painted frame have been completed by the GPU.
+
+        Args:
+            timeout (int): The maximum amount of time to wait, in nanoseconds.
+
+        Returns:
+            bool: `True` if the frame is complete (or no frame has been painted), `False` if the wait timed out.
+        """
+
+        if self._lastFence is None:
+            return True
+        with self.grabContext():
+            result = glClientWaitSync(self._lastFence, GL_SYNC_FLUSH_COMMANDS_BIT, int(timeout))
+        return result in (GL_ALREADY_SIGNALED, GL_CONDITION_SATISFIED)
+
+    def _cullExtents(self):
+        """Find the region of the scene covered by the viewport; layers falling entirely outside of it are skipped.
+
+        Returns:
+            tuple: The left, right, bottom, and top extents of the viewport in scene space, padded by
+              `_CULL_MARGIN_PX` pixels.
+        """
+
+        invMat = self._inverseMVP()
+        lb = invMat * glm.vec4(-1., -1., 0., 1.)
+        rt = invMat * glm.vec4(1., 1., 0., 1.)
+        left, right = min(lb.x, rt.x), max(lb.x, rt.x)
+        bottom, top = min(lb.y, rt.y), max(lb.y, rt.y)
+
+        padX = (right - left) * GeometryGLScene._CULL_MARGIN_PX / max(self._dims[2], 1)
+        padY = (top - bottom) * GeometryGLScene._CULL_MARGIN_PX / max(self._dims[3], 1)
+        return left - padX, right + padX, bottom - padY, top + padY
+
+    @staticmethod
+    def _extsInView(exts, view):
+        """Test whether a layer's extents overlap the culling region.
+
+        Args:
+            exts (list): The left, right, bottom, and top extents of the layer, or `None` if unknown. References
+              report the extents of their source record.
+            view (tuple): The culling region, as returned by `_cullExtents()`.
+
+        Returns:
+            bool: `True` if the layer should be drawn.
+        """
+
+        if exts is None:
+            return True
+        viewL, viewR, viewB, viewT = view
+        return exts[1] >= viewL and exts[0] <= viewR and exts[3] >= viewB and exts[2] <= viewT
+
+    def _resyncGLState(self):
+        """Reset the mirrored GL state to known values.
+
+        The host (and the loading methods) may change the state between draws, so this should be called at the start
+        of any pass that relies on the mirrors.
+        """
+
+        self._setBlend(False, True)
+        self._boundVao = None
+        self._activeTexUnit = None
+        self._progMgr.invalidateBinding()
+
+    def _bindVao(self, vao):
+        """Bind a vertex array object, unless it is already bound.
+
+        Args:
+            vao (int): The vertex array object to bind.
+        """
+
+        if vao != self._boundVao:
+            glBindVertexArray(vao)
+            self._boundVao = vao
+
+    def _setActiveTexture(self, unit):
+        """Select the active texture unit, unless it is already selected.
+
+        Args:
+            unit (int): The texture unit to activate (ie `GL_TEXTURE0`).
+        """
+
+        if unit != self._activeTexUnit:
+            glActiveTexture(unit)
+            self._activeTexUnit = unit
+
+    def _setBlend(self, enable, force=False):
+        """Enable or disable blending, skipping the call if the state would not change.
+
+        Args:
+            enable (bool): Whether blending should be enabled.
+            force (bool,optional): If `True`, issue the call regardless of the recorded state; use when the GL state
+              may have been modified outside of this object.
+        """
+
+        if force or enable != self._blendEnabled:
+            if enable:
+                glEnable(GL_BLEND)
+            else:
+                glDisable(GL_BLEND)
+            self._blendEnabled = enable
+
+    def _setMVP(self):
+        """Load the current MVP matrix into the active program, unless it already holds it."""
+        self._progMgr.setMvpMatrix(self._mvpPtr, self._mvpGen)
+
+    def _setIdentMVP(self):
+        """Load the identity matrix into the active program's MVP uniform, unless it already holds it."""
+        self._progMgr.setMvpMatrix(self._identPtr, GeometryGLScene._IDENT_GEN)
+
+    def _resolveDrawRecord(self, rec):
+        """Find the draw method appropriate for a layer record.
+
+        Args:
+            rec (LayerRecord): The record to resolve; ReferenceRecords are drawn as their source record's type.
+
+        Returns:
+            callable or None: The bound draw method, or `None` if `rec` is not a drawable type.
+        """
+
+        srcRec = rec.srcRecord if type(rec) == ReferenceRecord else rec
+        fnName = self._DRAW_DISPATCH.get(type(srcRec))
+        return getattr(self, fnName) if fnName is not None else None
+
+    def _rebuildDrawOrder(self):
+        """Rebuild the cached paint order from the draw stack.
+
+        Layers are composited in stack order, so the order itself is preserved; what is cached is the resolved draw
+        method for each record, which removes per-frame type dispatch from `paintGL()`.
+        """
+
+        self._drawOrder = [(rec, self._resolveDrawRecord(rec)) for rec in reversed(self._drawStack)]
+
+    def _drawStackIndex(self, rec):
+        """Look up the position of a record within the draw stack.
 
-        # TODO: Reconfigure to use glMultiDrawArrays.
+        Positions are kept in a table that adjacent swaps update in place; any other change to the stack discards
+        the table, and it is rebuilt here on the next lookup.
+
+        Args:
+            rec (LayerRecord): The record to locate.
+
+        Returns:
+            int: The index of `rec` within the draw stack.
+
+        Raises:
+            ValueError: If `rec` is not in the draw stack.
+        """
+
+        if self._drawStackPos is None:
+            self._drawStackPos = {r.id: i for i, r in enumerate(self._drawStack)}
+        loc = self._drawStackPos.get(rec.id)
+        if loc is None:
+            raise ValueError('Record {} is not in the draw stack.'.format(rec.id))
+        return loc
+
+    def _swapDrawStack(self, loc, nextLoc):
+        """Exchange two adjacent entries of the draw stack, keeping the position table current.
+
+        Args:
+            loc (int): Index of the first entry.
+            nextLoc (int): Index of the second entry.
+        """
+
+        stack = self._drawStack
+        stack[loc], stack[nextLoc] = stack[nextLoc], stack[loc]
+        self._drawStackPos[stack[loc].id] = loc
+        self._drawStackPos[stack[nextLoc].id] = nextLoc
+        self._drawOrder = None
+
+    def _drawPolyLayer(self, rec, pickMode=False):
 
         #  Fill polygons
         # Since the polys are all 2D, we can use a neat trick with the
         # stencil buffer to properly fill the polygons without requiring tessallation.
 
         if rec.draw and len(rec.groups) > 0:
-            if not pickMode:
-                glEnable(GL_BLEND)
-            # fill
-            # if self._polyColors is None:
+            self._setBlend(not pickMode)
+
+            # Everything below is decided once per layer; only the per-polygon values (fill color, reference value,
+            # stencil) are touched inside the polygon loop.
+            doFill = rec.fillGrid and (
+                    self._fillGrid or self._fillSelect or rec.fillMode == POLY_FILL.TEX_REF) or pickMode
+            doOutline = not pickMode and rec.drawGrid
+            texFill = rec.fillMode == POLY_FILL.TEX_REF and rec.refTex != 0
+            valFill = not texFill and rec.attrVals is not None and rec.fillMode == POLY_FILL.VAL_REF
+            drawFillQuad = pickMode or self._fillGrid or rec.fillMode == POLY_FILL.TEX_REF
+            drawSelFill = not pickMode and self._fillSelect
+            thinOutline = rec.line_thickness == 1
+            if texFill:
+                fillProg = 'refColorTex_cg1' if rec.customGradTexes[POLY_GRAD_IND.REF] != 0 else 'refColorTex_cg0'
+            else:
+                fillProg = 'refColorVal_cg1' if rec.customGradTexes[POLY_GRAD_IND.VAL] != 0 else 'refColorVal_cg0'
+            # identifier colors for every polygon, generated once rather than per polygon or per pick.
+            pickColors = self._recordIdColors(rec.id, len(rec.groups)) if pickMode else None
+
+            if doFill:
+                # Uniform values persist within their programs, so load the invariant ones up front.
+                if texFill:
+                    self._progMgr.useProgram(fillProg)
+                    glBindTextures(0, 2, [rec.refTex, rec.customGradTexes[POLY_GRAD_IND.REF]])
+                elif valFill:
+                    self._progMgr.useProgram(fillProg)
+                    self._setIdentMVP()
+                if drawSelFill and rec.selectedRecs.any():
+                    self._progMgr.useProgram('selectPoly')
+                    self._setIdentMVP()
+                if not doOutline:
+                    glEnable(GL_STENCIL_TEST)
+
+            if doOutline and not thinOutline:
+                self._progMgr.useProgram('thickline')
+                self._progMgr.setUniform1f('width', rec.line_thickness)
+                self._progMgr.setUniform4fv('inColor1', rec.gridColor)
+                self._progMgr.setUniform4fv('inColor2', rec.gridColor)
+            outlineProg = self._progMgr.progLookup('simple' if thinOutline else 'thickline')
+            self._bindVao(rec.vao)
+
+            if doOutline and not doFill:
+                # nothing else touches the program or VAO, so bind them once for the whole layer.
+                self._progMgr.useProgramDirectly(outlineProg)
+                if thinOutline:
+                    self._setMVP()
+                    self._progMgr.setUniform4fv('inColor', rec.gridColor)
 
             for c, poly in enumerate(rec.groups):
 
-                if rec.fillGrid and (
-                        self._fillGrid or self._fillSelect or rec.fillMode == POLY_FILL.TEX_REF) or pickMode:
+                selFill = drawSelFill and rec.selectedRecs[c] == 1
+                # nothing would be colored through the stencil, so don't bother building it.
+                if doFill and (drawFillQuad or selFill):
 
                     # load and assign base shader program.
                     self._progMgr.useProgram('simple')
-                    glUniformMatrix4fv(self._progMgr['mvpMat'], 1, GL_FALSE, glm.value_ptr(self._mvpMat))
+                    self._setMVP()
 
-                    # activate the stencil buffer and tell it to toggle between 1 and 0 every time a pixel is hit.
-                    glEnable(GL_STENCIL_TEST)
-                    glStencilOp(GL_INVERT, GL_INVERT, GL_INVERT)
+                    if doOutline:
+                        glEnable(GL_STENCIL_TEST)
 
-                    if pickMode or rec.fillMode != POLY_FILL.TEX_REF or rec.refTex == 0:
-                        self._assignPolyFillColor(pickMode, rec, c)
+                    if pickMode or not texFill:
+                        self._assignPolyFillColor(pickMode, rec, c, pickColors)
 
-                    glBindVertexArray(rec.vao)
+                    self._bindVao(rec.vao)
 
-                    # prep the stencil buffer for writing, and disable the color buffer.
+                    # prep the stencil buffer for writing, and disable the color buffer. Tell the stencil to toggle
+                    # between 1 and 0 every time a pixel is hit.
                     glColorMask(GL_FALSE, GL_FALSE, GL_FALSE, GL_FALSE)
                     glStencilFunc(GL_ALWAYS, 1, 1)
+                    glStencilOp(GL_INVERT, GL_INVERT, GL_INVERT)
 
                     # Render to the stencil buffer, creating a "stencil" for use with filling the polygon.
-                    for ring in poly:
-                        glDrawArrays(GL_TRIANGLE_FAN, ring[0],ring[1]-2)
+                    glMultiDrawArrays(GL_TRIANGLE_FAN, rec.ringFirsts[c], rec.fanCounts[c], len(poly))
 
                     # Enable the color buffer, change the stencil buffer to read only, and load the geometry to use in fill
                     # operations.
                     glColorMask(GL_TRUE, GL_TRUE, GL_TRUE, GL_TRUE)
                     glStencilFunc(GL_EQUAL, 1, 1)
-                    glStencilOp(GL_ZERO, GL_KEEP, GL_KEEP)
-
-                    if rec.fillMode != POLY_FILL.TEX_REF or rec.refTex == 0:
-                        mLoc = self._progMgr['mvpMat']
-
-                        if rec.attrVals is not None and rec.fillMode == POLY_FILL.VAL_REF:  # and rec.useFillAttrVals:
-                            self._progMgr.useProgram('refColorVal')
-                            glUniform1f(self._progMgr['refValue'], rec.attrVals[c])
-                            mLoc = self._progMgr['mvpMat']
-                            if rec.customGradTexes[POLY_GRAD_IND.VAL] != 0:
-                                glUniform1i(self._progMgr['customGradient'], 1)
-                            else:
-                                glUniform1i(self._progMgr['customGradient'], 0)
-                        glBindVertexArray(self._gFillVao)
-                        glUniformMatrix4fv(mLoc, 1, GL_FALSE, glm.value_ptr(self._identMat))
-
-                    else:
-                        glBindVertexArray(rec.refVao)
-                        self._progMgr.useProgram('refColorTex')
-                        glBindTextures(0, 2, [rec.refTex, rec.customGradTexes[POLY_GRAD_IND.REF]])
-                        glUniformMatrix4fv(self._progMgr['mvpMat'], 1, GL_FALSE, glm.value_ptr(self._mvpMat))
-
-                        if rec.customGradTexes[POLY_GRAD_IND.REF] != 0:
-                            glUniform1i(self._progMgr['customGradient'], 1)
-                        else:
-                            glUniform1i(self._progMgr['customGradient'], 0)
+                    # The last full screen pass zeroes the stencil as it fills, which leaves the stencil buffer clean
+                    # for the next polygon without clearing it. The reference fills may discard fragments (or, for
+                    # textures, cover only part of the screen), so if one of those is last, clear explicitly instead.
+                    clearStencil = not selFill and (texFill or valFill)
+                    glStencilOp(GL_ZERO, GL_KEEP, GL_KEEP if selFill or clearStencil else GL_ZERO)
 
                     # use a piece of geometry that covers the entire screen, and fill with the polygon's assigned color.
                     # The previously created stencil will only allow the color to be applied within the boundaries of the
                     # polygon.
-                    if pickMode or self._fillGrid or rec.fillMode == POLY_FILL.TEX_REF:
+                    if drawFillQuad:
+                        if texFill:
+                            self._bindVao(rec.refVao)
+                            self._progMgr.useProgram(fillProg)
+                        else:
+                            self._bindVao(self._gFillVao)
+                            if valFill:
+                                self._progMgr.useProgram(fillProg)
+                                self._progMgr.setUniform1f('refValue', rec.attrVals[c])
+                            else:
+                                self._setIdentMVP()
                         glDrawArrays(GL_TRIANGLE_STRIP, 0, 4)
 
-                    if not pickMode and self._fillSelect and rec.selectedRecs[c] == 1:
-                        glEnable(GL_BLEND)
+                    if selFill:
+                        self._bindVao(self._gFillVao)
                         self._progMgr.useProgram('selectPoly')
-                        glUniformMatrix4fv(self._progMgr['mvpMat'], 1, GL_FALSE, glm.value_ptr(self._identMat))
-                        glUniform4fv(self._progMgr['inColor1'], 1, glm.value_ptr(self._selectPolyColor1))
-                        glUniform4fv(self._progMgr['inColor2'], 1, glm.value_ptr(self._selectPolyColor2))
+                        glStencilOp(GL_ZERO, GL_KEEP, GL_ZERO)
                         glDrawArrays(GL_TRIANGLE_STRIP, 0, 4)
 
-                    self._progMgr.useProgram('simple')
-
-                    # Reset transformations and clear the stencil buffer for the next polygon to be rendered.
-
-                    glUniformMatrix4fv(self._progMgr['mvpMat'], 1, GL_FALSE, glm.value_ptr(self._mvpMat))
-                    glClear(GL_STENCIL_BUFFER_BIT)
-                    glDisable(GL_STENCIL_TEST)
+                    if clearStencil:
+                        # clear the stencil buffer for the next polygon to be rendered.
+                        glClear(GL_STENCIL_BUFFER_BIT)
+                    if doOutline:
+                        glDisable(GL_STENCIL_TEST)
 
                 # DO Polygon outlines
                 # Uses line loops to draw polygon rings; very straightforward.
                 # Note that glLineWidth is deprecated, and does not work for a number
                 # of implementations. Best way to handle would be to use a geometry shader to convert
                 # lines from to triangle strips.
-                if not pickMode and rec.drawGrid:
-
-                    glBindVertexArray(rec.vao)
-
-                    # if rec.selectedRecs[c]==0:
-                    if rec.line_thickness == 1:
-                        self._progMgr.useProgram('simple')
-                        glUniform4fv(self._progMgr['inColor'], 1, glm.value_ptr(rec.gridColor))
-                        for ring in poly:
-                            # keep as line strip to avoid issues with gradObj lines
-                            glDrawArrays(GL_LINE_STRIP_ADJACENCY, *ring)
+                if doOutline:
+
+                    if doFill:
+                        # the fill pass above swapped out the VAO and program; restore them.
+                        self._bindVao(rec.vao)
+                        self._progMgr.useProgramDirectly(outlineProg)
+                        if thinOutline:
+                            # the simple program's matrix and color were replaced by the fill pass.
+                            self._setMVP()
+                            self._progMgr.setUniform4fv('inColor', rec.gridColor)
+
+                    if thinOutline:
+                        # keep as line strip to avoid issues with gradObj lines
+                        glMultiDrawArrays(GL_LINE_STRIP_ADJACENCY, rec.ringFirsts[c], rec.ringCounts[c], len(poly))
                     else:
-                        self._progMgr.useProgram('thickline')
-                        glUniform1f(self._progMgr['width'], rec.line_thickness)
-                        glUniform4fv(self._progMgr['inColor1'], 1, glm.value_ptr(rec.gridColor))
-                        glUniform4fv(self._progMgr['inColor2'], 1, glm.value_ptr(rec.gridColor))
-
-
-                        for start,count in poly:
-                            GeometryGLScene._drawThickLineGL(start,count)
+                        GeometryGLScene._multiDrawThickLinesGL(rec.ringFirsts[c], rec.ringCounts[c])
 
+            if doFill and not doOutline:
+                glDisable(GL_STENCIL_TEST)
 
             # Draw selected poly outlines here, on top of everything else
             if not pickMode and rec.drawGrid and self._lineSelect:
-                glBindVertexArray(rec.vao)
-                if self._useSelThicklines:
+                selBuff, selCount = rec.updateSelectedIndirect(rec.selectedRecs, rec.id)
+                if selCount > 0:
+                    self._bindVao(rec.vao)
+                    if self._useSelThicklines:
 
-                    self._progMgr.useProgram('thickline')
-                    glUniform1f(self._progMgr['width'], self._selLineWidth)
-                    glUniform4fv(self._progMgr['inColor1'], 1, glm.value_ptr(self._selectLineColor1))
-                    glUniform4fv(self._progMgr['inColor2'], 1, glm.value_ptr(self._selectLineColor2))
-
-
-                    c = 0
-                    for poly in rec.groups:
-                        if rec.selectedRecs[c] == 1:
-                            for start,count in poly:
-                                # glDrawArrays(GL_LINE_LOOP, *ring)
-                                GeometryGLScene._drawThickLineGL(start,count)
-                        c += 1
-                else:
-                    self._progMgr.useProgram('simple')
-                    glUniform4fv(self._progMgr['inColor'], 1, glm.value_ptr(self._selectLineColor1))
-                    c = 0
-                    for poly in rec.groups:
-                        if rec.selectedRecs[c] == 1:
-                            for ring in poly:
-                                # glDrawArrays(GL_LINE_LOOP, *ring)
-                                glDrawArrays(GL_LINE_STRIP_ADJACENCY, *ring)
-                        c += 1
+                        self._progMgr.useProgram('thickline')
+                        self._progMgr.setUniform1f('width', self._selLineWidth)
+                        self._progMgr.setUniform4fv('inColor1', self._selectLineColor1, self._selLinePtr1)
+                        self._progMgr.setUniform4fv('inColor2', self._selectLineColor2, self._selLinePtr2)
+                    else:
+                        self._progMgr.useProgram('simple')
+                        self._setMVP()
+                        self._progMgr.setUniform4fv('inColor', self._selectLineColor1, self._selLinePtr1)
 
-                self._progMgr.useProgram('simple')
+                    # one indirect call covers every ring of every selected polygon.
+                    GeometryGLScene._drawIndirectLinesGL(selBuff, selCount)
+
+                    self._progMgr.useProgram('simple')
 
-            glDisable(GL_BLEND)
-            # Clear the active VBO and VAO
-            glBindVertexArray(0)
 
     def _drawPointLayer(self, rec, pickMode=False):
 
@@ -581,208 +1037,260 @@ class GeometryGLScene(object):
         if rec.glyphCode is not None:
             glVertexAttribI1ui(4,ord(rec.glyphCode))
         if rec.draw and rec.count > 0 and rec.buff != 0:
-            glBindVertexArray(rec.vao)
+            self._bindVao(rec.vao)
             # glPointSize(rec.ptSize)
+            if not pickMode:
+                # selection flags are uploaded here, alongside the draw that consumes them, so that hidden or empty
+                # layers do not pay for the transfer.
+                self._UpdateSelections(rec.id)
 
-            if rec.colorMode in [POINT_FILL.SINGLE,POINT_FILL.GROUP,POINT_FILL.INDEX]:
+            # picks of every color mode go through the point program, so value-referenced layers are also drawn with
+            # identifier colors in a single call.
+            if pickMode or rec.colorMode in [POINT_FILL.SINGLE,POINT_FILL.GROUP,POINT_FILL.INDEX]:
                 self._progMgr.useProgram('point')
-                glUniformMatrix4fv(self._progMgr['pMat'], 1, GL_FALSE, glm.value_ptr(self._mvpMat))
                 # glUniform1f(self._progMgr['ptScale'], rec.ptSize)
 
+                self._setBlend(not pickMode)
                 if not pickMode:
-                    glEnable(GL_BLEND)
-                    glUniform4fv(self._progMgr['selectColor'], 1, glm.value_ptr(self._ptSelectColor))
                     if rec.colorMode == POINT_FILL.GROUP:
                         for gc in rec.geomColors:
-                            glUniform4fv(self._progMgr['inColor'], 1, glm.value_ptr(gc.color))
+                            self._progMgr.setUniform4fv('inColor', gc.color)
                             # Render the points
                             glDrawArrays(GL_POINTS, gc.start, gc.count)
                     else: # POINT_FILL.SINGLE
                         glDrawArrays(GL_POINTS,0,rec.count)
                 else:
-                    # note: current implementation is extremely innefficient
-                    for i in range(rec.count):
-                        color = self._getRecordIdColor(rec.id,i)
-
-                        glUniform4fv(self._progMgr['selectColor'], 1, glm.value_ptr(color))
-                        glUniform4fv(self._progMgr['inColor'], 1, glm.value_ptr(color))
-                        glDrawArrays(GL_POINTS, i, 1)
+                    # temporarily source point colors from the per-point identifier colors, and treat every point
+                    # as unselected so that the identifier color is always the one written.
+                    glBindBuffer(GL_ARRAY_BUFFER, self._pointPickColorBuff(rec))
+                    glEnableVertexAttribArray(2)
+                    glVertexAttribPointer(2, 4, GL_FLOAT, GL_FALSE, 0, None)
+                    glDisableVertexAttribArray(1)
+                    glVertexAttribI1i(1, 0)
+
+                    scaledRef = rec.colorMode == POINT_FILL.VAL_REF and rec.scaleByValue
+                    if scaledRef:
+                        # size each point from its reference value, as the refPoint program does when drawing.
+                        glBindBuffer(GL_ARRAY_BUFFER, rec.auxColorBuff)
+                        glEnableVertexAttribArray(3)
+                        glVertexAttribPointer(3, 1, GL_FLOAT, GL_FALSE, 0, None)
+                        self._progMgr.setUniform2f('sizeXform', *GeometryGLScene._refPointSizeXform(rec))
+
+                    glDrawArrays(GL_POINTS, 0, rec.count)
+
+                    if scaledRef:
+                        glDisableVertexAttribArray(3)
+                        self._progMgr.setUniform2f('sizeXform', 1., 0.)
+
+                    # restore the color attribute used for regular draws.
+                    glEnableVertexAttribArray(1)
+                    if rec.colorMode == POINT_FILL.INDEX:
+                        glBindBuffer(GL_ARRAY_BUFFER, rec.auxColorBuff)
+                        glVertexAttribPointer(2, 4, GL_FLOAT, GL_FALSE, 0, None)
+                    elif rec.colorMode == POINT_FILL.VAL_REF:
+                        glBindBuffer(GL_ARRAY_BUFFER, rec.auxColorBuff)
+                        glVertexAttribPointer(2, 1, GL_FLOAT, GL_FALSE, 0, None)
+                    else:
+                        glDisableVertexAttribArray(2)
+                    glBindBuffer(GL_ARRAY_BUFFER, 0)
 
             else:  # POINT_FILL.VAL_REF
-                glEnable(GL_BLEND)
-                glActiveTexture(GL_TEXTURE1)
+                self._setBlend(True)
+                self._setActiveTexture(GL_TEXTURE1)
                 glBindTexture(GL_TEXTURE_1D, rec.gradTexId)
                 self._progMgr.useProgram('refPoint')
-                glUniformMatrix4fv(self._progMgr['mvpMat'], 1, GL_FALSE, glm.value_ptr(self._mvpMat))
-                glUniform2f(self._progMgr['valueBoundaries'], rec.lowVal, rec.highVal)
-                glUniform1i(self._progMgr['clampGradient'], 1 if rec.clampColorToRange else 0)
-                glUniform1i(self._progMgr['customGradient'], 1)
+                self._progMgr.setUniform2f('valueBoundaries', rec.lowVal, rec.highVal)
+                self._progMgr.setUniform1i('clampGradient', 1 if rec.clampColorToRange else 0)
+                self._progMgr.setUniform1i('customGradient', 1)
 
                 # glEnable(GL_PROGRAM_POINT_SIZE)
                 if not rec.scaleByValue:
-                    glUniform2f(self._progMgr['refSizeRange'], rec.ptSize, rec.ptSize)
+                    self._progMgr.setUniform2f('refSizeRange', rec.ptSize, rec.ptSize)
                 else:
-                    glUniform2f(self._progMgr['refSizeRange'],rec.scaleMinSize,rec.scaleMaxSize)
+                    self._progMgr.setUniform2f('refSizeRange', rec.scaleMinSize, rec.scaleMaxSize)
                 glDrawArrays(GL_POINTS, 0, rec.count)
                 # glDisable(GL_PROGRAM_POINT_SIZE)
 
-            glDisable(GL_BLEND)
-            # Clear active VBO and VAO.
-            glBindVertexArray(0)
+
+    @staticmethod
+    def _refPointSizeXform(rec):
+        """Find the scale and offset that map a point's reference value to the size the refPoint program draws it at.
+
+        The refPoint program normalizes the value against `lowVal` and `highVal` only when the layer clamps its colors
+        to that range, then mixes between the minimum and maximum sizes; both steps are linear in the value, so they
+        fold into a single scale and offset.
+
+        Args:
+            rec (PointLayerRecord): A value-referenced point layer that is scaled by value.
+
+        Returns:
+            tuple: The scale and offset, respectively.
+        """
+
+        scale = rec.scaleMaxSize - rec.scaleMinSize
+        if not rec.clampColorToRange:
+            return scale, rec.scaleMinSize
+        span = rec.highVal - rec.lowVal
+        scale = scale / span if span != 0 else 0.
+        return scale, rec.scaleMinSize - rec.lowVal * scale
 
     def _drawLineLayer(self,rec,pickMode=False):
 
         if rec.draw and rec.count > 0 and rec.buff != 0:
-            glBindVertexArray(rec.vao)
+            self._bindVao(rec.vao)
+            self._setBlend(not pickMode and rec.colorMode == LINE_FILL.SINGLE)
 
             if not pickMode:
                 if rec.colorMode == LINE_FILL.SINGLE:
-                    glEnable(GL_BLEND)
                     if rec.line_thickness == 1:
                         self._progMgr.useProgram('simple')
-                        glUniform4fv(self._progMgr['inColor'], 1, glm.value_ptr(rec.geomColors[0]))
-                        for offs, count in rec.groups:
-                            glDrawArrays(GL_LINE_STRIP_ADJACENCY, offs, count)
+                        self._setMVP()
+                        self._progMgr.setUniform4fv('inColor', rec.geomColors[0])
+                        GeometryGLScene._multiDrawThickLinesGL(rec.groupFirsts, rec.groupCounts)
                     else:
                         self._progMgr.useProgram('thickline')
-                        glUniform1f(self._progMgr['width'],rec.line_thickness)
-                        glUniform4fv(self._progMgr['inColor1'], 1, glm.value_ptr(rec.geomColors[0]))
-                        glUniform4fv(self._progMgr['inColor2'], 1, glm.value_ptr(rec.geomColors[0]))
+                        self._progMgr.setUniform1f('width', rec.line_thickness)
+                        self._progMgr.setUniform4fv('inColor1', rec.geomColors[0])
+                        self._progMgr.setUniform4fv('inColor2', rec.geomColors[0])
 
-                        for offs, count in rec.groups:
-                            GeometryGLScene._drawThickLineGL(offs,count)
+                        GeometryGLScene._multiDrawThickLinesGL(rec.groupFirsts, rec.groupCounts)
 
                 else: # LINE_FILL.VAL_REF:
                     self._progMgr.useProgram('refline')
-                    glActiveTexture(GL_TEXTURE1)
+                    self._setActiveTexture(GL_TEXTURE1)
                     glBindTexture(GL_TEXTURE_1D, rec.gradTexId)
-                    glUniform1f(self._progMgr['width'], rec.line_thickness)
-                    glUniform2f(self._progMgr['valueBoundaries'], rec.lowVal, rec.highVal)
-                    glUniform1i(self._progMgr['customGradient'], 1)
+                    self._progMgr.setUniform1f('width', rec.line_thickness)
+                    self._progMgr.setUniform2f('valueBoundaries', rec.lowVal, rec.highVal)
+                    self._progMgr.setUniform1i('customGradient', 1)
 
-                    for offs, count in rec.groups:
-                        GeometryGLScene._drawThickLineGL(offs, count)
+                    GeometryGLScene._multiDrawThickLinesGL(rec.groupFirsts, rec.groupCounts)
 
                 # draw any selected as an overlay, just in case select thickness is less than line thickness
-                if any(rec.selectedRecs):
+                selBuff, selCount = rec.updateSelectedIndirect(rec.selectedRecs, rec.id)
+                if selCount > 0:
                     self._progMgr.useProgram('thickline')
-                    glUniform1f(self._progMgr['width'], self._selLineWidth)
-                    glUniform4fv(self._progMgr['inColor1'], 1, glm.value_ptr(self._selectLineColor1))
-                    glUniform4fv(self._progMgr['inColor2'], 1, glm.value_ptr(self._selectLineColor2))
+                    self._progMgr.setUniform1f('width', self._selLineWidth)
+                    self._progMgr.setUniform4fv('inColor1', self._selectLineColor1, self._selLinePtr1)
+                    self._progMgr.setUniform4fv('inColor2', self._selectLineColor2, self._selLinePtr2)
 
-                    for i, (offs, count) in enumerate(rec.groups):
-                        if rec.selectedRecs[i]:
-                            GeometryGLScene._drawThickLineGL(offs, count)
+                    GeometryGLScene._drawIndirectLinesGL(selBuff, selCount)
 
             else:
                 # if line isn't thick, widen a bit to make it easier to pick
                 useThickness = rec.line_thickness if rec.line_thickness > 1 else 2
-                self._progMgr.useProgram('thickline')
-                glUniform1f(self._progMgr['width'], useThickness)
+                self._progMgr.useProgram('thickline_pick')
+                self._progMgr.setUniform1f('width', useThickness)
 
-                for i, (offs, count) in enumerate(rec.groups):
-                    color = self._getRecordIdColor(rec.id, i)
-                    glUniform4fv(self._progMgr['inColor1'], 1, glm.value_ptr(color))
-                    glUniform4fv(self._progMgr['inColor2'], 1, glm.value_ptr(color))
+                # each indirect command draws one instance of a linestring, with the linestring's index as the base
+                # instance; the identifier colors advance once per instance, so every linestring gets its own color
+                # within a single call.
+                colorBuff, cmdBuff = self._linePickBuffers(rec)
+                glBindBuffer(GL_ARRAY_BUFFER, colorBuff)
+                glEnableVertexAttribArray(2)
+                glVertexAttribPointer(2, 4, GL_FLOAT, GL_FALSE, 0, None)
+                glVertexAttribDivisor(2, 1)
 
-                    GeometryGLScene._drawThickLineGL(offs, count)
+                GeometryGLScene._drawIndirectLinesGL(cmdBuff, len(rec.groups))
+
+                # the VAO may be shared by reference records, so leave it as regular draws expect.
+                glVertexAttribDivisor(2, 0)
+                glDisableVertexAttribArray(2)
+                glBindBuffer(GL_ARRAY_BUFFER, 0)
 
-            glDisable(GL_BLEND)
-            # Clear active VBO and VAO.
-            glBindVertexArray(0)
 
     def _drawRaster(self, rec, pickMode=False):
 
         if rec.draw and rec.count > 0 and rec.buff != 0:
-            glBindVertexArray(rec.vao)
+            self._bindVao(self._rasterVao)
+            glBindVertexBuffer(0, rec.buff, rec.buffOffset, 2 * np.dtype(np.float32).itemsize)
 
             if not isinstance(rec, RasterIndexLayerRecord) or pickMode:
                 self._progMgr.useProgram('raster')
-                glUniform1i(self._progMgr['isSelect'], 1 if pickMode else 0)
-                glUniformMatrix4fv(self._progMgr['mvpMat'], 1, GL_FALSE, glm.value_ptr(self._mvpMat))
+                self._progMgr.setUniform1i('isSelect', 1 if pickMode else 0)
             else:
-                glActiveTexture(GL_TEXTURE1)
+                self._setActiveTexture(GL_TEXTURE1)
                 glBindTexture(GL_TEXTURE_1D, rec.gradTexId)
-                self._progMgr.useProgram('refColorTex')
-                glUniformMatrix4fv(self._progMgr['mvpMat'],1,GL_FALSE,glm.value_ptr(self._mvpMat))
-                glUniform2f(self._progMgr['valueBoundaries'], rec.lowVal, rec.highVal)
-                glUniform1i(self._progMgr['clampGradient'],1 if rec.clampColorToRange else 0)
-                glUniform1i(self._progMgr['customGradient'],1)
+                self._progMgr.useProgram('refColorTex_cg1')
+                self._progMgr.setUniform2f('valueBoundaries', rec.lowVal, rec.highVal)
+                self._progMgr.setUniform1i('clampGradient', 1 if rec.clampColorToRange else 0)
 
+            self._setBlend(not pickMode)
             if not pickMode:
-                glEnable(GL_BLEND)
-                glActiveTexture(GL_TEXTURE0)
+                self._setActiveTexture(GL_TEXTURE0)
                 glBindTexture(GL_TEXTURE_2D, rec.texId)
                 glDrawArrays(GL_TRIANGLE_FAN, 0, rec.count)
             else:
                 color = self._getRecordIdColor(rec.id)
 
-                glUniform4fv(self._progMgr['selectColor'], 1, glm.value_ptr(color))
+                self._progMgr.setUniform4fv('selectColor', color)
                 glDrawArrays(GL_TRIANGLE_FAN, 0, rec.count)
 
-            glDisable(GL_BLEND)
-            # Clear active VBO and VAO.
-            glBindVertexArray(0)
 
     def _drawTextLayer(self,rec):
 
         if rec.draw:
             self._progMgr.useProgram('text')
-            glBindVertexArray(rec.vao)
+            self._bindVao(rec.vao)
             if rec.outlineColor is not None:
-                glUniform1i(self._progMgr['showOutline'],1)
-                glUniform3fv(self._progMgr['outlineColor'],glm.value_ptr(rec.outlineColor))
+                self._progMgr.setUniform1i('showOutline', 1)
+                self._progMgr.setUniform3fv('outlineColor', rec.outlineColor)
             else:
-                glUniform1i(self._progMgr['showOutline'], 0)
+                self._progMgr.setUniform1i('showOutline', 0)
 
             glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-            glEnable(GL_BLEND)
-            glUniformMatrix4fv(self._progMgr['mvpMat'],1,GL_FALSE,glm.value_ptr(self._mvpMat))
+            self._setBlend(True)
             # glUniform2f(self._progMgr['xyOffs'],0.,0.)
             # Select the VAO and texture for text drawing; upload offset to uniform variable, then draw all the text triangles.
-            glActiveTexture(GL_TEXTURE3)
+            self._setActiveTexture(GL_TEXTURE3)
             glBindTexture(GL_TEXTURE_2D,rec.txtRenderer.atlasTex)
             # glUniform2fv(self.tx_xyOffsLoc, 1, glm.value_ptr(offset))
             glDrawArrays(GL_TRIANGLES, 0, rec.vertCount)
-            glDisable(GL_BLEND)
 
     def _regenFramebuffer(self, width, height):
 
-        glDeleteFramebuffers(1, [self._frameBuff])
-        glDeleteTextures(1, [self._fbTex])
-        glDeleteRenderbuffers(1, [self._fbRbo])
-
-        self._frameBuff = glGenFramebuffers(1)
-        self._fbTex = glGenTextures(1)
+        # The framebuffer and its attachments are created once; on later resizes only their storage is reallocated,
+        # since attachments refer to the objects rather than to their storage.
+        newFB = self._frameBuff == 0
+        if newFB:
+            self._frameBuff = glGenFramebuffers(1)
+            self._fbTex = glGenTextures(1)
+            self._fbRbo = glGenRenderbuffers(1)
 
         # activate framebuffer
-        existBuffer = np.empty([1], np.int32)
-        glGetIntegerv(GL_FRAMEBUFFER_BINDING, existBuffer)
         glBindFramebuffer(GL_FRAMEBUFFER, self._frameBuff)
 
-        # build target texture
-        glBindTexture(GL_TEXTURE_2D, self._fbTex)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glBindTexture(GL_TEXTURE_2D, 0)
+        # Storage is sized up to the next power of two and only ever grows, so that dragging a window edge does not
+        # reallocate on every step; rendering is confined to the lower-left corner by the viewport, and the blit
+        # reads texels by fragment position, so the unused margin is never sampled.
+        capW, capH = self._fbCapacity
+        if width > capW or height > capH:
+            capW = max(capW, 1 << (max(width, 1) - 1).bit_length())
+            capH = max(capH, 1 << (max(height, 1) - 1).bit_length())
+            self._fbCapacity = capW, capH
 
-        # add renderbuffer for stencil support
-        self._fbRbo = glGenRenderbuffers(1)
-        glBindRenderbuffer(GL_RENDERBUFFER, self._fbRbo)
-        glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH24_STENCIL8, width, height)
-        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_STENCIL_ATTACHMENT, GL_RENDERBUFFER, self._fbRbo)
-
-        # wire up framebuffer
-
-        glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, self._fbTex, 0)
-        glDrawBuffers(1, np.array([GL_COLOR_ATTACHMENT0]))
+            # build target texture
+            glBindTexture(GL_TEXTURE_2D, self._fbTex)
+            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, capW, capH, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+            if newFB:
+                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+            glBindTexture(GL_TEXTURE_2D, 0)
+
+            # add renderbuffer for stencil support
+            glBindRenderbuffer(GL_RENDERBUFFER, self._fbRbo)
+            glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH24_STENCIL8, capW, capH)
+
+        if newFB:
+            # wire up framebuffer
+            glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_STENCIL_ATTACHMENT, GL_RENDERBUFFER, self._fbRbo)
+            glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, self._fbTex, 0)
+            glDrawBuffers(1, _DRAW_BUFFERS_COLOR0)
 
         if glCheckFramebufferStatus(GL_FRAMEBUFFER) != GL_FRAMEBUFFER_COMPLETE:
             raise GaiaGLException("Framebuffer failed to initialize.")
 
         glViewport(0, 0, width, height)
-        glBindFramebuffer(GL_FRAMEBUFFER, existBuffer[0])
+        glBindFramebuffer(GL_FRAMEBUFFER, self._defaultFBO)
 
         self.markFullRefresh()
 
@@ -802,6 +1310,11 @@ class GeometryGLScene(object):
 
         """
 
+        if self._initialized:
+            # The host may reallocate its framebuffer whenever it is resized, so this is the one place the binding
+            # needs to be read back.
+            self._defaultFBO = int(glGetIntegerv(GL_FRAMEBUFFER_BINDING))
+
         # Attempt to maintain the source aspect ratio through viewport offsetting.
         cwidth = int(height / self._aspectRatio)
         cheight = int(self._aspectRatio * width)
@@ -827,11 +1340,8 @@ class GeometryGLScene(object):
             # self.zoomToExts(*oldExts)
 
             # adjust line thickness to reflect ratio
-            for progName in ('thickline','refline','text'):
-                resProg = self._progMgr.progLookup(progName)
-                if resProg != 0:
-                    self._progMgr.useProgramDirectly(resProg)
-                    glUniform2f(self._progMgr['resolution'], width, height)
+            self._viewResolution = (width, height)
+            self._sceneViewDirty = True
 
 
             # set textProjection
@@ -854,11 +1364,8 @@ class GeometryGLScene(object):
 
         """
 
-        extsChanged = not hasattr(self, '_eLeft') or \
-                      self._eLeft != left or \
-                      self._eRight != right or \
-                      self._eBottom != bottom or \
-                      self._eTop != top
+        # the extents always exist (possibly as None) once constructed, so a single tuple comparison suffices.
+        extsChanged = (self._eLeft, self._eRight, self._eBottom, self._eTop) != (left, right, bottom, top)
 
         if extsChanged:
             # cache extents for future use
@@ -915,9 +1422,13 @@ class GeometryGLScene(object):
         self._eBottom = None
         self._eTop = None
 
-        for lyr in self._layers.values():
-            if lyr.exts is not None:
-                self.SetMaxExtents(*lyr.exts)
+        # reduce all layer extents at once, so that the view is only recomputed for the final bounding box.
+        exts = [lyr.exts for lyr in self._layers.values() if lyr.exts is not None]
+        if len(exts) > 0:
+            exts = np.array(exts, dtype=np.float64).reshape(-1, 4)
+            left, bottom = exts[:, [0, 2]].min(axis=0)
+            right, top = exts[:, [1, 3]].max(axis=0)
+            self.SetExtents(float(left), float(right), float(bottom), float(top))
 
     # </editor-fold>
 
@@ -970,7 +1481,7 @@ class GeometryGLScene(object):
     @property
     def allowPicking(self):
         """bool: true if any layers allow picking; false otherwise."""
-        return any([self._allowPolyPicking,self._allowPtPicking,self._allowLinePicking])
+        return self._allowPolyPicking or self._allowPtPicking or self._allowLinePicking
 
     @property
     def allowPolyPicking(self):
@@ -1031,9 +1542,10 @@ class GeometryGLScene(object):
 
     @fillPolygons.setter
     def fillPolygons(self, doFill):
-        self._fillGrid = doFill
-        self.markFullRefresh()
-        self._doRefresh()
+        if self._fillGrid != doFill:
+            self._fillGrid = doFill
+            self.markFullRefresh()
+            self._doRefresh()
 
     @defaultPointColor.setter
     def defaultPointColor(self, c):
@@ -1049,15 +1561,19 @@ class GeometryGLScene(object):
 
     @selectColor.setter
     def selectColor(self, c):
-        self._selectLineColor1 = c
-        self.markFullRefresh()
-        self._doRefresh()
+        if self._selectLineColor1 != c:
+            self._selectLineColor1 = c
+            self._selectLineColorsChanged()
+            self.markFullRefresh()
+            self._doRefresh()
 
     @pointSelectColor.setter
     def pointSelectColor(self, c):
-        self._ptSelectColor = c
-        self.markFullRefresh()
-        self._doRefresh()
+        if self._ptSelectColor != c:
+            self._ptSelectColor = c
+            self._sceneColorsChanged()
+            self.markFullRefresh()
+            self._doRefresh()
 
     @backgroundColor.setter
     def backgroundColor(self, c):
@@ -1071,33 +1587,43 @@ class GeometryGLScene(object):
 
     @polygonSelectionFill.setter
     def polygonSelectionFill(self, fill):
-        self._fillSelect = fill
-        self.markFullRefresh()
-        self._doRefresh()
+        if self._fillSelect != fill:
+            self._fillSelect = fill
+            self.markFullRefresh()
+            self._doRefresh()
 
     @polygonSelectionOutline.setter
     def polygonSelectionOutline(self, line):
-        self._lineSelect = line
-        self.markFullRefresh()
-        self._doRefresh()
+        if self._lineSelect != line:
+            self._lineSelect = line
+            self.markFullRefresh()
+            self._doRefresh()
 
     @selectFillColors.setter
     def selectFillColors(self, colors):
         if isinstance(colors, glm.vec4):
-            self._selectPolyColor1, self._selectPolyColor2 = colors, colors
+            spc1 = spc2 = colors
         else:
-            self._selectPolyColor1, self._selectPolyColor2 = glm.vec4(colors[0]), glm.vec4(colors[1])
-        self.markFullRefresh()
-        self._doRefresh()
+            spc1, spc2 = glm.vec4(colors[0]), glm.vec4(colors[1])
+        if self._selectPolyColor1 != spc1 or self._selectPolyColor2 != spc2:
+            self._selectPolyColor1 = spc1
+            self._selectPolyColor2 = spc2
+            self._sceneColorsChanged()
+            self.markFullRefresh()
+            self._doRefresh()
 
     @selectLineColors.setter
     def selectLineColors(self, colors):
         if isinstance(colors, glm.vec4):
-            self._selectLineColor1, self._selectLineColor2 = colors, colors
+            slc1 = slc2 = colors
         else:
-            self._selectLineColor1, self._selectLineColor2 = glm.vec4(colors[0]), glm.vec4(colors[1])
-        self.markFullRefresh()
-        self._doRefresh()
+            slc1, slc2 = glm.vec4(colors[0]), glm.vec4(colors[1])
+        if self._selectLineColor1 != slc1 or self._selectLineColor2 != slc2:
+            self._selectLineColor1 = slc1
+            self._selectLineColor2 = slc2
+            self._selectLineColorsChanged()
+            self.markFullRefresh()
+            self._doRefresh()
 
     @rubberBandColors.setter
     def rubberBandColors(self, value):
@@ -1109,7 +1635,7 @@ class GeometryGLScene(object):
         if self._rbColor1 != rbc1 or self._rbColor2 != rbc2:
             self._rbColor1 = rbc1
             self._rbColor2 = rbc2
-            self._updateRubberBandColor()
+            self._sceneColorsChanged()
             self._doRefresh()
 
     # </editor-fold>
@@ -1122,17 +1648,21 @@ class GeometryGLScene(object):
             verts,extra = rec.prepareForGLLoad(verts,ext,extra)
             self._LoadGLBuffer(verts, ext, rec, extra)
 
+        # the feature count is final at this point, so build the identifier colors now rather than on the first pick.
+        if isinstance(rec, PolyLayerRecord) and self._allowPolyPicking:
+            self._recordIdColors(rec.id, len(rec.groups))
+        elif isinstance(rec, LineLayerRecord) and self._allowLinePicking:
+            self._recordIdColors(rec.id, len(rec.groups))
+        elif isinstance(rec, PointLayerRecord) and self._allowPtPicking:
+            self._recordIdColors(rec.id, rec.count)
+
     def _addRasterRecord(self, pxlData, channels, rec,internal=None, gradObj=None):
 
         with self.grabContext():
-            rec.vao = glGenVertexArrays(1)
+            # rasters share the scene's raster vertex array, so the record gets none of its own.
             verts,_ = rec.prepareForGLLoad(None,rec.exts,None)
 
-            texCoords = np.array([0., 0.,
-                                  0., 1.,
-                                  1., 1.,
-                                  1., 0., ], dtype=np.float32)
-            self._LoadGLBuffer(verts, tuple(rec.exts), rec, texCoords)
+            self._LoadGLBuffer(verts, tuple(rec.exts), rec)
             # glBindVertexArray(rec.vao)
             self._LoadTexture(pxlData, GL_TEXTURE0, GL_TEXTURE_2D, channels, rec.texId,internal,interp=rec.smooth)
             # glBindVertexArray(0)
@@ -1144,7 +1674,10 @@ class GeometryGLScene(object):
 
     def _registerLayer(self, rec):
         if rec.parentLayer<0:
+            if self._drawStackPos is not None:
+                self._drawStackPos[rec.id] = len(self._drawStack)
             self._drawStack.append(rec)
+            self._drawOrder = None
         self._layers[rec.id] = rec
         self.markFullRefresh()
 
@@ -1267,11 +1800,14 @@ class GeometryGLScene(object):
                 from .textrenderer import TxtRenderer
                 rec.vao = glGenVertexArrays(1)
                 rec.buff= glGenBuffers(1)
+                rec.buffSize = 0
                 labelFont = fontArgs.get('font_path',DEFAULT_FONT)
                 labelPt = fontArgs.get('font_pt',DEFAULT_CHAR_POINT_SIZE)
                 rec.txtRenderer = self._getTextRenderer(labelFont,labelPt)
                 TxtRenderer.PrepTextBuffer(rec.vao,rec.buff)
 
+                # Label vertices are written once here and then only read; they follow pan and zoom through the MVP
+                # matrix rather than being rewritten, so a plain static buffer is used instead of a mapped one.
                 rec.loadStrings()
         else:
             cache = self._caches.setdefault('txtData',{'fn':'_loadTextData', 'data': []})
@@ -1281,6 +1817,7 @@ class GeometryGLScene(object):
         self._registerLayer(rec)
 
         self._pointLayerIds.add(rec.id)
+        self._allLayerIds.add(rec.id)
 
         if self._initialized:
             self._addVectorRecord(verts, ext, rec,attribVals)
@@ -1292,6 +1829,7 @@ class GeometryGLScene(object):
         self._registerLayer(rec)
 
         self._polyLayerIds.add(rec.id)
+        self._allLayerIds.add(rec.id)
         if self._initialized:
             self._addVectorRecord(verts, ext, rec)
         else:
@@ -1302,6 +1840,7 @@ class GeometryGLScene(object):
         self._registerLayer(rec)
 
         self._lineLayerIds.add(rec.id)
+        self._allLayerIds.add(rec.id)
         if self._initialized:
             self._addVectorRecord(verts, ext, rec,refVals)
         else:
@@ -1315,10 +1854,12 @@ class GeometryGLScene(object):
         self._registerLayer(rec)
         idSet = self._typeSetForRec(rec)
         idSet.add(rec.id)
+        self._allLayerIds.add(rec.id)
 
     def _loadRasterLayer(self, pxlData, channels, rec,internal=None,gradObj=None):
         self._registerLayer(rec)
         self._rasterLayerIds.add(rec.id)
+        self._allLayerIds.add(rec.id)
 
         if self._initialized:
             self._addRasterRecord(pxlData, channels, rec,internal,gradObj)
@@ -1397,6 +1938,11 @@ class GeometryGLScene(object):
         if isinstance(rec, ReferenceRecord):
             rec = rec.srcRecord
 
+        idSet = self._typeSetMap.get(type(rec))
+        if idSet is not None:
+            return idSet
+
+        # subclasses of the known record types
         if isinstance(rec, PolyLayerRecord):
             return self._polyLayerIds
         elif isinstance(rec, PointLayerRecord):
@@ -1425,18 +1971,63 @@ class GeometryGLScene(object):
             self.SetMaxExtents(*ext)
 
         glBindVertexArray(rec.vao)
-        # ??? Should we split into separate functions?
-
-        glBindBuffer(GL_ARRAY_BUFFER, rec.buff)
-        glEnableVertexAttribArray(0)
-        glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, None)
 
+        # the record reserves its vertex storage and binds attribute 0 itself; see LayerRecord.storeVertexStreams().
         drawMode = GL_STATIC_DRAW if not rec.volatile else GL_DYNAMIC_DRAW
         rec.loadGLBuffer(verts,drawMode,self,extra)
 
         glBindVertexArray(0)
         self.markFullRefresh()
 
+    def _bufferSubData(self, buff, offset, data):
+        """Overwrite part of a buffer's contents, using direct state access when available.
+
+        Args:
+            buff (int): The OpenGL buffer to update.
+            offset (int): The byte offset into `buff` to start writing at.
+            data (numpy.ndarray): The values to write.
+        """
+
+        if self._hasDSA:
+            glNamedBufferSubData(buff, offset, data.nbytes, data)
+        else:
+            glBindBuffer(GL_ARRAY_BUFFER, buff)
+            glBufferSubData(GL_ARRAY_BUFFER, offset, data.nbytes, data)
+
+    def _replaceBufferData(self, buff, data, usage=GL_DYNAMIC_DRAW):
+        """Replace the entire contents of a buffer, orphaning its previous storage.
+
+        Unlike `_bufferSubData()`, the driver can hand back fresh storage instead of waiting on draws that may still
+        be reading the old contents.
+
+        Args:
+            buff (int): The OpenGL buffer to update.
+            data (numpy.ndarray): The new contents, spanning the whole buffer.
+            usage (int,optional): The usage hint for the new storage.
+        """
+
+        if self._hasDSA:
+            glNamedBufferData(buff, data.nbytes, data, usage)
+        else:
+            glBindBuffer(GL_ARRAY_BUFFER, buff)
+            glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, usage)
+
+    def vertexBufferPool(self, usage):
+        """Retrieve the pool that layer vertex data with the given usage is suballocated from.
+
+        Args:
+            usage (int): The OpenGL usage hint of the data; typically GL_STATIC_DRAW or GL_DYNAMIC_DRAW.
+
+        Returns:
+            BufferPool: The pool for `usage`, created on first request.
+        """
+
+        pool = self._vertPools.get(usage)
+        if pool is None:
+            pool = BufferPool(usage)
+            self._vertPools[usage] = pool
+        return pool
+
     def _LoadTexture(self, vals, trgTex, texMode, channels, texLoc,internal=None,interp=False):
         """Load texture data into OpenGL and into VRAM.
 
@@ -1452,6 +2043,7 @@ class GeometryGLScene(object):
 
         Raises:
             ValueError: if `channels` or `texMode` specify unsupported flags.
+            GaiaGLException: if `texLoc` already has immutable storage that doesn't match `vals`.
         """
 
         if internal is None:
@@ -1477,18 +2069,81 @@ class GeometryGLScene(object):
 
         if texMode == GL_TEXTURE_1D:
             w = vals.shape[0] // cCount
-            glTexImage1D(texMode, 0, internal, w, 0, channels, GL_FLOAT, vals)
-
+            h = 1
         elif texMode == GL_TEXTURE_2D:
             h, w = vals.shape[:2]
             if len(vals.shape) == 2:
                 h //= cCount
                 w //= cCount
-            glTexImage2D(texMode, 0, internal, w, h, 0, channels, GL_FLOAT, vals.ravel())
             # elif len(vals.shape)==3:
         # ...
         else:
             raise ValueError('texMode of type "{}" not supported'.format(texMode))
+
+        # If the texture already has storage of the same shape and format, only its contents need replacing. The
+        # width is checked as well, since texture names are recycled once deleted.
+        dims = (texMode, internal, w, h, channels)
+        sameStorage = self._texDims.get(texLoc) == dims
+        if sameStorage:
+            valbuff = self._scratchI32[:1]
+            glGetTexLevelParameteriv(texMode, 0, GL_TEXTURE_WIDTH, valbuff)
+            sameStorage = valbuff[0] == w
+
+        # Where supported, new storage is allocated as immutable, which spares the driver from revalidating it; the
+        # contents are then filled in the same way as an update.
+        useStorage = False
+        if not sameStorage and self._hasTexStorage:
+            valbuff = self._scratchI32[:1]
+            glGetTexParameteriv(texMode, GL_TEXTURE_IMMUTABLE_FORMAT, valbuff)
+            if valbuff[0] != 0:
+                raise GaiaGLException(f'Texture {texLoc} has immutable storage of a different size or format; '
+                                      'generate a new texture instead.')
+            useStorage = True
+
+        if texMode == GL_TEXTURE_1D:
+            if useStorage:
+                glTexStorage1D(texMode, 1, _SIZED_TEX_FORMATS.get(internal, internal), w)
+            if sameStorage or useStorage:
+                glTexSubImage1D(texMode, 0, 0, w, channels, GL_FLOAT, vals)
+            else:
+                glTexImage1D(texMode, 0, internal, w, 0, channels, GL_FLOAT, vals)
+        else:
+            # 2D data can be large, so it is sourced from a pixel unpack buffer rather than from client memory. Apple's
+            # client storage extension is not an option here: it only applies to legacy contexts, which cannot run the
+            # 4.3 shaders this scene requires, and it has no effect on uploads sourced from a buffer object.
+            self._stagePixels(vals)
+            if useStorage:
+                glTexStorage2D(texMode, 1, _SIZED_TEX_FORMATS.get(internal, internal), w, h)
+            if sameStorage or useStorage:
+                glTexSubImage2D(texMode, 0, 0, 0, w, h, channels, GL_FLOAT, ctypes.c_void_p(0))
+            else:
+                glTexImage2D(texMode, 0, internal, w, h, 0, channels, GL_FLOAT, ctypes.c_void_p(0))
+            glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+        self._texDims[texLoc] = dims
+
+    def _stagePixels(self, vals):
+        """Copy texture data into the pixel unpack buffer, and leave it bound for the texture call that consumes it.
+
+        The buffer's previous storage is orphaned on each call, so a transfer still in flight from an earlier upload
+        does not stall the copy; this gives the effect of alternating between staging buffers with only one object.
+
+        Args:
+            vals (numpy.ndarray): The texture data to stage. May be of any layout or numeric type; it is written out as
+              C-ordered float32 during the copy into the buffer.
+        """
+
+        nbytes = vals.size * np.dtype(np.float32).itemsize
+        if self._unpackBuff == 0:
+            self._unpackBuff = glGenBuffers(1)
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, self._unpackBuff)
+        glBufferData(GL_PIXEL_UNPACK_BUFFER, nbytes, None, GL_STREAM_DRAW)
+        ptr = glMapBufferRange(GL_PIXEL_UNPACK_BUFFER, 0, nbytes, GL_MAP_WRITE_BIT | GL_MAP_INVALIDATE_BUFFER_BIT)
+        # assigning through a view of the mapping converts strides and type in the one copy, so a transposed or
+        # sliced raster is never first gathered into a temporary contiguous array.
+        dst = np.ctypeslib.as_array(ctypes.cast(ptr, ctypes.POINTER(ctypes.c_float)), shape=vals.shape)
+        dst[...] = vals
+        del dst
+        glUnmapBuffer(GL_PIXEL_UNPACK_BUFFER)
         # ...
         # glGenerateMipmap(texMode)
 
@@ -1509,7 +2164,7 @@ class GeometryGLScene(object):
             raise GaiaGLException(f"Layer {id} has no gradient assigned")
 
         # get standard width
-        valbuff = np.array([0],dtype=np.int32)
+        valbuff = self._scratchI32[:1]
 
         with self.grabContext():
             glBindTexture(GL_TEXTURE_1D, lyr.gradTexId)
@@ -1544,84 +2199,105 @@ class GeometryGLScene(object):
             self.DeleteLayer(rec.labelLayer)
         if rec in self._drawStack:
             self._drawStack.remove(rec)
+            self._drawOrder = None
+            self._drawStackPos = None
             self._typeSetForRec(rec).remove(id)
+            self._allLayerIds.discard(id)
         self._layers.pop(rec.id)
+        self._idColorCache.pop(rec.id, None)
         self.markFullRefresh()
 
-    def ClearPointSelections(self):
-        """Clear selected points across all layers.
+    def _bulkDeleteLayers(self, ids):
+        """Remove several layers from the scene, rebuilding the draw stack once rather than once per layer.
+
+        Any label layers attached to the targeted layers are removed as well.
+
+        Args:
+            ids (iterable): Ids of the layers to remove.
         """
 
-        for id in self._pointLayerIds:
-            rec = self._layers[id]
+        pending = list(ids)
+        removed = set()
+        while len(pending) > 0:
+            lyrId = pending.pop()
+            rec = self._layers.pop(lyrId, None)
+            if rec is None:
+                continue
+            rec.ClearBuffers()
+            if rec.labelLayer >= 0:
+                pending.append(rec.labelLayer)
+            if rec.parentLayer < 0:
+                self._typeSetForRec(rec).discard(lyrId)
+                self._allLayerIds.discard(lyrId)
+            self._idColorCache.pop(lyrId, None)
+            removed.add(lyrId)
+
+        if len(removed) > 0:
+            self._drawStack = [rec for rec in self._drawStack if rec.id not in removed]
+            self._drawOrder = None
+            self._drawStackPos = None
+        self.markFullRefresh()
+
+    def _clearSelectionsFor(self, recs):
+        """Deselect every entity in the provided records.
+
+        Args:
+            recs (iterable): The LayerRecord objects to clear.
+        """
+
+        for rec in recs:
             rec.selectedRecs.fill(0)
         self.markFullRefresh()
 
+    def ClearPointSelections(self):
+        """Clear selected points across all layers.
+        """
+
+        self._clearSelectionsFor(self._layers[id] for id in self._pointLayerIds)
+
     def ClearPolySelections(self):
         """Clear polygon selections across all layers."""
 
-        for id in self._polyLayerIds:
-            rec = self._layers[id]
-            rec.selectedRecs.fill(0)
-        self.markFullRefresh()
+        self._clearSelectionsFor(self._layers[id] for id in self._polyLayerIds)
 
     def ClearLineSelections(self):
         """Clear line selections across all layers."""
 
-        for id in self._lineLayerIds:
-            rec = self._layers[id]
-            rec.selectedRecs.fill(0)
-        self.markFullRefresh()
+        self._clearSelectionsFor(self._layers[id] for id in self._lineLayerIds)
 
     def ClearLayerSelections(self):
         """Clear selections across all layers."""
 
-        for rec in self._drawStack:
-            rec.selectedRecs.fill(0)
-        self.markFullRefresh()
+        self._clearSelectionsFor(self._drawStack)
 
     def ClearPolyLayers(self):
         """Remove all polygon layers."""
 
-        idCache = tuple(self._polyLayerIds)
-        for id in idCache:
-            self.DeleteLayer(id)
-        self.markFullRefresh()
+        self._bulkDeleteLayers(tuple(self._polyLayerIds))
         self._doRefresh()
 
     def ClearPointLayers(self):
         """Remove all point layers."""
 
-        idCache = tuple(self._pointLayerIds)
-        for id in idCache:
-            self.DeleteLayer(id)
-        self.markFullRefresh()
+        self._bulkDeleteLayers(tuple(self._pointLayerIds))
         self._doRefresh()
 
     def ClearLineLayers(self):
         """Remove all line layers."""
-        idCache = tuple(self._lineLayerIds)
-        for id in idCache:
-            self.DeleteLayer(id)
-        self.markFullRefresh()
+        self._bulkDeleteLayers(tuple(self._lineLayerIds))
         self._doRefresh()
 
     def ClearRasterLayers(self):
         """Remove all raster layers."""
 
-        idCache = tuple(self._rasterLayerIds)
-        for id in idCache:
-            self.DeleteLayer(id)
-        self.markFullRefresh()
+        self._bulkDeleteLayers(tuple(self._rasterLayerIds))
         self._doRefresh()
 
     def ClearAllLayers(self):
         """Remove all layers"""
 
-        idCache = tuple(self._pointLayerIds.union(self._polyLayerIds).union(self._lineLayerIds).union(self._rasterLayerIds))
-        for id in idCache:
-            self.DeleteLayer(id)
-        self.markFullRefresh()
+        idCache = tuple(self._allLayerIds)
+        self._bulkDeleteLayers(idCache)
         self._doRefresh()
 
     # </editor-fold>
@@ -1636,7 +2312,7 @@ class GeometryGLScene(object):
 
         """
 
-        if id in self._polyLayerIds:
+        if id in self._polyLayerIds and self._layers[id].fillGrid != doFill:
             self._layers[id].fillGrid = doFill
             self.markFullRefresh()
             self._doRefresh()
@@ -1681,7 +2357,7 @@ class GeometryGLScene(object):
             isVisible (bool): Whether or not outlines should be drawn.
         """
 
-        if id in self._polyLayerIds:
+        if id in self._polyLayerIds and self._layers[id].drawGrid != isVisible:
             self._layers[id].drawGrid = isVisible
             self.markFullRefresh()
             self._doRefresh()
@@ -1709,9 +2385,11 @@ class GeometryGLScene(object):
             isVisible (bool): Draw layer if `True`; hide layer if `False`.
         """
 
-        self._layers[id].draw = isVisible
-        self.markFullRefresh()
-        self._doRefresh()
+        rec = self._layers[id]
+        if rec.draw != isVisible:
+            rec.draw = isVisible
+            self.markFullRefresh()
+            self._doRefresh()
 
     def GetLayerVisible(self, id):
         """Test to see if layer is presently being drawn.
@@ -1788,10 +2466,45 @@ class GeometryGLScene(object):
         if isinstance(rec, ReferenceRecord):
             rec = rec.srcRecord
 
+        verts = np.array(verts, dtype=np.float32)
         with self.grabContext():
-            glBindVertexArray(rec.vao)
-            glBindBuffer(GL_ARRAY_BUFFER, rec.buff)
-            glBufferSubData(GL_ARRAY_BUFFER, 0, verts.nbytes, verts)
+            self._bufferSubData(rec.buff, rec.buffOffset, verts)
+        rec.cpuVerts = verts if rec.volatile else None
+
+        # keep the bounds used for view culling in step with the moved geometry.
+        pts = verts.reshape(-1, 2)
+        if pts.shape[0] > 0:
+            mins = pts.min(axis=0)
+            maxs = pts.max(axis=0)
+            rec.exts = [mins[0], maxs[0], mins[1], maxs[1]]
+
+        self.markFullRefresh()
+        self._doRefresh()
+
+    def UpdateLayerAttributes(self, id, extra):
+        """Update the per-vertex attribute stream (values or texture coordinates) for an existing layer.
+
+        Only the attribute stream is rewritten; vertex positions are left untouched on the GPU.
+
+        Args:
+            id (int): The layer to update.
+            extra (numpy.array): The new attribute values, laid out as they were when the layer was added.
+
+        Raises:
+            ValueError: If the layer was loaded without an attribute stream.
+
+        Notes:
+            Count of values will not change; do not add more values than added in original layer.
+        """
+
+        rec = self._layers[id]
+        if isinstance(rec, ReferenceRecord):
+            rec = rec.srcRecord
+        if rec.extraOffset == 0:
+            raise ValueError('Record {} has no per-vertex attribute stream.'.format(id))
+
+        with self.grabContext():
+            self._bufferSubData(rec.buff, rec.buffOffset + rec.extraOffset, extra)
 
         self.markFullRefresh()
         self._doRefresh()
@@ -1833,8 +2546,7 @@ class GeometryGLScene(object):
         """
 
         rec = self._layers[id]
-        for i in range(len(rec.selectedRecs)):
-            rec.selectedRecs[i] = int(select)
+        rec.selectedRecs.fill(int(select))
 
         self.markFullRefresh()
 
@@ -1849,7 +2561,7 @@ class GeometryGLScene(object):
         """
 
         rec = self._layers[id]
-        return tuple([i for i in range(len(rec.selectedRecs)) if rec.selectedRecs[i] == 1])
+        return tuple(np.flatnonzero(rec.selectedRecs == 1).tolist())
 
     # </editor-fold>
 
@@ -1858,7 +2570,9 @@ class GeometryGLScene(object):
         """Reset the view matrix back to the identity state."""
         self._viewMat = glm.mat4(1.)
         self._zoomMat = glm.mat4(1.)
+        self._zoomOrthoMat = None
         self._zoomLevel=0
+        self._scaledDragLimits = None
         self._updateMVP()
         self.markFullRefresh()
         self._doRefresh()
@@ -1909,9 +2623,8 @@ class GeometryGLScene(object):
 
         """
 
-        descale = glm.vec2(self._viewMat[0][0],self._viewMat[1][1])
-        limits=self._dragLimits*descale.xxyy
         self._viewMat[3].xyz += curr.xyz
+        # limits = self._viewDragLimits()
         # self._viewMat[3].x = max(min(self._viewMat[3].x,limits[1]),limits[0])
         # self._viewMat[3].y = max(min(self._viewMat[3].y, limits[3]), limits[2])
 
@@ -1935,8 +2648,7 @@ class GeometryGLScene(object):
             curr (list): 3-value vector containing  3D coordinates of new position.
 
         """
-        descale = glm.vec2(self._viewMat[0][0], self._viewMat[1][1])
-        limits=self._dragLimits*descale.xxyy
+        limits = self._viewDragLimits()
         self._viewMat[3].xyz = curr.xyz
         self._viewMat[3].x = max(min(self._viewMat[3].x, limits[1]), limits[0])
         self._viewMat[3].y = max(min(self._viewMat[3].y, limits[3]), limits[2])
@@ -1945,6 +2657,21 @@ class GeometryGLScene(object):
         self.markFullRefresh()
         self._doRefresh()
 
+    def _viewDragLimits(self):
+        """Retrieve the drag limits scaled by the view matrix.
+
+        The result only depends on the view matrix's scale and on the extents, so it is cached until either is
+        replaced, rather than rebuilt on every translation.
+
+        Returns:
+            glm.vec4: The left, right, bottom, and top limits for the view translation.
+        """
+
+        if self._scaledDragLimits is None:
+            descale = glm.vec2(self._viewMat[0][0], self._viewMat[1][1])
+            self._scaledDragLimits = self._dragLimits * descale.xxyy
+        return self._scaledDragLimits
+
     def SetPosition(self, pos):
         """ Set the absolute position of a translation instead of applying it to the existing position.
 
@@ -2032,6 +2759,7 @@ class GeometryGLScene(object):
         scaleFactor=2**self._zoomLevel
 
         self._zoomMat[0][0]=self._zoomMat[1][1]=self._zoomMat[2][2]=scaleFactor
+        self._zoomOrthoMat = None
 
         # adjust translate so we are still centered
         adj = 1.0
@@ -2050,8 +2778,9 @@ class GeometryGLScene(object):
         """
 
         if not sceneSpace:
-            lb = self._mvpInvMat*glm.vec4(left, bottom, 0., 0., )
-            rt = self._mvpInvMat*glm.vec4(right, top, 0., 0., )
+            invMat = self._inverseMVP()
+            lb = invMat*glm.vec4(left, bottom, 0., 0., )
+            rt = invMat*glm.vec4(right, top, 0., 0., )
             # above transforms automatically center coordinates to 0
             origin= glm.vec4(0.)
         else:
@@ -2111,6 +2840,7 @@ class GeometryGLScene(object):
         self._zoomMat[0][0] *= zoom
         self._zoomMat[1][1] *= zoom
         self._zoomMat[2][2] *= zoom
+        self._zoomOrthoMat = None
         self._updateMVP()
         self.markFullRefresh()
         self._doRefresh()
@@ -2158,16 +2888,71 @@ class GeometryGLScene(object):
         hExts = glm.vec2(self._geomSize[0]/2.,self._geomSize[1]/2.)
         origin=glm.vec2(aright-aleft,atop-abottom)
         self._dragLimits=glm.vec4(-hExts.x,+hExts.x,-hExts.y,+hExts.y)
+        self._scaledDragLimits = None
 
         # calculate and store the orthographic projection matrix
         self.orthoMat = glm.ortho(*self._geomExts, 1., -1.0)
+        self._zoomOrthoMat = None
+
+    def _sceneColorsChanged(self):
+        """Flag the scene color uniform buffer for upload on the next draw.
+
+        Must be called whenever any of the selection or rubberband color attributes are replaced.
+        """
+
+        self._sceneColorsDirty = True
+
+    def _selectLineColorsChanged(self):
+        """Refresh the cached pointers to the selection line colors.
+
+        Must be called whenever either selection line color is replaced; the pointers are only valid for as long as the
+        colors they were taken from.
+        """
+
+        self._selLinePtr1 = glm.value_ptr(self._selectLineColor1)
+        self._selLinePtr2 = glm.value_ptr(self._selectLineColor2)
+
+    def _uploadSceneColors(self):
+        """Load the scene-wide colors into their uniform buffer.
+
+        The order must match the `SceneColors` block declared in the shaders module.
+        """
+
+        colors = np.array([self._selectPolyColor1,
+                           self._selectPolyColor2,
+                           self._ptSelectColor,
+                           self._rbColor1,
+                           self._rbColor2], dtype=np.float32)
+        self._replaceBufferData(self._colorsUbo, colors)
+        self._sceneColorsDirty = False
+
+    def _uploadSceneView(self):
+        """Load the MVP matrix and viewport resolution into their uniform buffer.
+
+        The layout must match the `SceneView` block declared in the shaders module.
+        """
+
+        self._viewBlock[:16] = np.ctypeslib.as_array(self._mvpPtr, shape=(16,))
+        self._viewBlock[16:18] = self._viewResolution
+        # rewritten on most frames while panning, so don't wait on the previous frame's reads.
+        self._replaceBufferData(self._viewUbo, self._viewBlock)
+        self._sceneViewDirty = False
 
     def _updateMVP(self):
-        """Update the cached MVP matrix and its inverse for use in rendering calculations."""
+        """Update the cached MVP matrix for use in rendering calculations.
+
+        The inverse is invalidated rather than rebuilt; see `_inverseMVP()`.
+        """
 
-        #vpMat = self._viewMat * self.orthoMat
-        self._mvpMat = self._zoomMat*self.orthoMat * self._viewMat * self._mdlMat
-        self._mvpInvMat = glm.inverse(self._mvpMat)
+        if self._zoomOrthoMat is None:
+            self._zoomOrthoMat = self._zoomMat * self.orthoMat
+        self._mvpMat = self._zoomOrthoMat * (self._viewMat * self._mdlMat)
+        self._mvpPtr = glm.value_ptr(self._mvpMat)
+        self._mvpGen += 1
+        self._sceneViewDirty = True
+        self._mvpInvMat = None
+        self._mvpArr = None
+        self._mvpInvArr = None
 
         self._refreshTextTransMat()
 
@@ -2185,18 +2970,113 @@ class GeometryGLScene(object):
         Returns:
             glm.vec4: The color to be used as an identifier during picking operations
         """
-        rLower = np.float32((recId % 256) / 255.)
-        rUpper = np.float32((recId >> 8) / 255.)
+        rLower = (recId & 0xFF) * _INV255
+        rUpper = (recId >> 8) * _INV255
 
         fLower = 0.
         fUpper = 0.
         if featInd is not None:
-            fLower = np.float32((featInd % 256) / 255.)
-            fUpper = np.float32((featInd >> 8) / 255.)
+            fLower = (featInd & 0xFF) * _INV255
+            fUpper = (featInd >> 8) * _INV255
 
         return glm.vec4(rLower, rUpper, fLower, fUpper)
 
-    def _assignPolyFillColor(self, pickMode, rec, featInd):
+    @staticmethod
+    def _getRecordIdColors(recId, count):
+        """Vectorized version of `_getRecordIdColor()`, generating colors for a contiguous range of features.
+
+        Args:
+            recId (int): The id for the layer.
+            count (int): The number of features to generate colors for, starting at feature index 0.
+
+        Returns:
+            numpy.ndarray: A `count` x 4 array of float32 colors, each matching the output of
+              `_getRecordIdColor(recId, featInd)` for the equivalent feature index.
+        """
+
+        featInds = np.arange(count, dtype=np.uint32)
+        ret = np.empty([count, 4], dtype=np.float32)
+        ret[:, 0] = (recId & 0xFF) * _INV255
+        ret[:, 1] = (recId >> 8) * _INV255
+        # written straight into the float32 columns, rather than through full float64 temporaries; the product is
+        #  still formed in double precision so each value rounds exactly as the scalar path does.
+        np.multiply(featInds & 0xFF, _INV255, out=ret[:, 2], casting='unsafe')
+        np.multiply(featInds >> 8, _INV255, out=ret[:, 3], casting='unsafe')
+        return ret
+
+    def _recordIdColors(self, recId, count):
+        """Retrieve the identifier colors for a layer's features, generating them only if the feature count changed.
+
+        Args:
+            recId (int): The id for the layer.
+            count (int): The number of features in the layer.
+
+        Returns:
+            numpy.ndarray: A `count` x 4 array of float32 colors; see `_getRecordIdColors()`.
+        """
+
+        colors = self._idColorCache.get(recId)
+        if colors is None or len(colors) != count:
+            colors = GeometryGLScene._getRecordIdColors(recId, count)
+            self._idColorCache[recId] = colors
+        return colors
+
+    def _pointPickColorBuff(self, rec):
+        """Retrieve the per-point identifier color buffer for a point layer, (re)generating it if necessary.
+
+        Args:
+            rec (PointLayerRecord): The point layer record to retrieve the buffer for.
+
+        Returns:
+            int: The OpenGL array buffer holding the identifier colors.
+        """
+
+        # the buffers are owned by the source record, so reference records neither leak nor write to read-only
+        # aliases; each record picking through the source keeps its own entry, since the colors encode its id.
+        src = rec.srcRecord if isinstance(rec, ReferenceRecord) else rec
+        entry = src.pickBuffers.get(rec.id)
+        if entry is None or entry[1] != rec.count:
+            buff = glGenBuffers(1) if entry is None else entry[0]
+            colors = self._recordIdColors(rec.id, rec.count)
+            glBindBuffer(GL_ARRAY_BUFFER, buff)
+            glBufferData(GL_ARRAY_BUFFER, colors.nbytes, colors, GL_STATIC_DRAW)
+            entry = src.pickBuffers[rec.id] = (buff, rec.count)
+        return entry[0]
+
+    def _linePickBuffers(self, rec):
+        """Retrieve the per-linestring identifier color and indirect command buffers for a line layer, (re)generating
+        them if necessary.
+
+        Args:
+            rec (LineLayerRecord): The line layer record to retrieve the buffers for.
+
+        Returns:
+            tuple:
+              0. int: The OpenGL array buffer holding the identifier colors.
+              1. int: The OpenGL indirect draw buffer holding one command per linestring.
+        """
+
+        # as with points, the buffers are owned by the source record.
+        src = rec.srcRecord if isinstance(rec, ReferenceRecord) else rec
+        entry = src.pickBuffers.get(rec.id)
+        if entry is None or entry[2] != len(rec.groups):
+            colorBuff, indirect = glGenBuffers(2) if entry is None else entry[:2]
+            colors = self._recordIdColors(rec.id, len(rec.groups))
+            glBindBuffer(GL_ARRAY_BUFFER, colorBuff)
+            glBufferData(GL_ARRAY_BUFFER, colors.nbytes, colors, GL_STATIC_DRAW)
+
+            cmds = np.empty(len(rec.groups), dtype=INDIRECT_DT)
+            cmds['count'] = rec.groupCounts
+            cmds['instanceCount'] = 1
+            cmds['first'] = rec.groupFirsts
+            cmds['baseInstance'] = np.arange(len(rec.groups), dtype=np.uint32)
+            glBindBuffer(GL_DRAW_INDIRECT_BUFFER, indirect)
+            glBufferData(GL_DRAW_INDIRECT_BUFFER, cmds.nbytes, cmds, GL_STATIC_DRAW)
+            glBindBuffer(GL_DRAW_INDIRECT_BUFFER, 0)
+            entry = src.pickBuffers[rec.id] = (colorBuff, indirect, len(rec.groups))
+        return entry[:2]
+
+    def _assignPolyFillColor(self, pickMode, rec, featInd, pickColors=None):
         """Assign appropriate polygon colors for the current rendering option.
 
         Args:
@@ -2204,16 +3084,24 @@ class GeometryGLScene(object):
                 colord by the feature color specified by `featInd`.
             rec (LayerRecord): The record to update colors for.
             featInd (int): The indexed feature to reference the color for.
+            pickColors (numpy.ndarray,optional): Precomputed id colors for `rec`, as returned by
+                `_getRecordIdColors()`; only used when `pickMode` is `True`.
 
+        Notes:
+            Feature colors are deliberately left as a uniform rather than moved into a buffer indexed per draw. The
+            stencil fill renders one polygon at a time, so a color table would still need a per-polygon index, and
+            `geomColors` is a live list (see `layerColors()`), so a GPU-side copy would have to be rebuilt every
+            frame; converting the list costs more than the uniform updates it would replace, most of which the
+            program manager skips when neighboring polygons share a color.
         """
 
         # assign the color for the current polygon.
-        colorLoc = self._progMgr['inColor']
         if not pickMode:
-            color = rec.geomColors[featInd]
+            self._progMgr.setColor(rec.geomColors[featInd])
+        elif pickColors is not None:
+            self._progMgr.setColor(pickColors[featInd])
         else:
-            color = self._getRecordIdColor(rec.id,featInd)
-        glUniform4fv(colorLoc, 1,glm.value_ptr(color))
+            self._progMgr.setColor(self._getRecordIdColor(rec.id, featInd))
 
 
     def layerColors(self, id):
@@ -2236,6 +3124,8 @@ class GeometryGLScene(object):
         if index is None:
             rec.setSingleColor(color)
         elif index < len(rec.geomColors):
+            if rec.geomColors[index] == color:
+                return
             rec.geomColors[index] = color
 
         self.markFullRefresh()
@@ -2312,15 +3202,6 @@ class GeometryGLScene(object):
             self.markFullRefresh()
             self._doRefresh()
 
-    def _updateRubberBandColor(self):
-        """Synchronize the color in the rubberband shaders with those stored within the GeometryGLScene object.
-        """
-
-        with self.grabContext():
-            self._progMgr.useProgram('rubberBand')
-            glUniform4fv(self._progMgr['color1'],1,glm.value_ptr(self._rbColor1))
-            glUniform4fv(self._progMgr['color2'], 1, glm.value_ptr(self._rbColor2))
-
     def _repackageIndexedColors(self, rec, dColor=glm.vec4(0., 0., 0., 1.)):
         """Synchronize the colors stored within a LayerRecord's VBO with a LayerRecord's indexed color values.
 
@@ -2332,10 +3213,7 @@ class GeometryGLScene(object):
         expColors = IndexedColor.expandIndexes(rec.geomColors, rec.count, dColor)
 
         with self.grabContext():
-            glBindVertexArray(rec.vao)
-
-            glBindBuffer(GL_ARRAY_BUFFER, rec.auxColorBuff)
-            glBufferSubData(GL_ARRAY_BUFFER, 0, expColors.nbytes, expColors)
+            self._bufferSubData(rec.auxColorBuff, 0, expColors)
             self.markFullRefresh()
             self._doRefresh()
 
@@ -2375,7 +3253,35 @@ class GeometryGLScene(object):
         if color != rec.geomColors[index].color:
             rec.geomColors[index].color = color
 
+            self._uploadIndexColorGroup(rec, rec.geomColors[index])
+
+    def _uploadIndexColorGroup(self, rec, iColor):
+        """Rewrite only the vertices of a single indexed color group in a LayerRecord's color VBO.
+
+        Each contiguous run of indices in the group is written with its own upload, so the cost scales with the
+        size of the group rather than with `rec.count`. Groups are assumed not to share indices with other groups
+        in the record.
+
+        Args:
+            rec (LayerRecord): Record of the layer to update.
+            iColor (IndexedColor): The group whose color changed.
+        """
+
+        inds = np.unique(np.asarray(iColor.inds, dtype=np.intp))
+        if len(inds) == 0:
+            return
+        runStarts = np.concatenate(([0], np.flatnonzero(np.diff(inds) != 1) + 1))
+        if len(runStarts) > GeometryGLScene._MAX_COLOR_RUNS:
+            # too scattered for per-run uploads to beat a single full upload.
             self._repackageIndexedColors(rec)
+            return
+        runEnds = np.append(runStarts[1:], len(inds))
+        rgba = np.array(iColor.color, dtype=np.float32)
+        with self.grabContext():
+            for s, e in zip(runStarts.tolist(), runEnds.tolist()):
+                self._bufferSubData(rec.auxColorBuff, int(inds[s]) * rgba.nbytes, np.tile(rgba, (e - s, 1)))
+            self.markFullRefresh()
+            self._doRefresh()
 
     def setRasterSmoothing(self,lyrid,smooth):
         """Toggle smoothing for rasters; only has effect for raster layers.
@@ -2443,12 +3349,21 @@ class GeometryGLScene(object):
         """Clean up intermediate VBOs and VAOs."""
 
         if bool(glDeleteBuffers):
-            buffs=[self._gFillBuff, self._rbBuff]
-            vaos=[self._gFillVao, self._rbVao]
+            buffs=[self._gFillBuff, self._rbBuff, self._colorsUbo, self._viewUbo, self._rasterTexBuff,
+                   self._unpackBuff, self._texDumpPbo]
+            vaos=[self._gFillVao, self._rbVao, self._rasterVao]
             if any(buffs):
+                # deleting the rubberband buffer implicitly unmaps it.
+                self._rbMapped = None
+                self._rbPending = None
+                self._rbSlot = 0
+                self._releaseRubberBandFences()
                 glDeleteBuffers(len(buffs), buffs)
             if any(vaos):
                 glDeleteVertexArrays(len(vaos), vaos)
+        for pool in self._vertPools.values():
+            pool.clear()
+        self._vertPools.clear()
 
         # TODO: add text/atlas cleanup here
 
@@ -2458,6 +3373,16 @@ class GeometryGLScene(object):
             with self.grabContext():
                 self.ClearAllLayers()
                 self.clearUtilityBuffers()
+                if self._frameBuff != 0:
+                    glDeleteFramebuffers(1, [self._frameBuff])
+                    glDeleteTextures(1, [self._fbTex])
+                    glDeleteRenderbuffers(1, [self._fbRbo])
+                    self._frameBuff = self._fbTex = self._fbRbo = 0
+                    self._fbCapacity = (0, 0)
+                if self._lastFence is not None:
+                    glDeleteSync(self._lastFence)
+                    self._lastFence = None
+                self._releaseRubberBandFences()
                 if self._initialized:
                     self._progMgr.cleanup()
                 for tr in self._txtRndrs.values():
@@ -2488,10 +3413,13 @@ class GeometryGLScene(object):
 
                 glViewport(*self._dims)
                 glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT | GL_STENCIL_BUFFER_BIT)
+                self._resyncGLState()
+                if self._sceneViewDirty:
+                    self._uploadSceneView()
 
                 # load and assign base shader program.
                 self._progMgr.useProgram('simple')
-                glUniformMatrix4fv(self._progMgr['mvpMat'], 1, GL_FALSE, glm.value_ptr(self._mvpMat))
+                self._setMVP()
 
                 for rec in reversed(self._drawStack):
 
@@ -2501,22 +3429,25 @@ class GeometryGLScene(object):
                         self._drawPointLayer(rec, True)
                     if isinstance(rec, LineLayerRecord) and self._allowLinePicking:
                         self._drawLineLayer(rec, True)
+                self._setBlend(False)
+                self._bindVao(0)
 
-                glFlush()
-                glFinish()
-
-                # glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
-                # glPixelStorei(GL_PACK_ALIGNMENT, 1)
-                lyLower, lyUpper, recLower, recUpper = glReadPixels(x, self._dims[3] - y, 1, 1, GL_RGBA, GL_FLOAT)[0][0]
+                # The read already waits for the pick draws above, so the pipeline is not drained beforehand. The
+                # read is not deferred either: callers act on the pick they just made rather than the previous one.
+                # channels are (layer low byte, layer high byte, group low byte, group high byte).
+                pixel = np.asarray(glReadPixels(x, self._dims[3] - y, 1, 1, GL_RGBA, GL_FLOAT), dtype=np.float32)
+                pixel = pixel.reshape(4)
 
             # raw = glReadPixels(x,y,1,1,GL_RG,GL_FLOAT)
 
-            if lyLower == 1. and lyUpper == 1. and recLower == 1. and recUpper == 1.:
+            if (pixel == 1.).all():
                 # miss
                 return None
 
-            layer = int(255 * lyLower) + (int((lyUpper * 255)) << 8)
-            group = int(255 * recLower) + (int((recUpper * 255)) << 8)
+            # rounded rather than truncated, so a channel read back as k/255 minus a rounding error still decodes as k.
+            codes = np.rint(pixel * 255.).astype(np.uint32)
+            layer = int(codes[0] | (codes[1] << 8))
+            group = int(codes[2] | (codes[3] << 8))
 
             return layer, group
 
@@ -2532,11 +3463,7 @@ class GeometryGLScene(object):
         lyr = self._layers[index]
         if isinstance(lyr, PointLayerRecord):
             # TODO: update below to be for a more general case
-            glBindVertexArray(lyr.vao)
-            glBindBuffer(GL_ARRAY_BUFFER, lyr.ptSelBuff)
-            glBufferSubData(GL_ARRAY_BUFFER, 0, lyr.selectedRecs.nbytes, lyr.selectedRecs)
-            glBindBuffer(GL_ARRAY_BUFFER, lyr.buff)
-            glBindVertexArray(0)
+            self._replaceBufferData(lyr.ptSelBuff, lyr.selectedRecs)
 
     def updateRubberBand(self, p1, p2):
         """Update the position of the rubberband box. A rubberband is a box usually defined by a user clicking and
@@ -2552,16 +3479,29 @@ class GeometryGLScene(object):
             self.rb_p1 = p1
             self.rb_p2 = p2
             if p1 is not None and p2 is not None:
-                verts = np.array([p1[0], p1[1],
-                                  p1[0], p2[1],
-                                  p2[0], p2[1],
-                                  p2[0], p1[1]], dtype=np.float32)
+                verts = self._rbVerts
+                verts[0] = verts[2] = p1[0]
+                verts[1] = verts[7] = p1[1]
+                verts[3] = verts[5] = p2[1]
+                verts[4] = verts[6] = p2[0]
+
+                if self._rbMapped is not None:
+                    # copied into the mapped ring on the next paint; see _stageRubberBand().
+                    self._rbPending = verts
+                else:
+                    with self.grabContext():
+                        self._replaceBufferData(self._rbBuff, verts, GL_STREAM_DRAW)
 
-                with self.grabContext():
-                    glBindVertexArray(self._rbVao)
-                    glBindBuffer(GL_ARRAY_BUFFER, self._rbBuff)
-                    glBufferSubData(GL_ARRAY_BUFFER, 0, verts.nbytes, verts)
-                    glBindVertexArray(0)
+    def _inverseMVP(self):
+        """Retrieve the inverse of the MVP matrix, computing it only if the MVP matrix changed since the last call.
+
+        Returns:
+            glm.mat4: The inverse model-view-projection matrix.
+        """
+
+        if self._mvpInvMat is None:
+            self._mvpInvMat = glm.inverse(self._mvpMat)
+        return self._mvpInvMat
 
     def ClipPtToScene(self, pt):
         """ Perform a reverse-point lookup on the scene
@@ -2574,7 +3514,7 @@ class GeometryGLScene(object):
         """
         h_pt = glm.vec4(pt[0], pt[1], 0,1)
 
-        return self._mvpInvMat * h_pt
+        return self._inverseMVP() * h_pt
 
     def ScenePtToClip(self, pt):
         """Converts a point from scene space to the equivalent point in clip space.
@@ -2589,6 +3529,52 @@ class GeometryGLScene(object):
 
         return self._mvpMat * h_pt
 
+    def ClipPtsToScene(self, pts):
+        """Batched version of `ClipPtToScene()`.
+
+        Args:
+            pts (numpy.ndarray): Nx2 array of points in clip space.
+
+        Returns:
+            numpy.ndarray: Nx4 array of homogenous coordinates from the scene.
+        """
+
+        if self._mvpInvArr is None:
+            self._mvpInvArr = np.array(self._inverseMVP(), dtype=np.float64).T
+        return GeometryGLScene._homogenize(pts, 1.) @ self._mvpInvArr
+
+    def ScenePtsToClip(self, pts):
+        """Batched version of `ScenePtToClip()`.
+
+        Args:
+            pts (numpy.ndarray): Nx2 array of points in scene space.
+
+        Returns:
+            numpy.ndarray: Nx4 array of the points as represented in clip space.
+        """
+
+        if self._mvpArr is None:
+            self._mvpArr = np.array(self._mvpMat, dtype=np.float64).T
+        return GeometryGLScene._homogenize(pts, 0.) @ self._mvpArr
+
+    @staticmethod
+    def _homogenize(pts, w):
+        """Expand 2D points into homogenous coordinates with a z of 0.
+
+        Args:
+            pts (numpy.ndarray): Nx2 array of points.
+            w (float): The value to assign to the w component.
+
+        Returns:
+            numpy.ndarray: Nx4 array of homogenous points.
+        """
+
+        pts = np.asarray(pts, dtype=np.float64).reshape(-1, 2)
+        h_pts = np.zeros([len(pts), 4], dtype=np.float64)
+        h_pts[:, :2] = pts
+        h_pts[:, 3] = w
+        return h_pts
+
     # </editor-fold>
 
     # <editor-fold desc="Texture management">
@@ -2610,46 +3596,60 @@ class GeometryGLScene(object):
                 raise ValueError('Record {} is not a polygon layer.'.format(layerId))
             layer = self._layers[layerId]
 
-            # remove old, if any
-            glDeleteTextures(1, [layer.refTex])
-            glDeleteVertexArrays(1, [layer.refVao])
-            glDeleteBuffers(1, [layer.refBuff])
-
-            layer.refTex = glGenTextures(1)
-            layer.refVao = glGenVertexArrays(1)
-            layer.refBuff = glGenBuffers(1)
+            # Objects from an earlier call are reused; their storage is refilled below. The one exception is a
+            # texture with immutable storage of a different size, which cannot be resized in place.
+            if layer.refTex != 0 and self._hasTexStorage and \
+                    self._texDims.get(layer.refTex) != (GL_TEXTURE_2D, GL_RED, vals.shape[1], vals.shape[0], GL_RED):
+                glDeleteTextures(1, [layer.refTex])
+                self._texDims.pop(layer.refTex, None)
+                layer.refTex = 0
+            if layer.refTex == 0:
+                layer.refTex = glGenTextures(1)
+            newVao = layer.refVao == 0
+            if newVao:
+                layer.refVao = glGenVertexArrays(1)
+                layer.refBuff = glGenBuffers(1)
 
             valMin = vals.min()
             valMax = vals.max()
 
-            # build surface for texture
-            glBindVertexArray(layer.refVao)
-            glBindBuffer(GL_ARRAY_BUFFER, layer.refBuff)
-
-            minX, maxX, minY, maxY = layer.exts
-            rMinX, rMaxX, rMinY, rMaxY = refExts
-            minS = (minX - rMinX) / (rMaxX - rMinX)
-            maxS = (maxX - rMinX) / (rMaxX - rMinX)
-            minT = (minY - rMinY) / (rMaxY - rMinY)
-            maxT = (maxY - rMinY) / (rMaxY - rMinY)
-            # minS = 0.
-            # maxS = 1.
-            # minT = 0.
-            # maxT = 1.
-            fill = np.array([minX, maxY, minS, maxT,
-                             minX, minY, minS, minT,
-                             maxX, maxY, maxS, maxT,
-                             maxX, minY, maxS, minT, ], dtype=np.float32)
-
-            glEnableVertexAttribArray(0)
-            glEnableVertexAttribArray(1)
-            step = 16  # four float32 s
-            glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, step, None)
-            glVertexAttribPointer(1, 2, GL_FLOAT, GL_FALSE, step, ctypes.c_void_p(8))
-            glBufferData(GL_ARRAY_BUFFER, fill.nbytes, fill, GL_STATIC_DRAW)
-
-            # normalize data
-            transVals = (vals - valMin) / (valMax - valMin)
+            # build surface for texture; only needed when the layer or reference extents have moved.
+            quadKey = (tuple(layer.exts), tuple(refExts))
+            if newVao or layer.refQuadKey != quadKey:
+                glBindVertexArray(layer.refVao)
+                glBindBuffer(GL_ARRAY_BUFFER, layer.refBuff)
+
+                minX, maxX, minY, maxY = layer.exts
+                rMinX, rMaxX, rMinY, rMaxY = refExts
+                invSpanX = 1. / (rMaxX - rMinX)
+                invSpanY = 1. / (rMaxY - rMinY)
+                minS = (minX - rMinX) * invSpanX
+                maxS = (maxX - rMinX) * invSpanX
+                minT = (minY - rMinY) * invSpanY
+                maxT = (maxY - rMinY) * invSpanY
+                # positions first, then texture coordinates, matching the layout of the layer buffers
+                fill = np.array([minX, maxY,
+                                 minX, minY,
+                                 maxX, maxY,
+                                 maxX, minY,
+                                 minS, maxT,
+                                 minS, minT,
+                                 maxS, maxT,
+                                 maxS, minT, ], dtype=np.float32)
+
+                if newVao:
+                    glEnableVertexAttribArray(0)
+                    glEnableVertexAttribArray(1)
+                    glVertexAttribPointer(0, 2, GL_FLOAT, GL_FALSE, 0, None)
+                    glVertexAttribPointer(1, 2, GL_FLOAT, GL_FALSE, 0, ctypes.c_void_p(fill.nbytes // 2))
+                glBufferData(GL_ARRAY_BUFFER, fill.nbytes, fill, GL_STATIC_DRAW)
+                layer.refQuadKey = quadKey
+
+            # normalize data; written straight into a single float32 array, which is also the format the texture
+            # upload wants, rather than through float64 temporaries.
+            transVals = np.subtract(vals, valMin, dtype=np.float32)
+            valRange = float(valMax - valMin)
+            transVals *= 1. / valRange if valRange != 0. else 0.
             self._LoadTexture(transVals, GL_TEXTURE0, GL_TEXTURE_2D, GL_RED, layer.refTex)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
@@ -2703,9 +3703,10 @@ class GeometryGLScene(object):
                     #     raise Exception("No reference texture defined")
 
                     texTarg = GL_TEXTURE1 if forRefTex else GL_TEXTURE2
+                    # the strip is consumed by the upload below, so one scratch array serves every call.
+                    strip = gradObj.colorStrip(GRAD_WIDTH, True, out=self._gradStrip)
                     if not isUpdate:
-                        self._LoadTexture(gradObj.colorStrip(GRAD_WIDTH, True), texTarg, GL_TEXTURE_1D, GL_RGBA,
-                                          tId,interp=True)
+                        self._LoadTexture(strip, texTarg, GL_TEXTURE_1D, GL_RGBA, tId,interp=True)
                         glTexParameteri(GL_TEXTURE_1D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
                         glTexParameteri(GL_TEXTURE_1D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
                         glTexParameteri(GL_TEXTURE_1D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
@@ -2714,7 +3715,7 @@ class GeometryGLScene(object):
                     else:
                         glActiveTexture(texTarg)
                         glBindTexture(GL_TEXTURE_1D, tId)
-                        glTexSubImage1D(GL_TEXTURE_1D, 0, 0, GRAD_WIDTH, GL_RGBA, GL_FLOAT, gradObj.colorStrip(GRAD_WIDTH, True))
+                        glTexSubImage1D(GL_TEXTURE_1D, 0, 0, GRAD_WIDTH, GL_RGBA, GL_FLOAT, strip)
 
                 self.markFullRefresh()
             else:
@@ -2756,12 +3757,9 @@ class GeometryGLScene(object):
         if id<0:
             return
         rec = self._layers[id]
-        loc = self._drawStack.index(rec)
-        if loc >= 0:
-            nextLoc = loc - 1
-            swpRec = self._drawStack[nextLoc]
-            self._drawStack[nextLoc] = rec
-            self._drawStack[loc] = swpRec
+        loc = self._drawStackIndex(rec)
+        if loc > 0:
+            self._swapDrawStack(loc, loc - 1)
             self.markFullRefresh()
             self._doRefresh()
 
@@ -2775,12 +3773,10 @@ class GeometryGLScene(object):
         if id<0:
             return
         rec = self._layers[id]
-        loc = self._drawStack.index(rec)
+        loc = self._drawStackIndex(rec)
         nextLoc = loc + 1
         if len(self._drawStack) > nextLoc:
-            swpRec = self._drawStack[nextLoc]
-            self._drawStack[nextLoc] = rec
-            self._drawStack[loc] = swpRec
+            self._swapDrawStack(loc, nextLoc)
             self.markFullRefresh()
             self._doRefresh()
 
@@ -2794,8 +3790,10 @@ class GeometryGLScene(object):
         if id<0:
             return
         rec = self._layers[id]
-        self._drawStack.remove(rec)
+        self._drawStack.pop(self._drawStackIndex(rec))
         self._drawStack.insert(0, rec)
+        self._drawOrder = None
+        self._drawStackPos = None
 
     def moveBottomStack(self, id):
         """Move a layer to the bottom of the draw stack.
@@ -2807,8 +3805,10 @@ class GeometryGLScene(object):
         if id<0:
             return
         rec = self._layers[id]
-        self._drawStack.remove(rec)
-        self._drawStack.insert(len(self._drawStack), rec)
+        self._drawStack.pop(self._drawStackIndex(rec))
+        self._drawStack.append(rec)
+        self._drawOrder = None
+        self._drawStackPos = None
 
     def getDrawStackPosition(self, id):
         """Get the draw indexed position of a layer in the draw stack. The higher the index, the lower down the stack
@@ -2821,7 +3821,7 @@ class GeometryGLScene(object):
             int: The designated layers index within the draw stack.
         """
 
-        return self._drawStack.index(self._layers[id])
+        return self._drawStackIndex(self._layers[id])
 
     def setDrawStackPosition(self, id, pos):
         """Move a layer to a specific position within the draw stack.
@@ -2838,6 +3838,8 @@ class GeometryGLScene(object):
         if pos > oldLoc:
             pos -= 1
         self._drawStack.insert(pos, rec)
+        self._drawOrder = None
+        self._drawStackPos = None
 
     # </editor-fold>
 
@@ -2854,12 +3856,15 @@ class GeometryGLScene(object):
             TxtRenderer: Either a new renderer, or an existing renderer if one already matches the arguments.
         """
 
-        from .textrenderer import TxtRenderer
+        # Only label layer creation comes through here; draws use the renderer stored on the record
+        # (`rec.txtRenderer`), so there is no per-draw key to cache.
         key = (os.path.basename(fontPath),ptSize)
-        if key in self._txtRndrs:
-            return self._txtRndrs[key]
+        existing = self._txtRndrs.get(key)
+        if existing is not None:
+            return existing
         # else
 
+        from .textrenderer import TxtRenderer
         if not os.path.exists(fontPath):
             # assume DEFAULT works
             fontPath = DEFAULT_FONT
@@ -2911,9 +3916,13 @@ class GeometryGLScene(object):
 
         from .LayerCaching import GaiaGLCacheException
         if self._initialized:
+            if not isinstance(rec, LayerRecord):
+                rec = self._layers[id]
+            if rec.cpuVerts is not None:
+                # the host copy matches the buffer contents; skip the blocking readback.
+                strm.write(np.asarray(rec.cpuVerts, dtype=np.float32).tobytes())
+                return
             with self.grabContext():
-                if not isinstance(rec, LayerRecord):
-                    rec = self._layers[id]
                 glBindVertexArray(rec.vao)
                 glBindBuffer(GL_ARRAY_BUFFER, rec.buff)
                 bytecount = 0
@@ -2924,7 +3933,7 @@ class GeometryGLScene(object):
                     bytecount = rec.vertCount * np.dtype(np.float32).itemsize * 2
                 elif isinstance(rec, LineLayerRecord):
                     bytecount = rec.vertCount * np.dtype(np.float32).itemsize * 2
-                outVerts = glGetBufferSubData(GL_ARRAY_BUFFER, 0, bytecount)
+                outVerts = glGetBufferSubData(GL_ARRAY_BUFFER, rec.buffOffset, bytecount)
                 strm.write(outVerts)
                 glBindVertexArray(0)
         else:
@@ -2971,7 +3980,7 @@ class GeometryGLScene(object):
 
         if self._initialized:
             with self.grabContext():
-                oldVao=np.zeros(1,dtype=np.float32)
+                oldVao = self._scratchI32[:1]
                 glGetIntegerv(GL_VERTEX_ARRAY_BINDING,oldVao)
                 glBindVertexArray(0)
                 glBindBuffer(buffType, buff)
@@ -2991,11 +4000,12 @@ class GeometryGLScene(object):
         """
 
         with self.grabContext():
-            oldVao = np.zeros(1, dtype=np.float32)
+            oldVao = self._scratchI32[:1]
             glGetIntegerv(GL_VERTEX_ARRAY_BINDING, oldVao)
             glBindVertexArray(0)
             glBindBuffer(GL_ARRAY_BUFFER, rec.buff)
-            dimBuff = np.zeros(1, dtype=np.int32)
+            glBindTexture(GL_TEXTURE_2D, rec.texId)
+            dimBuff = self._scratchI32[1:2]
             glGetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_WIDTH, dimBuff)
             width = dimBuff[0]
             glGetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_HEIGHT, dimBuff)
@@ -3009,14 +4019,35 @@ class GeometryGLScene(object):
             glGetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_ALPHA_SIZE, dimBuff)
             aSize = dimBuff[0]
 
-            glGetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_INTERNAL_FORMAT, dimBuff)
-            internalFormat = dimBuff[0]
-
-            floatcount = ((rSize + gSize + bSize + aSize) // 8) * width * height
-
-            strm.write(np.array([(width, height, internalFormat, floatcount)], dtype=GeometryGLScene.TEXHEAD_DT).tobytes())
-            dump = glGetTexImage(GL_TEXTURE_2D, 0, internalFormat, GL_FLOAT)
-            strm.write(dump)
+            # Textures are allocated with sized internal formats (see _SIZED_TEX_FORMATS), which glGetTexImage does not
+            # accept as a pixel format; read back, and record, the base format matching the channels present instead.
+            channels = sum(1 for s in (rSize, gSize, bSize, aSize) if s > 0)
+            baseFormat = (GL_RED, GL_RG, GL_RGB, GL_RGBA)[channels - 1]
+
+            floatcount = channels * width * height
+
+            strm.write(np.array([(width, height, baseFormat, floatcount)], dtype=GeometryGLScene.TEXHEAD_DT).tobytes())
+
+            # Copy the texture into a pack buffer and wait on a fence rather than having glGetTexImage stall inside the
+            # driver while it fills client memory; the bytes are then streamed straight out of the mapping.
+            nbytes = floatcount * np.dtype(np.float32).itemsize
+            if self._texDumpPbo == 0:
+                self._texDumpPbo = glGenBuffers(1)
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, self._texDumpPbo)
+            if nbytes > self._texDumpPboSize:
+                glBufferData(GL_PIXEL_PACK_BUFFER, nbytes, None, GL_STREAM_READ)
+                self._texDumpPboSize = nbytes
+            glGetTexImage(GL_TEXTURE_2D, 0, baseFormat, GL_FLOAT, ctypes.c_void_p(0))
+            fence = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+            glClientWaitSync(fence, GL_SYNC_FLUSH_COMMANDS_BIT, GL_TIMEOUT_IGNORED)
+            glDeleteSync(fence)
+            ptr = glMapBufferRange(GL_PIXEL_PACK_BUFFER, 0, nbytes, GL_MAP_READ_BIT)
+            try:
+                strm.write(ctypes.string_at(ptr, nbytes))
+            finally:
+                glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+                glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+            glBindTexture(GL_TEXTURE_2D, 0)
             glBindVertexArray(oldVao[0])
 
 
@@ -3031,17 +4062,31 @@ class GeometryGLScene(object):
             tuple: Integer flag representing the internal data type of the texture, and a numpy array containing the
                    raw pixel data, or `(None,None)` if `skip` is `True`.
         """
-        buff = np.fromfile(strm, GeometryGLScene.TEXHEAD_DT, 1)
+        buff = np.fromfile(strm, GeometryGLScene.TEXHEAD_DT, 1)[0]
         width = int(buff['width'])
         height = int(buff['height'])
         internal = int(buff['internal'])
         floatcount = int(buff['floats'])
 
         if not skip:
-            buff = np.fromfile(strm, np.float32, floatcount)
-            pxdata = buff.reshape([height, width, floatcount // (width * height)])
+            shape = (height, width, floatcount // (width * height))
+            pxdata = None
+            if self._initialized and floatcount > 0:
+                # Map the pixels straight from the file instead of reading them through a private copy. This is only
+                # done when the data is uploaded immediately, so the mapping does not keep the file open for long.
+                try:
+                    strm.fileno()
+                    offset = strm.tell()
+                except (AttributeError, OSError):
+                    offset = None
+                if offset is not None:
+                    pxdata = np.memmap(strm, dtype=np.float32, mode='r', offset=offset, shape=shape)
+                    strm.seek(offset + pxdata.nbytes)
+            if pxdata is None:
+                buff = np.fromfile(strm, np.float32, floatcount)
+                pxdata = buff.reshape(shape)
         else:
-            strm.seek(np.float32.itemsize*floatcount,whence=1)
+            strm.seek(np.dtype(np.float32).itemsize*floatcount,1)
             internal = None
             pxdata = None
         return internal, pxdata
@@ -592,6 +592,12 @@ class OGRGLScene(GeometryGLScene):
             self._fids.pop(id, None)
         super().ClearLineLayers()
 
+    def ClearRasterLayers(self):
+        idCache = tuple(self._rasterLayerIds)
+        for id in idCache:
+            self._spatRefs.pop(id,None)
+        super().ClearRasterLayers()
+
     def ClearAllLayers(self):
         self._fids.clear()
         self._spatRefs.clear()
@@ -613,24 +619,27 @@ class OGRGLScene(GeometryGLScene):
                 rec=self.GetLayer(id)
 
                 bytecount = rec.vertCount * 2 * np.dtype(np.float32).itemsize
-                self._beginContext()
-                glBindVertexArray(rec.vao)
-                glBindBuffer(GL_ARRAY_BUFFER,rec.buff)
-                verts=np.frombuffer(glGetBufferSubData(GL_ARRAY_BUFFER,0,bytecount),dtype=np.float32)
-
-                verts=verts.reshape([rec.vertCount,2])
-                verts=np.array(transForm.TransformPoints(verts),np.float32)[:,:2]
-
-                rec.exts = [np.min(verts[:,0]),
-                            np.max(verts[:,0]),
-                            np.min(verts[:,1]),
-                            np.max(verts[:,1])
-                            ]
-
-                glBufferSubData(GL_ARRAY_BUFFER,0,verts.nbytes,verts)
-                glBindVertexArray(0)
-                self.recalcMaxExtentsFromLayers()
-                self._endContext()
+                with self.grabContext():
+                    glBindVertexArray(rec.vao)
+                    glBindBuffer(GL_ARRAY_BUFFER,rec.buff)
+                    if rec.cpuVerts is not None:
+                        verts=np.asarray(rec.cpuVerts,dtype=np.float32)
+                    else:
+                        verts=np.frombuffer(glGetBufferSubData(GL_ARRAY_BUFFER,rec.buffOffset,bytecount),dtype=np.float32)
+
+                    verts=verts.reshape([rec.vertCount,2])
+                    verts=np.array(transForm.TransformPoints(verts),np.float32)[:,:2]
+
+                    rec.exts = [np.min(verts[:,0]),
+                                np.max(verts[:,0]),
+                                np.min(verts[:,1]),
+                                np.max(verts[:,1])
+                                ]
+
+                    glBufferSubData(GL_ARRAY_BUFFER,rec.buffOffset,verts.nbytes,verts)
+                    rec.cpuVerts=verts if rec.volatile else None
+                    glBindVertexArray(0)
+                    self.recalcMaxExtentsFromLayers()
         else:
             self._ogr_caches.setdefault('ReprojectLayer',[]).append((id,toSRef))
 
@@ -29,7 +29,14 @@ you know what you are doing.
 
 """
 
+import glm
+import numpy as np
 from OpenGL.GL import *
+# Unwrapped entry points for per-draw uniform uploads; these skip PyOpenGL's argument size inference and conversion,
+# which is safe here since values are always passed as float32 pointers or contiguous float32 arrays.
+from OpenGL.raw.GL.VERSION.GL_2_0 import glUniform1f as _rawUniform1f, glUniform1i as _rawUniform1i, \
+    glUniform2f as _rawUniform2f, glUniform3fv as _rawUniform3fv, glUniform4fv as _rawUniform4fv, \
+    glUniformMatrix4fv as _rawUniformMatrix4fv
 
 
 
@@ -40,6 +47,37 @@ _defines = '''#version 430
 
 '''
 
+# Uniform buffer binding point of the scene-wide colors; see `_sceneColors`.
+SCENE_COLORS_BINDING = 0
+
+# Colors that are shared by the whole scene rather than set per layer. These are stored in a single uniform buffer
+# which is only refreshed when one of the colors changes, instead of being reloaded into each program on every draw.
+# Member order and std140 packing must match `GeometryGLScene._uploadSceneColors()`.
+_sceneColors = '''
+layout(std140, binding=''' + str(SCENE_COLORS_BINDING) + ''') uniform SceneColors
+{
+    vec4 selectPolyColor1;
+    vec4 selectPolyColor2;
+    vec4 ptSelectColor;
+    vec4 rbColor1;
+    vec4 rbColor2;
+};
+'''
+
+# Uniform buffer binding point of the scene-wide view state; see `_sceneView`.
+SCENE_VIEW_BINDING = 1
+
+# View state shared by every program that draws in scene coordinates. Programs that need to swap in the identity
+# matrix mid-layer (those built on `passthru_vert`) keep their own `mvpMat` uniform instead.
+# Member order and std140 packing must match `GeometryGLScene._uploadSceneView()`.
+_sceneView = '''
+layout(std140, binding=''' + str(SCENE_VIEW_BINDING) + ''') uniform SceneView
+{
+    mat4 mvpMat;
+    vec2 resolution;
+};
+'''
+
 _pointFns = '''
 //Charcodes for point glyphs
 #define ORD_CIRCLE   46u  //'.'
@@ -242,12 +280,16 @@ thickline_vert = _defines + '''
 
 in layout(location=0) vec2 vert;
 in layout(location=1) float inRefVal;
-
-uniform mat4  mvpMat;
-uniform vec2  resolution;
+''' + _sceneView + '''
 
 out float gRefVal;
 
+#ifdef PICK_COLORS
+// identifier color of the linestring, sourced once per instance; see ShaderProgMgr.loadVariant()
+in layout(location=2) vec4 inPickColor;
+out vec4 gPickColor;
+#endif
+
 void main()
 {
     vec4 pos = mvpMat * vec4(vert,0.,1.);
@@ -255,6 +297,9 @@ void main()
     pos.xy = (pos.xy + 1.0) * 0.5 * resolution;
 
     gRefVal = inRefVal;
+#ifdef PICK_COLORS
+    gPickColor = inPickColor;
+#endif
     gl_Position = pos;
 }
 '''
@@ -263,7 +308,7 @@ refcolortex_vert = _defines + '''
 
 layout (location=0) in vec4 pos;
 layout (location=1) in vec2 st;
-uniform mat4 mvpMat;
+''' + _sceneView + '''
 
 out vec2 tCoord;
 
@@ -285,9 +330,11 @@ layout (location=1) in int selected;
 layout (location=2) in vec4 inColor;
 layout (location=3) in float inSize;
 layout (location=4) in uint inGlyph;
-uniform mat4 pMat;
+''' + _sceneView + '''
 
 //uniform vec4 inColor;
+// scale and offset applied to inSize; lets a value stream bound to inSize be mapped to point sizes.
+uniform vec2 sizeXform = vec2(1.,0.);
 
 flat out int fSelected;
 flat out vec4 ptColor;
@@ -296,12 +343,13 @@ flat out uint glyph;
 
 void main()
 {
-    vec4 vert =pMat*pos;
+    vec4 vert =mvpMat*pos;
     gl_Position= vert;
-    gl_PointSize=inSize;
+    float size = inSize*sizeXform[0]+sizeXform[1];
+    gl_PointSize=size;
     fSelected = selected;
     ptColor = inColor;
-    ptScale = inSize;
+    ptScale = size;
     glyph = inGlyph;
     
     
@@ -313,8 +361,7 @@ point_ref_vert = _defines + '''
 layout (location=0) in vec4 pos;
 layout (location=1) in int selected;
 layout (location=2) in float inRefVal;
-
-uniform mat4 mvpMat;
+''' + _sceneView + '''
 uniform vec2 refSizeRange=vec2(1.,1.);
 uniform bool clampGradient = false;
 uniform vec2 valueBoundaries = vec2(0.,1.);
@@ -348,9 +395,8 @@ in layout(location=1) vec2 st;
 in layout(location=2) vec3 anchor;
 in layout(location=3) vec4 color;
 
-uniform mat4 mvpMat;
+''' + _sceneView + '''
 uniform vec2 xyOffs=vec2(0.0,0.0);
-uniform vec2 resolution;
 
 out vec2 f_st;
 out vec4 fillColor;
@@ -389,16 +435,11 @@ void main()
 fbBlit_vert = _defines + '''
 
 in layout(location=0) vec4 pos;
-out vec2 fCoord;
 
 void main()
 {
     // passthru vert
     gl_Position = pos;
-
-    // convert [-1,1] to [0,1]
-    fCoord = (pos.xy + 1.) / 2.;
-
 }
 '''
 
@@ -411,18 +452,25 @@ thickline_geom = _defines + '''
 
 layout(lines_adjacency) in;
 layout(triangle_strip,max_vertices=8) out;
-
-uniform vec2  resolution;
+''' + _sceneView + '''
 uniform float width;
 
 in float gRefVal[];
 out vec2 refCoord;
 out float refVal;
 
+#ifdef PICK_COLORS
+in vec4 gPickColor[];
+flat out vec4 pickColor;
+#endif
+
 void emitVertex(vec4 v,vec2 circleVert,float inVal)
 {
     refCoord = circleVert;
     refVal = inVal;
+#ifdef PICK_COLORS
+    pickColor = gPickColor[1];
+#endif
     v.xy = v.xy / resolution * 2. - 1.;
     v.xyz *= v.w;
     gl_Position = v;
@@ -496,7 +544,8 @@ flat in float ptScale;
 flat in uint glyph;
 
 //uniform uint glyph = 46u; //circle
-uniform vec4 selectColor;
+''' + _sceneColors + '''
+#define selectColor ptSelectColor
 //uniform float ptScale;
 uniform vec4 edgeColor= vec4(0.,0.,0.,1.);
 
@@ -544,8 +593,8 @@ flat in float ptScale;
 
 // use location 1 to be consistant with colorbands in other shaders
 layout(binding=1) uniform sampler1D colorBand;
-
-uniform vec4 selectColor;
+''' + _sceneColors + '''
+#define selectColor ptSelectColor
 uniform vec4 edgeColor= vec4(0.,0.,0.,1.);
 
 uniform bool customGradient = false;
@@ -633,14 +682,13 @@ select_frag = _defines + '''
 
 layout (location=0) out vec4 vColor;
 
-uniform vec4 inColor1;
-uniform vec4 inColor2;
+''' + _sceneColors + '''
 uniform float stripeWidth = 10;
 void main()
 {
-    vColor=inColor1;
+    vColor=selectPolyColor1;
     if (mod(gl_FragCoord.x + gl_FragCoord.y, stripeWidth) > stripeWidth*0.5)
-        vColor = inColor2;
+        vColor = selectPolyColor2;
 }
 '''
 
@@ -654,6 +702,10 @@ uniform float stripeWidth = 10;
 
 in vec2 refCoord;
 
+#ifdef PICK_COLORS
+flat in vec4 pickColor;
+#endif
+
 float sqLength(vec2 v)
 {
     return pow(v.x,2)+pow(v.y,2);
@@ -663,9 +715,13 @@ void main()
 {
     if(sqLength(refCoord)>1.)
         discard;
+#ifdef PICK_COLORS
+    vColor=pickColor;
+#else
     vColor=inColor1;
     if (mod(gl_FragCoord.x + gl_FragCoord.y, stripeWidth) > stripeWidth*0.5)
         vColor = inColor2;
+#endif
     //vColor=vec4(0.,fDist,0.,1.);
 }
 '''
@@ -679,7 +735,12 @@ in vec2 tCoord;
 layout(binding=0) uniform sampler2D valueTex;
 layout(binding=1) uniform sampler1D colorBand;
 
+#ifdef CUSTOM_GRADIENT
+// specialized variant; see ShaderProgMgr.loadVariant()
+const bool customGradient = CUSTOM_GRADIENT != 0;
+#else
 uniform bool customGradient = false;
+#endif
 uniform bool clampGradient = false;
 uniform vec2 valueBoundaries = vec2(0.,1.);
 
@@ -749,7 +810,12 @@ in vec2 tCoord;
 uniform float refValue;
 layout(binding=2) uniform sampler1D colorBand;
 
+#ifdef CUSTOM_GRADIENT
+// specialized variant; see ShaderProgMgr.loadVariant()
+const bool customGradient = CUSTOM_GRADIENT != 0;
+#else
 uniform bool customGradient = false;
+#endif
 
 void main()
 {
@@ -777,8 +843,7 @@ rubberband_frag = _defines + '''
 
 in vec2 st;
 
-uniform vec4 color1 = vec4(0.,0.,0.,1.);
-uniform vec4 color2 = vec4(1.,1.,1.,1.);
+''' + _sceneColors + '''
 
 layout (location=0) out vec4 fColor;
 void main()
@@ -786,9 +851,9 @@ void main()
     int ix= int(100.0 * st.x);
     int iy= int(100.0 * st.y);
 
-    fColor=color1;
+    fColor=rbColor1;
     if ((ix+iy) % 2==1)
-        fColor = color2;
+        fColor = rbColor2;
 }
 '''
 
@@ -856,15 +921,14 @@ void main(void)
 '''
 fbBlit_frag = _defines + '''
 
-in vec2 fCoord;
-
 layout(binding=0) uniform sampler2D frameBuff;
 
 layout (location=0) out vec4 fColor;
 
 void main()
 {
-    fColor = texture(frameBuff,fCoord);
+    // the framebuffer texture may be larger than the viewport; fetch by pixel so only the drawn region is read.
+    fColor = texelFetch(frameBuff,ivec2(gl_FragCoord.xy),0);
     //fColor = vec4(1.,0.,0.,1.);
 }
 
@@ -893,13 +957,10 @@ shader_recipes = {"simple":     (passthru_vert,   None,           simple_frag,
 fieldMappings={"simple":["mvpMat",
                          "inColor"
                         ],
-               "point":["pMat",
-                        "selectColor",
-                        "inColor",
+               "point":["inColor",
+                        "sizeXform",
                         ],
-             "refPoint":["mvpMat",
-                         "refSizeRange",
-                         "selectColor",
+             "refPoint":["refSizeRange",
                          "edgeColor",
                          "customGradient",
                          "clampGradient",
@@ -907,24 +968,17 @@ fieldMappings={"simple":["mvpMat",
                          "flatPtScale",
                          "glyph"
                         ],
-            "thickline":["mvpMat",
-                         "inColor1",
+            "thickline":["inColor1",
                          "inColor2",
                          "width",
-                         "resolution",
                         ],
-              "refline":["mvpMat",
-                         "width",
-                         "resolution",
+              "refline":["width",
                          "customGradient",
                          "valueBoundaries",
                         ],
            "selectPoly":["mvpMat",
-                         "inColor1",
-                         "inColor2",
                         ],
-          "refColorTex":["mvpMat",
-                         "customGradient",
+          "refColorTex":["customGradient",
                          "valueBoundaries",
                          "clampGradient"
                         ],
@@ -932,18 +986,13 @@ fieldMappings={"simple":["mvpMat",
                          "refValue",
                          "customGradient"
                         ],
-           "rubberBand":["color1",
-                         "color2",
-                        ],
-                 "text":["mvpMat",
-                         "xyOffs",
-                         "resolution",
+           "rubberBand":[],
+                 "text":["xyOffs",
                          "textAtlas",
                          "showOutline",
                          "outlineColor",
                         ],
-                 "raster":["mvpMat",
-                         "selectColor",
+                 "raster":["selectColor",
                          "isSelect"
                         ]
    }
@@ -1074,19 +1123,70 @@ class ShaderProgMgr(object):
     def __init__(self,progRecipes=None,mappings=None):
 
         self._active=0
+        # program last passed to glUseProgram, or None if unknown; see invalidateBinding().
+        self._bound=None
+        self._mvpLoc=-1
+        self._colorLoc=-1
 
         if progRecipes is None:
             progRecipes = shader_recipes
         if mappings is None:
             mappings = fieldMappings
 
+        self._recipes = progRecipes
+        self._fieldMappings = mappings
         self._progs= buildShaders(progRecipes)
         self._mappings = findUniformLocations(self._progs,mappings)
+        # the model-view-projection matrix is uploaded far more than any other uniform, so keep its location handy.
+        # Programs that read the matrix from the `SceneView` uniform block have no location of their own.
+        self._mvpLocs = {p: m.get('mvpMat', -1) for p, m in self._mappings.items()}
+        # likewise for the flat color, which polygon fills assign once per feature; see setColor().
+        self._colorLocs = {p: m.get('inColor', -1) for p, m in self._mappings.items()}
+        # tag of the matrix last uploaded to each program; see setMvpMatrix().
+        self._mvpTags = {}
+        # last value uploaded through the setUniform*() methods, keyed by (program, location).
+        self._uniformVals = {}
 
     def cleanup(self):
         """Delete all the programs managed by this manager."""
         for prog in self._progs.values():
             glDeleteProgram(prog)
+        self._bound = None
+        self._uniformVals.clear()
+        self._mvpTags.clear()
+
+    def loadVariant(self, name, variantName, defines):
+        """Build a specialized copy of a managed program by defining preprocessor symbols ahead of its sources.
+
+        Shaders that support specialization check for the symbols with `#ifdef`, and replace the equivalent uniform
+        with a compile-time constant; this removes the branch from the compiled shader.
+
+        Args:
+            name (str): The name of the program recipe to specialize.
+            variantName (str): The name to register the new program under.
+            defines (dict): The preprocessor symbols (keys) and the values (values) to define them with.
+
+        Returns:
+            int: The OpenGL identifier of the new program.
+        """
+
+        defLines = ''.join(f'#define {k} {v}\n' for k, v in defines.items())
+        recipe = []
+        for src in self._recipes[name]:
+            if src is not None:
+                # definitions must follow the #version directive.
+                verLine, _, body = src.partition('\n')
+                src = verLine + '\n' + defLines + body
+            recipe.append(src)
+
+        prog = buildShaders({variantName: recipe})[variantName]
+        self._progs[variantName] = prog
+        self._mappings.update(findUniformLocations({variantName: prog},
+                                                   {variantName: self._fieldMappings.get(name, [])}))
+        m = self._mappings[prog]
+        self._mvpLocs[prog] = m.get('mvpMat', -1)
+        self._colorLocs[prog] = m.get('inColor', -1)
+        return prog
 
     def useProgram(self,progName=None):
         """Activate a shader prograam by name.
@@ -1095,8 +1195,7 @@ class ShaderProgMgr(object):
             progName (str,optional): The name of the program to activate; all programs are deactivated if omitted.
         """
 
-        self._active = self._progs[progName] if progName is not None else 0
-        glUseProgram(self._active)
+        self.useProgramDirectly(self._progs[progName] if progName is not None else 0)
 
     def useProgramDirectly(self,prog):
         """Activate a shader prograam by OpenGL identifier.
@@ -1106,7 +1205,148 @@ class ShaderProgMgr(object):
         """
 
         self._active = prog
-        glUseProgram(self._active)
+        self._mvpLoc = self._mvpLocs.get(self._active, -1)
+        self._colorLoc = self._colorLocs.get(self._active, -1)
+        # consecutive layers of the same kind request the same program; only switch when it actually changes.
+        if prog != self._bound:
+            glUseProgram(prog)
+            self._bound = prog
+
+    def invalidateBinding(self):
+        """Forget which program is bound, so the next activation is always issued.
+
+        Call whenever code outside of this manager may have changed the bound program.
+        """
+
+        self._bound = None
+
+    def setMvpMatrix(self, matPtr, tag):
+        """Upload a matrix to the model-view-projection uniform of the active program, if it isn't already loaded.
+
+        Args:
+            matPtr (ctypes.c_void_p): Pointer to the matrix values, as returned by `glm.value_ptr()`.
+            tag (int): Value identifying the matrix contents; the upload is skipped if the active program was last
+              given a matrix with the same tag, or if it has no `mvpMat` uniform of its own.
+        """
+
+        if self._mvpLoc != -1 and self._mvpTags.get(self._active) != tag:
+            _rawUniformMatrix4fv(self._mvpLoc, 1, GL_FALSE, matPtr)
+            self._mvpTags[self._active] = tag
+
+    def _uniformChanged(self, name, value):
+        """Record the value about to be assigned to a uniform of the active program.
+
+        Uniform values persist within their program, so an upload can be skipped if the value is the one already
+        assigned. Only uniforms that are always assigned through the `setUniform*()` methods can be tracked this way.
+
+        Args:
+            name (str): The name of the uniform.
+            value (object): Comparable representation of the value to assign.
+
+        Returns:
+            int: The location of the uniform, or -1 if the uniform already holds `value`.
+        """
+
+        loc = self[name]
+        key = (self._active, loc)
+        if self._uniformVals.get(key) == value:
+            return -1
+        self._uniformVals[key] = value
+        return loc
+
+    def setUniform1i(self, name, value):
+        """Assign an integer (or boolean) uniform in the active program, if it doesn't already hold the value.
+
+        Args:
+            name (str): The name of the uniform.
+            value (int): The value to assign.
+        """
+
+        loc = self._uniformChanged(name, value)
+        if loc != -1:
+            _rawUniform1i(loc, value)
+
+    def setUniform1f(self, name, value):
+        """Assign a float uniform in the active program, if it doesn't already hold the value.
+
+        Args:
+            name (str): The name of the uniform.
+            value (float): The value to assign.
+        """
+
+        loc = self._uniformChanged(name, value)
+        if loc != -1:
+            _rawUniform1f(loc, value)
+
+    def setUniform2f(self, name, x, y):
+        """Assign a vec2 uniform in the active program, if it doesn't already hold the value.
+
+        Args:
+            name (str): The name of the uniform.
+            x (float): The first component to assign.
+            y (float): The second component to assign.
+        """
+
+        loc = self._uniformChanged(name, (x, y))
+        if loc != -1:
+            _rawUniform2f(loc, x, y)
+
+    def setUniform3fv(self, name, value):
+        """Assign a vec3 uniform in the active program, if it doesn't already hold the value.
+
+        Args:
+            name (str): The name of the uniform.
+            value (glm.vec3 or numpy.ndarray): The value to assign; arrays must be contiguous float32.
+        """
+
+        isArr = isinstance(value, np.ndarray)
+        loc = self._uniformChanged(name, value.tobytes() if isArr else bytes(value))
+        if loc != -1:
+            _rawUniform3fv(loc, 1, value if isArr else glm.value_ptr(value))
+
+    def setUniform4fv(self, name, value, ptr=None):
+        """Assign a vec4 uniform in the active program, if it doesn't already hold the value.
+
+        Args:
+            name (str): The name of the uniform.
+            value (glm.vec4 or numpy.ndarray): The value to assign; arrays must be contiguous float32.
+            ptr (ctypes.c_void_p,optional): Cached result of `glm.value_ptr(value)`; if omitted, the pointer is
+              retrieved as needed.
+        """
+
+        isArr = isinstance(value, np.ndarray)
+        loc = self._uniformChanged(name, value.tobytes() if isArr else bytes(value))
+        if loc != -1:
+            if ptr is None:
+                ptr = value if isArr else glm.value_ptr(value)
+            _rawUniform4fv(loc, 1, ptr)
+
+    def setColor(self, value, ptr=None):
+        """Assign the `inColor` uniform of the active program, if it doesn't already hold the value.
+
+        Equivalent to `setUniform4fv('inColor', value, ptr)`, but uses the location cached when the program was
+        activated rather than looking it up by name.
+
+        Args:
+            value (glm.vec4 or numpy.ndarray): The color to assign; arrays must be contiguous float32.
+            ptr (ctypes.c_void_p,optional): Cached result of `glm.value_ptr(value)`; if omitted, the pointer is
+              retrieved as needed.
+
+        Raises:
+            KeyError: If the active program has no `inColor` uniform.
+        """
+
+        loc = self._colorLoc
+        if loc == -1:
+            raise KeyError(f'inColor; not a uniform of program {self._active}')
+        isArr = isinstance(value, np.ndarray)
+        data = value.tobytes() if isArr else bytes(value)
+        key = (self._active, loc)
+        if self._uniformVals.get(key) != data:
+            self._uniformVals[key] = data
+            if ptr is None:
+                ptr = value if isArr else glm.value_ptr(value)
+            _rawUniform4fv(loc, 1, ptr)
 
     def __getitem__(self, item):
 
@@ -1135,3 +1375,9 @@ class ShaderProgMgr(object):
     def shaderProgram(self):
         """int: OpenGL identifier of active shader program."""
         return self._active
+
+    @property
+    def mvpLoc(self):
+        """int: Location of the model-view-projection matrix uniform (`mvpMat`) in the active shader program, or -1 if
+        not present."""
+        return self._mvpLoc
@@ -274,7 +274,7 @@ class TxtRenderer(object):
 
             self._initialized=True
 
-    def loadStrings(self,vao,buff,strs,sx=1,sy=1):
+    def loadStrings(self,vao,buff,strs,sx=1,sy=1,capacity=0):
         """Create renderable versions of a collection of strings. Each character will be billboarded to a quad (two
            triangles) with its texture coordinates pinning the correct glyph to be rendered.
 
@@ -284,10 +284,11 @@ class TxtRenderer(object):
             strs: An iterable container of `StringEntry` objects which contain a string and rendering information.
             sx: An x-scaling factor to apply; defaults to 1.
             sy: A y-scaling factor to apply; defaults to 1.
+            capacity: The number of bytes currently allocated to `buff`; defaults to 0, for a new buffer.
 
         Returns:
-            int: The total number of vertices created and uploaded to the VBO. This value should be suitable for rendering
-            with the `GL_TRIANGLES` mode.
+            tuple: The total number of vertices created and uploaded to the VBO, which should be suitable for rendering
+            with the `GL_TRIANGLES` mode, and the number of bytes allocated to `buff` afterwards, respectively.
         """
 
         glBindVertexArray(vao)
@@ -366,13 +367,21 @@ class TxtRenderer(object):
                 verts[cp]=(p1,p2,p3,p1,p4,p3)
                 cp+=1
 
-        # Copy all the vertex information into the VBO in GPU memory.
-        glBufferData(GL_ARRAY_BUFFER,verts.nbytes,verts.ravel(),GL_STATIC_DRAW)
+        # Copy all the vertex information into the VBO in GPU memory. Glyphs with no area are skipped above, so only
+        # the filled portion of `verts` is uploaded. If the buffer already has room (i.e. strings are being reloaded),
+        # overwrite it in place rather than reallocating its storage. The caller tracks the allocated size, so the buffer
+        # is never queried for it.
+        verts = verts[:cp]
+        if 0 < verts.nbytes <= capacity:
+            glBufferSubData(GL_ARRAY_BUFFER,0,verts.nbytes,verts.ravel())
+        else:
+            glBufferData(GL_ARRAY_BUFFER,verts.nbytes,verts.ravel(),GL_STATIC_DRAW)
+            capacity = verts.nbytes
 
         glBindBuffer(GL_ARRAY_BUFFER,0)
         glBindVertexArray(0)
 
-        return cp*6
+        return cp*6, capacity
 
     def renderSize(self,testStr,sx=1,sy=1):
         """Estimate the dimension of the bounding box of a string, in pixels.